@@ -14,3 +14,11 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api.settings')
 
 application = get_asgi_application()
+
+
+# Resume processing webhook jobs and emails queued before the server (re)started
+from api.calls.services.webhook_queue import start_webhook_worker  # noqa: E402
+from api.email_service import start_outbox_worker  # noqa: E402
+
+start_webhook_worker()
+start_outbox_worker()
@@ -1 +1,56 @@
-# Register your models here.
+from django.contrib import admin
+
+from api.calls.models import (
+    CallEvent, CallIngest, CallRecord, CallSearchDocument, CallsReplicaLease, DigestEntry, EmailOutboxMessage,
+    WebhookJob
+)
+
+
+@admin.register(WebhookJob)
+class WebhookJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'status', 'attempts', 'available_at', 'created_at')
+    list_filter = ('status',)
+    readonly_fields = ('created_at', 'updated_at')
+
+
+@admin.register(CallIngest)
+class CallIngestAdmin(admin.ModelAdmin):
+    list_display = ('conversation_id', 'stored_at', 'published_at', 'notified_at', 'completed_at')
+    search_fields = ('conversation_id',)
+
+
+@admin.register(EmailOutboxMessage)
+class EmailOutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ('id', 'to', 'subject', 'status', 'attempts', 'available_at', 'created_at')
+    list_filter = ('status',)
+    readonly_fields = ('created_at', 'updated_at')
+
+
+@admin.register(DigestEntry)
+class DigestEntryAdmin(admin.ModelAdmin):
+    list_display = ('id', 'recipient', 'call_id', 'claimed_at', 'created_at')
+    list_filter = ('recipient',)
+
+
+@admin.register(CallRecord)
+class CallRecordAdmin(admin.ModelAdmin):
+    list_display = ('id', 'caller_name', 'phone_number', 'did_respond', 'created_at')
+    list_filter = ('did_respond',)
+    search_fields = ('id', 'caller_name', 'phone_number')
+
+
+@admin.register(CallEvent)
+class CallEventAdmin(admin.ModelAdmin):
+    list_display = ('id', 'type', 'call_id', 'created_at')
+    list_filter = ('type',)
+
+
+@admin.register(CallSearchDocument)
+class CallSearchDocumentAdmin(admin.ModelAdmin):
+    list_display = ('call_id', 'caller_name', 'phone_number', 'created_at')
+    search_fields = ('call_id', 'caller_name', 'phone_number')
+
+
+@admin.register(CallsReplicaLease)
+class CallsReplicaLeaseAdmin(admin.ModelAdmin):
+    list_display = ('name', 'owner', 'lease_until', 'synced', 'updated_at')
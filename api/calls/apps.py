@@ -1,12 +1,27 @@
+import os
+import sys
+
 from django.apps import AppConfig
 
 
+def is_serving():
+    """
+    False under manage.py commands other than runserver, which don't serve
+    reads, and in runserver's autoreloader parent (only its child serves)
+    """
+    if os.path.basename(sys.argv[0]) != 'manage.py':
+        return True
+    if sys.argv[1:2] != ['runserver']:
+        return False
+    return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in sys.argv
+
+
 class CallsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api.calls'
 
     def ready(self):
-        """Initialize Firebase and Email service when Django app is ready."""
+        """Initialize Firebase, the calls replica and Email service when Django app is ready."""
         try:
             from api.database import initialize_firebase
             initialize_firebase()
@@ -16,6 +31,16 @@ class CallsConfig(AppConfig):
             logger = logging.getLogger(__name__)
             logger.warning(f"Failed to initialize Firebase: {e}")
 
+        if is_serving():
+            try:
+                from api.calls.repositories.replica import start_calls_replica
+                start_calls_replica()
+            except Exception as e:
+                # Reads fall back to Firestore until the replica is in sync
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.warning(f"Failed to start calls replica: {e}")
+
         try:
             from api.email_service import initialize_email
             initialize_email()
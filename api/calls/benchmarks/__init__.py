@@ -0,0 +1,4 @@
+"""
+Local stand-ins and helpers for the performance benchmarks in
+api/calls/management/commands/bench_*.py.
+"""
@@ -0,0 +1,102 @@
+"""
+Local stand-in for the ElevenLabs conversation audio endpoint, served over
+plain HTTP/1.1 with keep-alive so the real httpx client pool is exercised.
+"""
+
+import asyncio
+import re
+
+AUDIO_PATH_PATTERN = re.compile(r'^/v1/convai/conversations/([^/]+)/audio$')
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+CHUNK_SIZE = 64 * 1024
+
+
+class FakeElevenLabsServer:
+    """
+    Serves `audio_size` bytes of fake MP3 for any conversation ID. Each
+    response waits `latency` seconds before the first byte, like the time
+    ElevenLabs takes to start streaming a recording.
+    """
+
+    def __init__(self, audio_size=512 * 1024, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+        self._audio = (bytes(range(256)) * (audio_size // 256 + 1))[:audio_size]
+        self._server = None
+        self._writers = set()
+
+    async def start(self):
+        """Listen on a free local port. Returns the base URL."""
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def close(self):
+        """Stop listening and close open (keep-alive) connections"""
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+        while self._writers:
+            await asyncio.sleep(0)
+
+    async def _handle(self, reader, writer):
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                self.requests += 1
+                await self._respond(writer, method, path, headers.get('range'))
+                if headers.get('connection', '').lower() == 'close':
+                    return
+        except (ConnectionError, ValueError):
+            return
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _respond(self, writer, method, path, range_header):
+        if not AUDIO_PATH_PATTERN.match(path.split('?')[0]):
+            writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            return
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        size = len(self._audio)
+        start, end = 0, size - 1
+        status = "200 OK"
+        extra_headers = ""
+        match = RANGE_PATTERN.match(range_header or "")
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+            else:
+                start = max(0, size - int(match.group(2)))
+            status = "206 Partial Content"
+            extra_headers = f"Content-Range: bytes {start}-{end}/{size}\r\n"
+
+        body = self._audio[start:end + 1]
+        writer.write((
+            f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: audio/mpeg\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"{extra_headers}\r\n"
+        ).encode('latin-1'))
+        if method != 'HEAD':
+            for offset in range(0, len(body), CHUNK_SIZE):
+                writer.write(body[offset:offset + CHUNK_SIZE])
+                await writer.drain()
+        await writer.drain()
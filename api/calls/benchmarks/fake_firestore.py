@@ -0,0 +1,260 @@
+"""
+In-memory stand-in for the Firestore AsyncClient, with a simulated round trip
+per RPC so benchmarks reflect network-bound behaviour.
+"""
+
+import asyncio
+import bisect
+import copy
+import uuid
+from operator import itemgetter
+
+from google.api_core.exceptions import AlreadyExists, NotFound
+
+
+class FakeDocumentSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+
+    @property
+    def exists(self):
+        return self._data is not None
+
+    def to_dict(self):
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+
+class FakeDocumentReference:
+    def __init__(self, collection, doc_id):
+        self._collection = collection
+        self.id = doc_id
+
+    @property
+    def _store(self):
+        return self._collection._documents
+
+    def collection(self, name):
+        return self._collection._client.collection(f"{self._collection.id}/{self.id}/{name}")
+
+    def _create(self, data):
+        if self.id in self._store:
+            raise AlreadyExists(f"Document already exists: {self.id}")
+        self._set(data)
+
+    def _update(self, data):
+        if self.id not in self._store:
+            raise NotFound(f"No document to update: {self.id}")
+        self._store[self.id].update(copy.deepcopy(data))
+        self._collection._client.changed(self._collection.id)
+
+    def _set(self, data):
+        self._store[self.id] = copy.deepcopy(data)
+        self._collection._client.changed(self._collection.id)
+
+    async def get(self, field_paths=None):
+        await self._collection._client.round_trip()
+        data = copy.deepcopy(self._store.get(self.id))
+        if data is not None and field_paths is not None:
+            data = {key: value for key, value in data.items() if key in field_paths}
+        return FakeDocumentSnapshot(self, data)
+
+    async def create(self, data):
+        await self._collection._client.round_trip()
+        self._create(data)
+
+    async def set(self, data):
+        await self._collection._client.round_trip()
+        self._set(data)
+
+    async def update(self, data):
+        await self._collection._client.round_trip()
+        self._update(data)
+
+
+class FakeQuery:
+    """Supports the where / order_by / start_after / limit / select chains the repositories use"""
+
+    def __init__(self, collection, orders=(), cursor=None, limit_to=None, field_paths=None, filters=()):
+        self._collection = collection
+        self._orders = tuple(orders)
+        self._cursor = cursor
+        self._limit = limit_to
+        self._field_paths = field_paths
+        self._filters = tuple(filters)
+
+    def _copy(self, **changes):
+        state = {
+            'orders': self._orders,
+            'cursor': self._cursor,
+            'limit_to': self._limit,
+            'field_paths': self._field_paths,
+            'filters': self._filters,
+        }
+        state.update(changes)
+        return FakeQuery(self._collection, **state)
+
+    def where(self, filter):
+        """Equality FieldFilters only"""
+        if filter.op_string != '==':
+            raise NotImplementedError(f"Unsupported filter operator: {filter.op_string}")
+        return self._copy(filters=self._filters + ((filter.field_path, filter.value),))
+
+    def order_by(self, field_path, direction='ASCENDING'):
+        return self._copy(orders=self._orders + ((field_path, direction),))
+
+    def start_after(self, values):
+        return self._copy(cursor=values)
+
+    def limit(self, count):
+        return self._copy(limit_to=count)
+
+    def select(self, field_paths):
+        return self._copy(field_paths=list(field_paths))
+
+    def _sort_key(self, doc_id, data):
+        return tuple(doc_id if field == '__name__' else data.get(field) for field, _ in self._orders)
+
+    def _index(self):
+        """
+        (sort key, doc_id) pairs in ascending order, kept until the collection
+        changes, so queries cost O(log n + limit) like a real index
+        """
+        return self._collection._client.index(
+            self._collection.id,
+            self._orders,
+            lambda: sorted(
+                ((self._sort_key(doc_id, data), doc_id) for doc_id, data in self._collection._documents.items()),
+                key=itemgetter(0)
+            )
+        )
+
+    async def stream(self):
+        await self._collection._client.round_trip()
+
+        # Queries order on every field in the same direction, like the services
+        descending = bool(self._orders) and self._orders[0][1] == 'DESCENDING'
+        index = self._index()
+        after = None if self._cursor is None else tuple(self._cursor[field] for field, _ in self._orders)
+
+        if descending:
+            end = len(index) if after is None else bisect.bisect_left(index, after, key=itemgetter(0))
+            candidates = (index[position] for position in range(end - 1, -1, -1))
+        else:
+            start = 0 if after is None else bisect.bisect_right(index, after, key=itemgetter(0))
+            candidates = (index[position] for position in range(start, len(index)))
+
+        documents = self._collection._documents
+        selected = []
+        for _, doc_id in candidates:
+            if self._limit is not None and len(selected) >= self._limit:
+                break
+            if all(documents[doc_id].get(field) == value for field, value in self._filters):
+                selected.append(doc_id)
+
+        for doc_id in selected:
+            data = copy.deepcopy(documents[doc_id])
+            if self._field_paths is not None:
+                data = {key: value for key, value in data.items() if key in self._field_paths}
+            yield FakeDocumentSnapshot(self._collection.document(doc_id), data)
+
+
+class FakeCollectionReference(FakeQuery):
+    def __init__(self, client, name):
+        super().__init__(self)
+        self._client = client
+        self.id = name
+        self._documents = client._data.setdefault(name, {})
+
+    def document(self, doc_id=None):
+        return FakeDocumentReference(self, doc_id or uuid.uuid4().hex)
+
+    async def add(self, data):
+        doc_ref = self.document()
+        await doc_ref.create(data)
+        return None, doc_ref
+
+
+class FakeWriteBatch:
+    """All-or-nothing batch of writes, committed in one round trip"""
+
+    def __init__(self, client):
+        self._client = client
+        self._writes = []
+
+    def create(self, reference, data):
+        self._writes.append(('create', reference, data))
+
+    def update(self, reference, data):
+        self._writes.append(('update', reference, data))
+
+    def set(self, reference, data):
+        self._writes.append(('set', reference, data))
+
+    async def commit(self):
+        await self._client.round_trip()
+        self._client.commits += 1
+
+        # Validate every precondition before applying anything
+        for operation, reference, _ in self._writes:
+            if operation == 'create' and reference.id in reference._store:
+                raise AlreadyExists(f"Document already exists: {reference.id}")
+            if operation == 'update' and reference.id not in reference._store:
+                raise NotFound(f"No document to update: {reference.id}")
+
+        for operation, reference, data in self._writes:
+            getattr(reference, f"_{operation}")(data)
+
+
+class FakeAsyncClient:
+    """
+    In-memory AsyncClient. Every RPC costs `latency` seconds, and at most
+    `max_in_flight` RPCs run at once, like streams on a shared gRPC channel.
+    """
+
+    def __init__(self, latency=0.0, max_in_flight=None):
+        self.latency = latency
+        self.rpcs = 0
+        self.commits = 0
+        self._data = {}
+        self._versions = {}
+        self._indexes = {}
+        self._in_flight = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+
+    async def round_trip(self):
+        self.rpcs += 1
+        if not self.latency:
+            return
+        if self._in_flight is None:
+            await asyncio.sleep(self.latency)
+            return
+        async with self._in_flight:
+            await asyncio.sleep(self.latency)
+
+    def collection(self, name):
+        return FakeCollectionReference(self, name)
+
+    def changed(self, collection_name):
+        """Invalidate the query indexes of a collection after a write"""
+        self._versions[collection_name] = self._versions.get(collection_name, 0) + 1
+
+    def index(self, collection_name, orders, build):
+        """Get the cached index for a collection and ordering, rebuilding it if stale"""
+        version = self._versions.get(collection_name, 0)
+        cached = self._indexes.get((collection_name, orders))
+        if cached is None or cached[0] != version:
+            cached = (version, build())
+            self._indexes[(collection_name, orders)] = cached
+        return cached[1]
+
+    def batch(self):
+        return FakeWriteBatch(self)
+
+    async def get_all(self, references, field_paths=None):
+        await self.round_trip()
+        for reference in references:
+            data = copy.deepcopy(reference._store.get(reference.id))
+            if data is not None and field_paths is not None:
+                data = {key: value for key, value in data.items() if key in field_paths}
+            yield FakeDocumentSnapshot(reference, data)
@@ -0,0 +1,45 @@
+"""
+Synthetic request payloads for the benchmarks.
+"""
+
+import json
+
+
+def synthetic_payload(turns, conversation_id='conv_0123456789', phone_number='+16195551234'):
+    """ElevenLabs post-call webhook body with `turns` transcript turns"""
+    transcript = [
+        {
+            'role': 'agent' if i % 2 == 0 else 'user',
+            'message': f"Turn {i}: I'd like to book a hydrafacial sometime next Tuesday afternoon if possible.",
+            'tool_calls': [],
+            'tool_results': [],
+            'feedback': None,
+            'llm_override': None,
+            'time_in_call_secs': i * 4,
+            'conversation_turn_metrics': {'metrics': {'convai_llm_service_ttfb': {'elapsed_time': 0.42}}},
+            'rag_retrieval_info': None,
+        }
+        for i in range(turns)
+    ]
+    return json.dumps({
+        'type': 'post_call_transcription',
+        'event_timestamp': 1750000095,
+        'data': {
+            'agent_id': 'agent_01',
+            'conversation_id': conversation_id,
+            'status': 'done',
+            'transcript': transcript,
+            'metadata': {
+                'start_time_unix_secs': 1750000000,
+                'call_duration_secs': turns * 4,
+                'cost': 412,
+                'termination_reason': 'Client disconnected',
+                'phone_call': {'external_number': phone_number, 'agent_number': '+16195550000'},
+            },
+            'analysis': {
+                'call_successful': 'success',
+                'transcript_summary': 'Caller wants to book a hydrafacial next Tuesday afternoon.',
+                'data_collection_results': {'name': {'value': 'Ann', 'rationale': 'Caller said her name'}},
+            },
+        },
+    }).encode('utf-8')
@@ -0,0 +1,62 @@
+"""
+Local SMTP server that accepts and discards every message, so the real
+smtplib connection pool in api/email_service.py can be exercised without
+sending mail.
+"""
+
+import asyncio
+
+
+class SMTPSink:
+    """Plain (no TLS, no auth) SMTP server counting the messages it receives"""
+
+    def __init__(self):
+        self.messages = 0
+        self.connections = 0
+        self._server = None
+        self._writers = set()
+
+    async def start(self):
+        """Listen on a free local port. Returns the port."""
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Stop listening and close open (keep-alive) connections"""
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+        while self._writers:
+            await asyncio.sleep(0)
+
+    async def _handle(self, reader, writer):
+        self._writers.add(writer)
+        self.connections += 1
+        writer.write(b"220 localhost SMTP sink\r\n")
+        try:
+            while line := await reader.readline():
+                command = line[:4].upper()
+                if command in (b"EHLO", b"HELO"):
+                    writer.write(b"250 localhost\r\n")
+                elif command == b"DATA":
+                    writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                    await writer.drain()
+                    while (await reader.readline()) not in (b".\r\n", b""):
+                        pass
+                    self.messages += 1
+                    writer.write(b"250 OK\r\n")
+                elif command == b"QUIT":
+                    writer.write(b"221 Bye\r\n")
+                    await writer.drain()
+                    return
+                elif command in (b"MAIL", b"RCPT", b"RSET", b"NOOP"):
+                    writer.write(b"250 OK\r\n")
+                else:
+                    writer.write(b"502 Command not implemented\r\n")
+                await writer.drain()
+        except ConnectionError:
+            return
+        finally:
+            self._writers.discard(writer)
+            writer.close()
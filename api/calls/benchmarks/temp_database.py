@@ -0,0 +1,21 @@
+import os
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+
+@contextmanager
+def temporary_database(directory, name):
+    """
+    Run with the default database swapped for a freshly migrated SQLite file
+    `name` in `directory`, destroyed on exit, as the test runner does.
+    """
+    setup_test_environment()
+    connection.settings_dict['TEST']['NAME'] = os.path.join(directory, name)
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import logging
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+
+from api import database
+from api.calls.benchmarks.fake_firestore import FakeAsyncClient
+from api.calls.benchmarks.payloads import synthetic_payload
+from api.calls.benchmarks.temp_database import temporary_database
+from api.calls.repositories import CALL_REPOSITORIES
+from api.calls.schemas import ElevenLabsWebhookPayload
+from api.calls.services.calls_service import DEFAULT_LIST_FIELDS
+from api.calls.services.elevenlabs_webhook_service import build_call_data
+
+PAGE_SIZE = 50
+
+
+def timed(latencies):
+    """Summarize per-operation latencies in milliseconds"""
+    latencies = sorted(latencies)
+    return {
+        'ops': len(latencies),
+        'p50_ms': round(latencies[len(latencies) // 2] * 1000, 3),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95)] * 1000, 3),
+        'ops_per_sec': round(len(latencies) / sum(latencies), 1),
+    }
+
+
+async def measure(operation, count):
+    latencies = []
+    for i in range(count):
+        start = time.perf_counter()
+        await operation(i)
+        latencies.append(time.perf_counter() - start)
+    return timed(latencies)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the call repositories (CALLS_REPOSITORY) side by side: add, get, "
+        "list pages (plain, deep and filtered) and bulk updates over the same calls. "
+        "Firestore is the in-memory stand-in with a simulated round trip; SQLite "
+        "uses a temporary database. Prints JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calls', type=int, default=10000, help="Calls stored in each repository")
+        parser.add_argument('--ops', type=int, default=200, help="Reads and updates measured per operation")
+        parser.add_argument('--turns', type=int, default=20, help="Transcript turns per call")
+        parser.add_argument('--firestore-latency-ms', type=float, default=5,
+                            help="Simulated round trip of the in-memory Firestore")
+        parser.add_argument('--repositories', nargs='+', choices=list(CALL_REPOSITORIES),
+                            default=list(CALL_REPOSITORIES))
+
+    def handle(self, *args, **options):
+        # Keep per-call logging out of the measurements
+        logging.disable(logging.INFO)
+
+        with tempfile.TemporaryDirectory() as temp_dir, temporary_database(temp_dir, 'bench_repository.sqlite3'):
+            results = asyncio.run(self.run_benchmark(options))
+        self.stdout.write(json.dumps(results, indent=2))
+
+    async def run_benchmark(self, options):
+        payload = ElevenLabsWebhookPayload.model_validate_json(synthetic_payload(options['turns']))
+        template = build_call_data(payload)
+        first_created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        call_ids = [f"call_{i:07d}" for i in range(options['calls'])]
+
+        def call(i):
+            return template.model_copy(update={
+                'created_at': first_created_at + timedelta(seconds=i),
+                'phone_number': f"+1555{i:07d}",
+                'did_respond': i % 10 == 0,
+            })
+
+        loop = asyncio.get_running_loop()
+        results = {}
+        for name in options['repositories']:
+            database.async_clients[loop] = FakeAsyncClient(latency=options['firestore_latency_ms'] / 1000)
+            database.calls_write_coalescers.pop(loop, None)
+            repository = CALL_REPOSITORIES[name]()
+
+            # Concurrent adds, as webhooks arrive
+            start = time.perf_counter()
+            for offset in range(0, len(call_ids), 500):
+                await asyncio.gather(*(
+                    repository.add(call_ids[i], call(i))
+                    for i in range(offset, min(offset + 500, len(call_ids)))
+                ))
+            add_seconds = time.perf_counter() - start
+
+            ops = options['ops']
+            step = max(1, len(call_ids) // ops)
+            middle = len(call_ids) // 2
+            deep_after = (first_created_at + timedelta(seconds=middle), call_ids[middle])
+
+            results[name] = {
+                'add': {
+                    'calls': len(call_ids),
+                    'seconds': round(add_seconds, 3),
+                    'calls_per_sec': round(len(call_ids) / add_seconds, 1),
+                },
+                'get': await measure(lambda i: repository.get(call_ids[(i * step) % len(call_ids)]), ops),
+                'list_first_page': await measure(
+                    lambda i: repository.list(PAGE_SIZE, fields=DEFAULT_LIST_FIELDS), ops),
+                'list_deep_page': await measure(
+                    lambda i: repository.list(PAGE_SIZE, deep_after, fields=DEFAULT_LIST_FIELDS), ops),
+                'list_filtered_page': await measure(
+                    lambda i: repository.list(PAGE_SIZE, fields=DEFAULT_LIST_FIELDS, filters={'did_respond': True}),
+                    ops),
+                'update': await measure(
+                    lambda i: repository.update(call_ids[(i * step) % len(call_ids)], {'did_respond': True}), ops),
+                'bulk_update_50': await measure(
+                    lambda i: repository.bulk_update(call_ids[i * 50 % len(call_ids):][:50], {'did_respond': False}),
+                    max(1, ops // 10)),
+            }
+
+        return {'options': {key: options[key] for key in ('calls', 'ops', 'turns', 'firestore_latency_ms')},
+                'repositories': results}
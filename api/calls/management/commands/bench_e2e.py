@@ -0,0 +1,311 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings as django_settings
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient
+from google.cloud import firestore
+
+from api import database, settings
+from api.calls.benchmarks.fake_elevenlabs import FakeElevenLabsServer
+from api.calls.benchmarks.fake_firestore import FakeAsyncClient
+from api.calls.benchmarks.payloads import synthetic_payload
+from api.calls.benchmarks.smtp_sink import SMTPSink
+from api.calls.benchmarks.temp_database import temporary_database
+from api.calls.models import WebhookJob
+from api.calls.schemas import ElevenLabsWebhookPayload
+from api.calls.services.calls_service import invalidate_calls_cache
+from api.calls.services.elevenlabs_webhook_service import build_call_data
+from api.calls.services.transcripts import build_call_document
+from api.calls.services.webhook_queue import run_worker
+
+# Firestore allows at most 500 writes per batch
+SEED_BATCH_SIZE = 500
+SEED_TRANSCRIPT_TURNS = 6
+
+# Metrics compared against --baseline, as new / baseline
+COMPARED_METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'throughput_per_sec')
+
+BROWSER_ACCEPT_ENCODING = 'gzip, deflate, br, zstd'
+
+
+def configure(**values):
+    """Override settings for both `from api import settings` and django.conf.settings readers"""
+    for name, value in values.items():
+        setattr(settings, name, value)
+        setattr(django_settings, name, value)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, errors, elapsed):
+    latencies = sorted(latencies)
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2),
+        'throughput_per_sec': round(len(latencies) / elapsed, 1),
+    }
+
+
+async def read_body(response):
+    """Consume a test client response body, streaming or not"""
+    if not response.streaming:
+        return response.content
+    if response.is_async:
+        return b"".join([chunk async for chunk in response.streaming_content])
+    return b"".join(response.streaming_content)
+
+
+async def run_requests(send, count, concurrency, before=None):
+    """
+    Send `count` requests with at most `concurrency` in flight and summarize
+    their latencies. `before(i)` runs ahead of request i, outside its timing.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def one(i):
+        nonlocal errors
+        async with semaphore:
+            if before is not None:
+                await before(i)
+            start = time.perf_counter()
+            response = await send(i)
+            await read_body(response)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(count)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True, cwd=settings.BASE_DIR
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_with_baseline(results, baseline):
+    """Add new / baseline ratios of COMPARED_METRICS to every scenario the baseline also ran"""
+    for name, scenario in results['scenarios'].items():
+        base = baseline.get('scenarios', {}).get(name)
+        if not base:
+            continue
+        scenario['vs_baseline'] = {
+            metric: round(scenario[metric] / base[metric], 3)
+            for metric in COMPARED_METRICS
+            if scenario.get(metric) and base.get(metric)
+        }
+
+
+class Command(BaseCommand):
+    help = (
+        "End-to-end latency and throughput of the calls API, run in process against "
+        "local stand-ins: Firestore (the emulator when FIRESTORE_EMULATOR_HOST is set, "
+        "otherwise in memory), the ElevenLabs audio endpoint and an SMTP sink. "
+        "Uses a temporary SQLite database. Prints JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help="Requests per scenario")
+        parser.add_argument('--concurrency', type=int, default=20, help="Requests in flight")
+        parser.add_argument('--list-sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                            help="Calls in the collection for the list scenarios")
+        parser.add_argument('--webhook-turns', type=int, default=40, help="Transcript turns per webhook")
+        parser.add_argument('--firestore-latency-ms', type=float, default=5,
+                            help="Simulated round trip of the in-memory Firestore")
+        parser.add_argument('--firestore-max-in-flight', type=int, default=100,
+                            help="Concurrent RPCs the in-memory Firestore allows")
+        parser.add_argument('--elevenlabs-latency-ms', type=float, default=20,
+                            help="Time to first byte of the fake ElevenLabs audio endpoint")
+        parser.add_argument('--audio-kb', type=int, default=256, help="Size of each fake recording")
+        parser.add_argument('--output', help="Also write the results to this file")
+        parser.add_argument('--baseline', help="Results file of an earlier run to compare with")
+
+    def handle(self, *args, **options):
+        if options['verbosity'] < 2:
+            # Per-request INFO logging would dominate the measurements
+            logging.disable(logging.INFO)
+
+        self.run_id = uuid.uuid4().hex[:8]
+        with tempfile.TemporaryDirectory() as temp_dir, temporary_database(temp_dir, 'bench_e2e.sqlite3'):
+            scenarios = asyncio.run(self.run_scenarios(options, temp_dir))
+
+        results = {
+            'commit': git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'firestore': 'emulator' if os.getenv('FIRESTORE_EMULATOR_HOST') else 'in-memory',
+            'options': {
+                key: options[key] for key in (
+                    'requests', 'concurrency', 'list_sizes', 'webhook_turns', 'firestore_latency_ms',
+                    'firestore_max_in_flight', 'elevenlabs_latency_ms', 'audio_kb'
+                )
+            },
+            'scenarios': scenarios,
+        }
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                compare_with_baseline(results, json.load(f))
+
+        output = json.dumps(results, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + "\n")
+        self.stdout.write(output)
+
+    def use_firestore(self, options, name):
+        """Point the services at a fresh, empty Firestore for the running loop"""
+        if os.getenv('FIRESTORE_EMULATOR_HOST'):
+            client = firestore.AsyncClient(project=f"bench-e2e-{self.run_id}-{name}")
+        else:
+            client = FakeAsyncClient(
+                latency=options['firestore_latency_ms'] / 1000,
+                max_in_flight=options['firestore_max_in_flight']
+            )
+
+        loop = asyncio.get_running_loop()
+        database.async_clients[loop] = client
+        database.calls_write_coalescers.pop(loop, None)
+        return client
+
+    async def seed_calls(self, client, count):
+        """Write `count` calls with one-second spaced created_at. Returns their IDs."""
+        payload = ElevenLabsWebhookPayload.model_validate_json(synthetic_payload(SEED_TRANSCRIPT_TURNS))
+        document, _ = build_call_document(build_call_data(payload))
+        first_created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        collection = client.collection('calls')
+        doc_ids = [f"seed_{i:06d}" for i in range(count)]
+        for start in range(0, count, SEED_BATCH_SIZE):
+            batch = client.batch()
+            for i in range(start, min(start + SEED_BATCH_SIZE, count)):
+                batch.set(collection.document(doc_ids[i]), {
+                    **document,
+                    'created_at': first_created_at + timedelta(seconds=i),
+                    'phone_number': f"+1555{i:07d}",
+                })
+            await batch.commit()
+
+        await invalidate_calls_cache()
+        return doc_ids
+
+    async def run_scenarios(self, options, temp_dir):
+        smtp_sink = SMTPSink()
+        smtp_port = await smtp_sink.start()
+        elevenlabs = FakeElevenLabsServer(
+            audio_size=options['audio_kb'] * 1024,
+            latency=options['elevenlabs_latency_ms'] / 1000
+        )
+        elevenlabs_url = await elevenlabs.start()
+
+        configure(
+            EMAIL_HOST='127.0.0.1',
+            EMAIL_PORT=smtp_port,
+            EMAIL_USE_TLS=False,
+            GOOGLE_APP_PASSWORD=None,
+            EMAIL_SUMMARY_RECIPIENTS=['bench@example.com'],
+            EMAIL_DIGEST_ENABLED=False,
+            ELEVENLABS_BASE_URL=elevenlabs_url,
+            RECORDING_CACHE_DIR=os.path.join(temp_dir, 'recordings'),
+            RECORDING_PREFETCH_ENABLED=False,
+            WEBHOOK_QUEUE_INLINE_WORKER=False,
+            DEBUG_NUMBERS=[],
+        )
+
+        client = AsyncClient(headers={'Accept-Encoding': BROWSER_ACCEPT_ENCODING})
+        count = options['requests']
+        concurrency = options['concurrency']
+        scenarios = {}
+
+        try:
+            # Webhook: the view validates, deduplicates and queues; the worker
+            # then stores every call in Firestore and emails it
+            self.use_firestore(options, 'webhook')
+            payloads = [
+                synthetic_payload(options['webhook_turns'], conversation_id=f"bench_{self.run_id}_{i}")
+                for i in range(count)
+            ]
+            scenarios['webhook'] = await run_requests(
+                lambda i: client.post('/calls/elevenlabs-webhook/', payloads[i], content_type='application/json'),
+                count, concurrency
+            )
+
+            start = time.perf_counter()
+            await run_worker(drain=True)
+            elapsed = time.perf_counter() - start
+            jobs_done = await WebhookJob.objects.filter(status=WebhookJob.Status.DONE).acount()
+            scenarios['webhook_ingest'] = {
+                'jobs': jobs_done,
+                'errors': count - jobs_done,
+                'emails_sent': smtp_sink.messages,
+                'seconds': round(elapsed, 3),
+                'throughput_per_sec': round(jobs_done / elapsed, 1),
+            }
+
+            # Calls list, first page; uncached requests invalidate the page cache first
+            doc_ids = []
+            for size in options['list_sizes']:
+                firestore_client = self.use_firestore(options, f"list-{size}")
+                doc_ids = await self.seed_calls(firestore_client, size)
+
+                scenarios[f"calls_list_{size}_uncached"] = await run_requests(
+                    lambda i: client.get('/calls/list/'), count, concurrency,
+                    before=lambda i: invalidate_calls_cache()
+                )
+                scenarios[f"calls_list_{size}_cached"] = await run_requests(
+                    lambda i: client.get('/calls/list/'), count, concurrency
+                )
+
+            # Edits on the last seeded collection
+            if doc_ids:
+                scenarios['call_edit'] = await run_requests(
+                    lambda i: client.post(
+                        f"/calls/edit/{doc_ids[i % len(doc_ids)]}/",
+                        {'did_respond': i % 2 == 0},
+                        content_type='application/json'
+                    ),
+                    count, concurrency
+                )
+
+            # Audio: every upstream request is a new recording, proxied from
+            # the fake ElevenLabs and saved to the recording cache; cached
+            # requests replay one of them from disk
+            audio_id = f"bench_{self.run_id}_audio"
+            scenarios['audio_upstream'] = await run_requests(
+                lambda i: client.get(f"/calls/elevenlabs_stream/{audio_id}_{i}/"), count, concurrency
+            )
+            scenarios['audio_cached'] = await run_requests(
+                lambda i: client.get(f"/calls/elevenlabs_stream/{audio_id}_0/"), count, concurrency
+            )
+            scenarios['audio_upstream']['upstream_requests'] = elevenlabs.requests
+
+        finally:
+            await elevenlabs.close()
+            await smtp_sink.close()
+
+        return scenarios
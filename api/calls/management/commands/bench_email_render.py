@@ -0,0 +1,99 @@
+import gc
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+
+from api import settings
+from api.calls.schemas import CallData, TranscriptTurn
+from api.calls.services.call_notifications import format_call_email, format_digest_email
+
+# Time zones rotated across emails, as with recipients in several zones
+TIMEZONES = ['America/New_York', 'America/Chicago', 'America/Los_Angeles', 'Europe/London']
+
+
+def synthetic_call(index, turns):
+    """A call with `turns` transcript turns and some text that needs HTML escaping"""
+    started_at = datetime(2026, 3, 1, 14, 0, tzinfo=timezone.utc) + timedelta(days=index % 365, minutes=index)
+    return CallData(
+        summary=f"Caller #{index} wants to book a <hydrafacial> & a consultation next Tuesday afternoon.",
+        transcript=[
+            TranscriptTurn(
+                role='agent' if i % 2 == 0 else 'user',
+                message=f"Turn {i}: I'd like to book a hydrafacial sometime next Tuesday afternoon if possible.",
+                time_in_call_secs=i * 4
+            )
+            for i in range(turns)
+        ],
+        recording_url=f"/calls/elevenlabs_stream/conv_{index}/",
+        started_at=started_at,
+        ended_at=started_at + timedelta(seconds=turns * 4),
+        ended_reason='Client disconnected',
+        caller_name=f"Ann \"Annie\" O'Neil {index}",
+        success_evaluation='success',
+        cost=412,
+        phone_number='16195551234',
+        did_respond=False
+    )
+
+
+def timed(func, count):
+    # Like timeit, keep garbage collection pauses out of the measurement
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for index in range(count):
+            func(index)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+class Command(BaseCommand):
+    help = "Measure call notification email rendering throughput"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--emails', type=int, default=10000, help="Emails to render per transcript size")
+        parser.add_argument('--turns', type=int, nargs='+', default=[20, 200, 2000],
+                            help="Transcript sizes to test")
+        parser.add_argument('--digest-size', type=int, default=20, help="Calls per digest email")
+
+    def handle(self, *args, **options):
+        emails = options['emails']
+        digest_size = options['digest_size']
+
+        results = []
+        for turns in options['turns']:
+            # A small pool of distinct calls, so building them isn't measured
+            calls = [(synthetic_call(index, turns), f"call_{index}") for index in range(50)]
+
+            def render_call(index):
+                call_data, doc_id = calls[index % len(calls)]
+                format_call_email(call_data, doc_id, TIMEZONES[index % len(TIMEZONES)])
+
+            def render_digest(index):
+                digest = [calls[(index + offset) % len(calls)] for offset in range(digest_size)]
+                format_digest_email(digest, TIMEZONES[index % len(TIMEZONES)])
+
+            digests = max(1, emails // digest_size)
+            call_seconds = timed(render_call, emails)
+            digest_seconds = timed(render_digest, digests)
+            _, plain_body, html_body = format_call_email(*calls[0])
+
+            results.append({
+                'turns': turns,
+                'transcript_max_chars': settings.EMAIL_TRANSCRIPT_MAX_CHARS,
+                'html_bytes': len(html_body.encode('utf-8')),
+                'plain_bytes': len(plain_body.encode('utf-8')),
+                'call_emails': emails,
+                'call_emails_per_sec': round(emails / call_seconds),
+                'call_email_us': round(call_seconds / emails * 1e6, 1),
+                'digest_emails': digests,
+                'digest_calls': digest_size,
+                'digest_emails_per_sec': round(digests / digest_seconds),
+                'digest_email_us': round(digest_seconds / digests * 1e6, 1),
+            })
+
+        self.stdout.write(json.dumps(results, indent=2))
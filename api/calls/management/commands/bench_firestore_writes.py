@@ -0,0 +1,94 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from google.cloud import firestore
+
+from api.calls.benchmarks.fake_firestore import FakeAsyncClient
+from api.database import WriteCoalescer
+
+
+def sample_call(i):
+    return {
+        'phone_number': f"+1555{i:07d}",
+        'caller_name': f"Caller {i}",
+        'summary': "Caller asked about booking a facial next week.",
+        'transcript': "agent: Hi, thanks for calling!\nuser: I'd like to book a facial.\n" * 20,
+        'did_respond': False,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare call document write throughput of one-by-one add() against the "
+        "batched WriteCoalescer. Uses the Firestore emulator when "
+        "FIRESTORE_EMULATOR_HOST is set, otherwise an in-memory stand-in."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--docs', type=int, default=1000, help="Documents written per mode")
+        parser.add_argument('--concurrency', type=int, default=50, help="Concurrent writers")
+        parser.add_argument('--latency-ms', type=float, default=20,
+                            help="Simulated round trip of the in-memory stand-in")
+        parser.add_argument('--max-in-flight', type=int, default=10,
+                            help="Concurrent RPCs the in-memory stand-in allows")
+        parser.add_argument('--batch-size', type=int, default=100, help="Coalescer max batch size")
+        parser.add_argument('--window-ms', type=float, default=5, help="Coalescer window")
+
+    def handle(self, *args, **options):
+        results = asyncio.run(self.run_benchmark(options))
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def make_client(self, options):
+        if os.getenv('FIRESTORE_EMULATOR_HOST'):
+            return firestore.AsyncClient(project='bench-firestore-writes'), 'emulator'
+        return FakeAsyncClient(
+            latency=options['latency_ms'] / 1000,
+            max_in_flight=options['max_in_flight']
+        ), 'in-memory'
+
+    async def run_benchmark(self, options):
+        client, backend = self.make_client(options)
+        semaphore = asyncio.Semaphore(options['concurrency'])
+        run_id = uuid.uuid4().hex[:8]
+
+        async def write_all(write):
+            async def bounded(i):
+                async with semaphore:
+                    await write(i)
+
+            rpcs = getattr(client, 'rpcs', None)
+            start = time.perf_counter()
+            await asyncio.gather(*(bounded(i) for i in range(options['docs'])))
+            elapsed = time.perf_counter() - start
+
+            results = {
+                'seconds': round(elapsed, 3),
+                'docs_per_second': round(options['docs'] / elapsed, 1),
+            }
+            if rpcs is not None:
+                results['rpcs'] = client.rpcs - rpcs
+            return results
+
+        add_collection = client.collection(f"bench_add_{run_id}")
+        add_results = await write_all(lambda i: add_collection.add(sample_call(i)))
+
+        coalescer = WriteCoalescer(
+            client,
+            f"bench_batched_{run_id}",
+            max_batch_size=options['batch_size'],
+            window=options['window_ms'] / 1000
+        )
+        batched_results = await write_all(lambda i: coalescer.create(f"call-{i}", sample_call(i)))
+
+        return {
+            'backend': backend,
+            'docs': options['docs'],
+            'concurrency': options['concurrency'],
+            'add': add_results,
+            'batched': batched_results,
+            'speedup': round(batched_results['docs_per_second'] / add_results['docs_per_second'], 2),
+        }
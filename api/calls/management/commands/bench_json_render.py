@@ -0,0 +1,84 @@
+import io
+import json
+import time
+from datetime import timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.calls.schemas import CallData
+from api.parsers import ORJSONParser
+from api.renderers import ORJSONRenderer
+
+
+def synthetic_calls(count):
+    """Call dicts shaped like Firestore list results, with Firestore timestamps"""
+    base = DatetimeWithNanoseconds(2025, 1, 1, tzinfo=timezone.utc)
+    calls = []
+    for i in range(count):
+        started_at = base + timedelta(minutes=7 * i)
+        call = CallData(
+            summary="Caller asked about availability for a facial next week and wants a call back.",
+            recording_url=f"/calls/elevenlabs_stream/conv_{i:06d}/",
+            ended_reason="client disconnected",
+            caller_name=f"Caller {i}",
+            success_evaluation="success",
+            cost=0.05 * (i % 20),
+            phone_number=f"+1555{i:07d}",
+            did_respond=i % 3 == 0,
+        ).model_dump(exclude={'transcript'})
+        call.update(
+            id=f"conv_{i:06d}",
+            started_at=started_at,
+            ended_at=started_at + timedelta(seconds=95),
+            created_at=started_at + timedelta(seconds=96),
+        )
+        calls.append(call)
+    return calls
+
+
+def best_of(runs, func):
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+class Command(BaseCommand):
+    help = "Compare DRF's JSONRenderer/JSONParser with the orjson renderer/parser on a synthetic calls payload"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calls', type=int, default=10000, help="Calls in the payload")
+        parser.add_argument('--runs', type=int, default=5, help="Runs per measurement (best is reported)")
+
+    def handle(self, *args, **options):
+        data = {'results': synthetic_calls(options['calls']), 'next': None}
+        runs = options['runs']
+
+        stdlib_render, stdlib_body = best_of(runs, lambda: JSONRenderer().render(data))
+        orjson_render, orjson_body = best_of(runs, lambda: ORJSONRenderer().render(data))
+
+        stdlib_parse, stdlib_parsed = best_of(runs, lambda: JSONParser().parse(io.BytesIO(stdlib_body)))
+        orjson_parse, orjson_parsed = best_of(runs, lambda: ORJSONParser().parse(io.BytesIO(stdlib_body)))
+
+        results = {
+            'calls': options['calls'],
+            'body_bytes': len(orjson_body),
+            'identical_output': stdlib_parsed == json.loads(orjson_body) and orjson_parsed == stdlib_parsed,
+            'render_ms': {
+                'drf_json': round(stdlib_render * 1000, 1),
+                'orjson': round(orjson_render * 1000, 1),
+                'speedup': round(stdlib_render / orjson_render, 1),
+            },
+            'parse_ms': {
+                'drf_json': round(stdlib_parse * 1000, 1),
+                'orjson': round(orjson_parse * 1000, 1),
+                'speedup': round(stdlib_parse / orjson_parse, 1),
+            },
+        }
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,91 @@
+import gc
+import json
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+from pydantic import create_model
+
+from api.calls.benchmarks.payloads import synthetic_payload
+from api.calls.schemas import CallData, ElevenLabsWebhookPayload
+from api.calls.services.elevenlabs_webhook_service import build_call_data
+
+# CallData as it was when transcripts were flat strings, for the reference path
+LegacyCallData = create_model(
+    'LegacyCallData',
+    **{name: (field.annotation, field) for name, field in CallData.model_fields.items() if name != 'transcript'},
+    transcript=(str, "")
+)
+
+
+def legacy_parse(raw_body):
+    """The previous path: parse to dicts, walk them by hand, concatenate the transcript"""
+    report = json.loads(raw_body)
+
+    transcript_str = ""
+    for transcript_item in report["data"]["transcript"]:
+        transcript_str += f"{transcript_item['role']}: {transcript_item['message']}\n"
+
+    conversation_id = report["data"]["conversation_id"]
+    metadata = report["data"]["metadata"]
+    return LegacyCallData(
+        summary=report["data"]["analysis"]["transcript_summary"],
+        transcript=transcript_str,
+        recording_url=f"/calls/elevenlabs_stream/{conversation_id}/",
+        started_at=datetime.fromtimestamp(metadata["start_time_unix_secs"]),
+        ended_at=datetime.fromtimestamp(metadata["start_time_unix_secs"] + metadata["call_duration_secs"]),
+        ended_reason=metadata["termination_reason"],
+        caller_name=report["data"]["analysis"]["data_collection_results"]["name"]["value"],
+        success_evaluation=report["data"]["analysis"]["call_successful"],
+        cost=metadata["cost"],
+        phone_number=metadata["phone_call"]["external_number"],
+        did_respond=False
+    )
+
+
+def typed_parse(raw_body):
+    """The current path: validate the raw bytes, then map onto CallData"""
+    return build_call_data(ElevenLabsWebhookPayload.model_validate_json(raw_body))
+
+
+def per_call_us(func, raw_body, iterations):
+    # Like timeit, keep garbage collection pauses out of the measurement
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func(raw_body)
+        return (time.perf_counter() - start) / iterations * 1e6
+    finally:
+        gc.enable()
+
+
+class Command(BaseCommand):
+    help = "Compare webhook parsing via dicts with model_validate_json on raw bytes, for growing transcripts"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--turns', type=int, nargs='+', default=[10, 200, 1000, 5000],
+                            help="Transcript sizes to test")
+        parser.add_argument('--budget', type=float, default=1.0, help="Seconds to spend per path and size")
+
+    def handle(self, *args, **options):
+        results = []
+        for turns in options['turns']:
+            raw_body = synthetic_payload(turns)
+
+            # Size iterations so each measurement takes about `budget` seconds
+            iterations = max(1, int(options['budget'] * 1e6 / per_call_us(legacy_parse, raw_body, 3)))
+
+            legacy_us = per_call_us(legacy_parse, raw_body, iterations)
+            typed_us = per_call_us(typed_parse, raw_body, iterations)
+            results.append({
+                'turns': turns,
+                'payload_bytes': len(raw_body),
+                'iterations': iterations,
+                'dict_walk_us': round(legacy_us, 1),
+                'model_validate_json_us': round(typed_us, 1),
+                'speedup': round(legacy_us / typed_us, 2),
+            })
+
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,46 @@
+import asyncio
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api import settings
+from api.calls.services.webhook_queue import requeue_dead_jobs, run_worker
+
+# Cache backends whose entries only the process that wrote them can see
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+)
+
+
+class Command(BaseCommand):
+    help = "Process queued ElevenLabs webhook jobs (run as a separate worker process)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--drain',
+            action='store_true',
+            help="Process the jobs that are currently due, then exit"
+        )
+        parser.add_argument(
+            '--requeue-dead',
+            action='store_true',
+            help="Move dead-lettered jobs back to pending before processing"
+        )
+
+    def handle(self, *args, **options):
+        if settings.CALLS_CACHE_BACKEND in PROCESS_LOCAL_CACHE_BACKENDS:
+            # New calls would only invalidate this process's copy of the calls
+            # list cache, and the web server would serve stale pages
+            raise CommandError(
+                f"CALLS_CACHE_BACKEND is {settings.CALLS_CACHE_BACKEND}, which is local to each process. "
+                "Set it to a shared backend (e.g. django.core.cache.backends.redis.RedisCache) to run the "
+                "worker separately, or keep WEBHOOK_QUEUE_INLINE_WORKER on."
+            )
+
+        if options['requeue_dead']:
+            requeued = requeue_dead_jobs()
+            self.stdout.write(f"Requeued {requeued} dead-lettered jobs")
+
+        try:
+            asyncio.run(run_worker(drain=options['drain']))
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,46 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand
+
+from api.calls.models import CallSearchDocument
+from api.calls.repositories import get_call_repository
+from api.calls.schemas import CallData
+from api.calls.services.call_search import index_calls
+
+# Calls read from the repository and indexed per statement
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = (
+        "Index every stored call for /calls/search/, e.g. calls stored before search "
+        "existed. New calls are indexed at webhook ingest."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help="Empty the index first, dropping calls that are no longer stored"
+        )
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            deleted, _ = CallSearchDocument.objects.all().delete()
+            self.stdout.write(f"Removed {deleted} indexed calls")
+
+        indexed = asyncio.run(self.index_all())
+        self.stdout.write(f"Indexed {indexed} calls")
+
+    async def index_all(self):
+        indexed = 0
+        batch = []
+        async for call in get_call_repository().iter_all(page_size=BATCH_SIZE):
+            batch.append((call['id'], CallData.model_validate(call)))
+            if len(batch) == BATCH_SIZE:
+                indexed += await sync_to_async(index_calls)(batch)
+                batch = []
+        if batch:
+            indexed += await sync_to_async(index_calls)(batch)
+        return indexed
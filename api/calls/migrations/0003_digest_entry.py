@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:28
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0002_email_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DigestEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recipient', models.CharField(max_length=254)),
+                ('call_id', models.CharField(max_length=128)),
+                ('call_json', models.TextField(help_text='CallData serialized as JSON')),
+                ('claim_token', models.CharField(blank=True, default='', help_text='Set while a flush is sending it', max_length=32)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['recipient', 'created_at'], name='calls_diges_recipie_2828b5_idx')],
+            },
+        ),
+    ]
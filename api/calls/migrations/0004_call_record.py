@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:55
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0003_digest_entry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CallRecord',
+            fields=[
+                ('id', models.CharField(help_text='ElevenLabs conversation ID', max_length=128, primary_key=True, serialize=False)),
+                ('summary', models.TextField(blank=True, default='')),
+                ('transcript', models.BinaryField(default=b'', help_text='zlib compressed JSON of the packed turns')),
+                ('recording_url', models.TextField(blank=True, default='')),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('ended_at', models.DateTimeField(blank=True, null=True)),
+                ('ended_reason', models.TextField(blank=True, default='')),
+                ('caller_name', models.TextField(blank=True, default='')),
+                ('success_evaluation', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('cost', models.FloatField(default=0.0)),
+                ('phone_number', models.CharField(blank=True, default='', max_length=32)),
+                ('did_respond', models.BooleanField(default=False)),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['-created_at', '-id'], name='calls_callr_created_ff50d7_idx'), models.Index(fields=['did_respond', '-created_at', '-id'], name='calls_callr_did_res_0c5b68_idx')],
+            },
+        ),
+    ]
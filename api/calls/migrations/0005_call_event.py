@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0004_call_record'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CallEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('call.created', 'Call created'), ('call.updated', 'Call updated')], max_length=32)),
+                ('call_id', models.CharField(max_length=128)),
+                ('data', models.TextField(help_text='Event data as JSON')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+# Full-text index over CallSearchDocument (external content: the index stores
+# only tokens, snippets are read back from the table). Triggers keep it in step
+# with every insert, update and delete.
+INDEXED_COLUMNS = 'caller_name, phone_digits, summary, transcript'
+NEW_VALUES = 'new.caller_name, new.phone_digits, new.summary, new.transcript'
+OLD_VALUES = 'old.caller_name, old.phone_digits, old.summary, old.transcript'
+
+CREATE_SEARCH_INDEX = [
+    f"""
+    CREATE VIRTUAL TABLE calls_call_search USING fts5(
+        {INDEXED_COLUMNS},
+        content='calls_callsearchdocument',
+        content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER calls_call_search_insert AFTER INSERT ON calls_callsearchdocument BEGIN
+        INSERT INTO calls_call_search(rowid, {INDEXED_COLUMNS}) VALUES (new.id, {NEW_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER calls_call_search_delete AFTER DELETE ON calls_callsearchdocument BEGIN
+        INSERT INTO calls_call_search(calls_call_search, rowid, {INDEXED_COLUMNS})
+        VALUES ('delete', old.id, {OLD_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER calls_call_search_update AFTER UPDATE ON calls_callsearchdocument BEGIN
+        INSERT INTO calls_call_search(calls_call_search, rowid, {INDEXED_COLUMNS})
+        VALUES ('delete', old.id, {OLD_VALUES});
+        INSERT INTO calls_call_search(rowid, {INDEXED_COLUMNS}) VALUES (new.id, {NEW_VALUES});
+    END
+    """,
+]
+
+DROP_SEARCH_INDEX = [
+    "DROP TRIGGER IF EXISTS calls_call_search_update",
+    "DROP TRIGGER IF EXISTS calls_call_search_delete",
+    "DROP TRIGGER IF EXISTS calls_call_search_insert",
+    "DROP TABLE IF EXISTS calls_call_search",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0005_call_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CallSearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('call_id', models.CharField(max_length=128, unique=True)),
+                ('caller_name', models.TextField(blank=True, default='')),
+                ('phone_number', models.CharField(blank=True, default='', max_length=32)),
+                ('phone_digits', models.TextField(blank=True, default='', help_text='Phone number digits and their suffixes')),
+                ('summary', models.TextField(blank=True, default='')),
+                ('transcript', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunSQL(CREATE_SEARCH_INDEX, reverse_sql=DROP_SEARCH_INDEX),
+    ]
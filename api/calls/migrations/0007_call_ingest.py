@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0006_call_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CallIngest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('conversation_id', models.CharField(max_length=128, unique=True)),
+                ('leased_until', models.DateTimeField(blank=True, help_text='Set while an attempt is running the steps', null=True)),
+                ('stored_at', models.DateTimeField(blank=True, null=True)),
+                ('published_at', models.DateTimeField(blank=True, help_text='When the call.created event was recorded', null=True)),
+                ('notified_at', models.DateTimeField(blank=True, help_text='When recipients were emailed or digested', null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
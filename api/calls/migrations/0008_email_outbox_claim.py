@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0007_call_ingest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailoutboxmessage',
+            name='locked_at',
+            field=models.DateTimeField(blank=True, help_text='When a flush claimed the message', null=True),
+        ),
+        migrations.AlterField(
+            model_name='emailoutboxmessage',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('failed', 'Failed')], default='pending', max_length=16),
+        ),
+    ]
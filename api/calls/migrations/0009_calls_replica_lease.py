@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0008_email_outbox_claim'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CallsReplicaLease',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('owner', models.CharField(blank=True, default='', help_text='host:pid of the maintaining process', max_length=128)),
+                ('lease_until', models.DateTimeField(blank=True, help_text='The owner renews it while it runs', null=True)),
+                ('synced', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:29
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_entries(apps, schema_editor):
+    """Keep the first entry for each recipient and call so the constraint can be added"""
+    DigestEntry = apps.get_model('calls', 'DigestEntry')
+    first_ids = DigestEntry.objects.values('recipient', 'call_id').annotate(first_id=Min('id')).values('first_id')
+    DigestEntry.objects.exclude(id__in=first_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calls', '0009_calls_replica_lease'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_entries, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='digestentry',
+            constraint=models.UniqueConstraint(fields=('recipient', 'call_id'), name='unique_digest_entry_per_call'),
+        ),
+    ]
@@ -0,0 +1,180 @@
+from django.db import models
+from django.utils import timezone
+
+
+class WebhookJob(models.Model):
+    """Raw ElevenLabs webhook delivery waiting to be (or already) processed"""
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        PROCESSING = 'processing', 'Processing'
+        DONE = 'done', 'Done'
+        DEAD = 'dead', 'Dead'
+
+    payload = models.TextField(help_text="Raw webhook request body")
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now, help_text="Earliest time of the next attempt")
+    locked_at = models.DateTimeField(null=True, blank=True, help_text="When a worker claimed the job")
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+        ]
+
+    def __str__(self):
+        return f"WebhookJob {self.pk} ({self.status})"
+
+
+class CallIngest(models.Model):
+    """
+    Progress of the steps that follow storing a webhook's call, so a retried
+    job finishes the ones an earlier attempt didn't (and none twice)
+    """
+    conversation_id = models.CharField(max_length=128, unique=True)
+    leased_until = models.DateTimeField(null=True, blank=True, help_text="Set while an attempt is running the steps")
+    stored_at = models.DateTimeField(null=True, blank=True)
+    published_at = models.DateTimeField(null=True, blank=True, help_text="When the call.created event was recorded")
+    notified_at = models.DateTimeField(null=True, blank=True, help_text="When recipients were emailed or digested")
+    completed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"CallIngest {self.conversation_id}"
+
+
+class EmailOutboxMessage(models.Model):
+    """Email that could not be sent right away and is waiting to be retried"""
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        SENDING = 'sending', 'Sending'
+        FAILED = 'failed', 'Failed'
+
+    to = models.CharField(max_length=254)
+    subject = models.CharField(max_length=998)
+    body = models.TextField()
+    html_body = models.TextField(blank=True, default="")
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now, help_text="Earliest time of the next attempt")
+    locked_at = models.DateTimeField(null=True, blank=True, help_text="When a flush claimed the message")
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+        ]
+
+    def __str__(self):
+        return f"EmailOutboxMessage {self.pk} to {self.to} ({self.status})"
+
+
+class DigestEntry(models.Model):
+    """Call waiting to be included in a recipient's next digest email"""
+    recipient = models.CharField(max_length=254)
+    call_id = models.CharField(max_length=128)
+    call_json = models.TextField(help_text="CallData serialized as JSON")
+    claim_token = models.CharField(max_length=32, blank=True, default="", help_text="Set while a flush is sending it")
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['recipient', 'created_at']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['recipient', 'call_id'], name='unique_digest_entry_per_call'),
+        ]
+
+    def __str__(self):
+        return f"DigestEntry {self.pk} for {self.recipient}"
+
+
+class CallRecord(models.Model):
+    """A call stored in the Django database (CALLS_REPOSITORY or CALLS_REPLICA=sqlite)"""
+    id = models.CharField(primary_key=True, max_length=128, help_text="ElevenLabs conversation ID")
+    summary = models.TextField(blank=True, default="")
+    transcript = models.BinaryField(default=b"", help_text="zlib compressed JSON of the packed turns")
+    recording_url = models.TextField(blank=True, default="")
+    started_at = models.DateTimeField(null=True, blank=True)
+    ended_at = models.DateTimeField(null=True, blank=True)
+    ended_reason = models.TextField(blank=True, default="")
+    caller_name = models.TextField(blank=True, default="")
+    success_evaluation = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(default=timezone.now)
+    cost = models.FloatField(default=0.0)
+    phone_number = models.CharField(max_length=32, blank=True, default="")
+    did_respond = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['-created_at', '-id']),
+            models.Index(fields=['did_respond', '-created_at', '-id']),
+        ]
+
+    def __str__(self):
+        return f"CallRecord {self.id}"
+
+
+class CallEvent(models.Model):
+    """Change to a call, pushed to /calls/events/ subscribers. The ID is the SSE event ID."""
+
+    class Type(models.TextChoices):
+        CREATED = 'call.created', 'Call created'
+        UPDATED = 'call.updated', 'Call updated'
+
+    type = models.CharField(max_length=32, choices=Type.choices)
+    call_id = models.CharField(max_length=128)
+    data = models.TextField(help_text="Event data as JSON")
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"CallEvent {self.pk} {self.type} {self.call_id}"
+
+
+class CallSearchDocument(models.Model):
+    """
+    Searchable text of a call. The calls_call_search FTS5 table indexes it as
+    external content, kept in step by triggers (see migration 0006).
+    """
+    call_id = models.CharField(max_length=128, unique=True)
+    caller_name = models.TextField(blank=True, default="")
+    phone_number = models.CharField(max_length=32, blank=True, default="")
+    phone_digits = models.TextField(blank=True, default="", help_text="Phone number digits and their suffixes")
+    summary = models.TextField(blank=True, default="")
+    transcript = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"CallSearchDocument {self.call_id}"
+
+
+class CallsReplicaLease(models.Model):
+    """
+    Which process maintains the shared SQLite calls replica (CallRecord), and
+    whether that copy is in sync, for the processes reading it
+    """
+    name = models.CharField(max_length=64, unique=True)
+    owner = models.CharField(max_length=128, blank=True, default="", help_text="host:pid of the maintaining process")
+    lease_until = models.DateTimeField(null=True, blank=True, help_text="The owner renews it while it runs")
+    synced = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"CallsReplicaLease {self.name} ({self.owner or 'unowned'})"
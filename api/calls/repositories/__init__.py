@@ -0,0 +1,46 @@
+"""
+Call storage backends. Services get the configured one (settings.CALLS_REPOSITORY)
+from get_call_repository() rather than talking to a database directly.
+"""
+
+import threading
+
+from api import settings
+from api.calls.repositories.base import CallAlreadyExists, CallNotFound, CallRepository
+from api.calls.repositories.firestore import FirestoreCallRepository
+from api.calls.repositories.memory import InMemoryCallRepository
+from api.calls.repositories.replica import ReplicatedCallRepository, get_calls_replica
+from api.calls.repositories.sqlite import SQLiteCallRepository
+
+CALL_REPOSITORIES = {
+    'firestore': FirestoreCallRepository,
+    'sqlite': SQLiteCallRepository,
+    'memory': InMemoryCallRepository,
+}
+
+# The configured repository, created on first use
+call_repository = None
+call_repository_lock = threading.Lock()
+
+
+def get_call_repository() -> CallRepository:
+    """
+    Get the CallRepository selected by settings.CALLS_REPOSITORY; with
+    CALLS_REPLICA set, Firestore reads are served by the local replica.
+    """
+    global call_repository
+
+    with call_repository_lock:
+        if call_repository is None:
+            try:
+                repository_class = CALL_REPOSITORIES[settings.CALLS_REPOSITORY]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown CALLS_REPOSITORY {settings.CALLS_REPOSITORY!r}, "
+                    f"expected one of: {', '.join(CALL_REPOSITORIES)}"
+                ) from None
+            call_repository = repository_class()
+            if settings.CALLS_REPLICA and settings.CALLS_REPOSITORY == 'firestore':
+                call_repository = ReplicatedCallRepository(call_repository, get_calls_replica())
+    return call_repository
+
@@ -0,0 +1,126 @@
+import abc
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from api.calls.schemas import CallData
+
+# Every stored field; reads default to all of them
+CALL_FIELDS = tuple(CallData.model_fields)
+
+# Fields calls can be filtered on when listing
+FILTERABLE_FIELDS = tuple(field for field in CALL_FIELDS if field != 'transcript')
+
+# Position in the newest-first order: (created_at, call ID) of the last call seen
+ListPosition = Tuple[datetime, str]
+
+
+class CallAlreadyExists(Exception):
+    """A call with this ID is already stored"""
+
+
+class CallNotFound(Exception):
+    """No call is stored with this ID"""
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Timezone-aware UTC datetime; naive values are taken as UTC, as Firestore does"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def check_filters(filters: Optional[Dict[str, object]]) -> Dict[str, object]:
+    """Validate list filters. Raises ValueError on a field that can't be filtered on."""
+    filters = filters or {}
+    unknown = sorted(set(filters) - set(FILTERABLE_FIELDS))
+    if unknown:
+        raise ValueError(f"Cannot filter calls on: {', '.join(unknown)}")
+    return filters
+
+
+class CallRepository(abc.ABC):
+    """
+    Storage for calls, keyed by call ID (the ElevenLabs conversation ID).
+
+    Reads return call dicts: the requested CallData fields (default all) plus
+    `id`, with datetimes in UTC and the transcript rendered as text. Lists are
+    newest first, paged by keyset on (created_at, id).
+    """
+
+    @abc.abstractmethod
+    async def add(self, call_id: str, call: CallData) -> None:
+        """Store a new call. Raises CallAlreadyExists if the ID is taken."""
+
+    @abc.abstractmethod
+    async def get(self, call_id: str, fields: Optional[Sequence[str]] = None) -> Optional[dict]:
+        """Get one call, or None if it doesn't exist"""
+
+    @abc.abstractmethod
+    async def update(self, call_id: str, changes: dict) -> None:
+        """Update fields of a call. Raises CallNotFound if it doesn't exist."""
+
+    @abc.abstractmethod
+    async def bulk_update(self, call_ids: Sequence[str], changes: dict) -> List[str]:
+        """Apply the same changes to many calls. Returns the IDs that don't exist."""
+
+    @abc.abstractmethod
+    async def list(
+            self,
+            limit: int,
+            after: Optional[ListPosition] = None,
+            fields: Optional[Sequence[str]] = None,
+            filters: Optional[Dict[str, object]] = None) -> List[dict]:
+        """
+        Up to `limit` calls, newest first, starting after the `after` position.
+        `filters` maps fields to the value calls must have.
+        """
+
+    async def iter_all(
+            self,
+            fields: Optional[Sequence[str]] = None,
+            filters: Optional[Dict[str, object]] = None,
+            page_size: int = 500) -> AsyncIterator[dict]:
+        """
+        Yield every call, newest first, reading `page_size` calls at a time
+        so no single query runs long.
+        """
+        if fields is not None:
+            fields = tuple(set(fields) | {'created_at'})
+
+        after = None
+        while True:
+            page = await self.list(page_size, after, fields, filters)
+            for call in page:
+                yield call
+            if len(page) < page_size:
+                return
+            after = (page[-1]['created_at'], page[-1]['id'])
+
+
+class LocalCallRepository(CallRepository):
+    """
+    A repository in this process or its database that can mirror another one
+    (see repositories/replica.py). The mirroring methods are synchronous, as
+    they run on the replica listener's thread.
+    """
+
+    # Whether every process sees the same calls (a database table) rather
+    # than its own copy, so only one process may mirror into it
+    shared = False
+
+    @abc.abstractmethod
+    def put_many(self, calls: Iterable[Tuple[str, CallData]]) -> None:
+        """Insert or replace (call_id, call) pairs"""
+
+    @abc.abstractmethod
+    def delete_many(self, call_ids: Iterable[str]) -> None:
+        """Remove calls, ignoring IDs that aren't stored"""
+
+    @abc.abstractmethod
+    def replace_all(self, calls: Iterable[Tuple[str, CallData]]) -> None:
+        """
+        Make the stored calls exactly `calls`, as one change: readers see
+        either the old set or the new one, never an empty or partial copy
+        """
@@ -0,0 +1,118 @@
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from google.api_core.exceptions import AlreadyExists, NotFound
+from google.cloud.firestore_v1 import Query
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+from api.calls.repositories.base import CallAlreadyExists, CallNotFound, CallRepository, ListPosition, check_filters
+from api.calls.schemas import CallData
+from api.calls.services.transcripts import (
+    TRANSCRIPT_DOC_ID, TRANSCRIPT_SUBCOLLECTION, build_call_document, load_transcripts
+)
+from api.database import get_async_calls_collection, get_async_firestore_client, get_calls_write_coalescer
+
+logger = logging.getLogger(__name__)
+
+
+class FirestoreCallRepository(CallRepository):
+    """
+    Calls in the Firestore `calls` collection, using the per-event-loop
+    clients from api.database. New calls go through the write coalescer, so
+    concurrent adds share one batched commit.
+    """
+
+    async def add(self, call_id: str, call: CallData) -> None:
+        document, transcript_document = build_call_document(call)
+        subdocuments = None
+        if transcript_document is not None:
+            subdocuments = {(TRANSCRIPT_SUBCOLLECTION, TRANSCRIPT_DOC_ID): transcript_document}
+
+        try:
+            await get_calls_write_coalescer().create(call_id, document, subdocuments)
+        except AlreadyExists as e:
+            raise CallAlreadyExists(call_id) from e
+
+    async def get(self, call_id: str, fields: Optional[Sequence[str]] = None) -> Optional[dict]:
+        doc_ref = get_async_calls_collection().document(call_id)
+        doc = await (doc_ref.get() if fields is None else doc_ref.get(field_paths=list(fields)))
+        if not doc.exists:
+            return None
+
+        call = doc.to_dict()
+        call['id'] = doc.id
+        if fields is None or 'transcript' in fields:
+            await load_transcripts([call], [doc.reference])
+        return call
+
+    async def update(self, call_id: str, changes: dict) -> None:
+        try:
+            await get_async_calls_collection().document(call_id).update(changes)
+        except NotFound as e:
+            raise CallNotFound(call_id) from e
+
+    async def bulk_update(self, call_ids: Sequence[str], changes: dict) -> List[str]:
+        """
+        Commit every update in one batch. Batches are atomic, so if any call
+        is missing the commit fails; the missing IDs are then looked up in one
+        read and the rest are committed again.
+        """
+        client = get_async_firestore_client()
+        calls_collection = client.collection('calls')
+        doc_refs = [calls_collection.document(call_id) for call_id in call_ids]
+
+        async def commit(refs):
+            batch = client.batch()
+            for doc_ref in refs:
+                batch.update(doc_ref, changes)
+            await batch.commit()
+
+        not_found = set()
+        try:
+            await commit(doc_refs)
+        except NotFound:
+            async for snapshot in client.get_all(doc_refs, field_paths=list(changes)):
+                if not snapshot.exists:
+                    not_found.add(snapshot.id)
+
+            existing_refs = [doc_ref for doc_ref in doc_refs if doc_ref.id not in not_found]
+            if existing_refs:
+                await commit(existing_refs)
+
+        return [call_id for call_id in call_ids if call_id in not_found]
+
+    async def list(
+            self,
+            limit: int,
+            after: Optional[ListPosition] = None,
+            fields: Optional[Sequence[str]] = None,
+            filters: Optional[Dict[str, object]] = None) -> List[dict]:
+        """
+        One keyset query on (created_at, document ID). Only `fields` are read,
+        using a select() projection. Filtered lists need a Firestore composite
+        index on the filter fields plus created_at and __name__, descending.
+        """
+        query = get_async_calls_collection()
+        if fields is not None:
+            query = query.select(list(fields))
+        for field, value in check_filters(filters).items():
+            query = query.where(filter=FieldFilter(field, '==', value))
+        query = (
+            query
+            .order_by('created_at', direction=Query.DESCENDING)
+            .order_by('__name__', direction=Query.DESCENDING)
+        )
+        if after is not None:
+            query = query.start_after({'created_at': after[0], '__name__': after[1]})
+
+        docs = [doc async for doc in query.limit(limit).stream()]
+
+        calls = []
+        for doc in docs:
+            call = doc.to_dict()
+            call['id'] = doc.id
+            calls.append(call)
+
+        if fields is None or 'transcript' in fields:
+            await load_transcripts(calls, [doc.reference for doc in docs])
+        return calls
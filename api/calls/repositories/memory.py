@@ -0,0 +1,121 @@
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from api.calls.repositories.base import (
+    CALL_FIELDS, CallAlreadyExists, CallNotFound, ListPosition, LocalCallRepository, as_utc, check_filters
+)
+from api.calls.schemas import CallData
+from api.calls.services.transcripts import render_transcript
+
+
+class InMemoryCallRepository(LocalCallRepository):
+    """
+    Calls in a process-local dict, with a sorted (created_at, id) list for
+    listing. Nothing is persisted; meant for local development, benchmarks
+    and as a local store in front of Firestore.
+    Safe to share between threads and event loops.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, CallData] = {}
+        # (created_at, id) of every call, ascending
+        self._order = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(call: CallData) -> CallData:
+        return call.model_copy(update={
+            'created_at': as_utc(call.created_at),
+            'started_at': as_utc(call.started_at),
+            'ended_at': as_utc(call.ended_at),
+        })
+
+    @staticmethod
+    def _to_dict(call_id: str, call: CallData, fields: Optional[Sequence[str]]) -> dict:
+        fields = CALL_FIELDS if fields is None else fields
+        data = {field: getattr(call, field) for field in fields if field != 'transcript'}
+        if 'transcript' in fields:
+            data['transcript'] = render_transcript(call.transcript)
+        data['id'] = call_id
+        return data
+
+    def _store(self, call_id: str, call: CallData):
+        """Insert or replace a call, keeping the order index current (lock held)"""
+        previous = self._calls.get(call_id)
+        self._calls[call_id] = call
+        if previous is not None:
+            if previous.created_at == call.created_at:
+                return
+            del self._order[bisect.bisect_left(self._order, (previous.created_at, call_id))]
+        bisect.insort(self._order, (call.created_at, call_id))
+
+    async def add(self, call_id: str, call: CallData) -> None:
+        call = self._normalize(call)
+        with self._lock:
+            if call_id in self._calls:
+                raise CallAlreadyExists(call_id)
+            self._store(call_id, call)
+
+    async def get(self, call_id: str, fields: Optional[Sequence[str]] = None) -> Optional[dict]:
+        call = self._calls.get(call_id)
+        return None if call is None else self._to_dict(call_id, call, fields)
+
+    async def update(self, call_id: str, changes: dict) -> None:
+        with self._lock:
+            call = self._calls.get(call_id)
+            if call is None:
+                raise CallNotFound(call_id)
+            self._store(call_id, self._normalize(call.model_copy(update=changes)))
+
+    async def bulk_update(self, call_ids: Sequence[str], changes: dict) -> List[str]:
+        not_found = []
+        with self._lock:
+            for call_id in call_ids:
+                call = self._calls.get(call_id)
+                if call is None:
+                    not_found.append(call_id)
+                else:
+                    self._store(call_id, self._normalize(call.model_copy(update=changes)))
+        return not_found
+
+    async def list(
+            self,
+            limit: int,
+            after: Optional[ListPosition] = None,
+            fields: Optional[Sequence[str]] = None,
+            filters: Optional[Dict[str, object]] = None) -> List[dict]:
+        filters = check_filters(filters)
+
+        with self._lock:
+            end = len(self._order) if after is None else bisect.bisect_left(self._order, (as_utc(after[0]), after[1]))
+            calls = []
+            for index in range(end - 1, -1, -1):
+                if len(calls) >= limit:
+                    break
+                call_id = self._order[index][1]
+                call = self._calls[call_id]
+                if all(getattr(call, field) == value for field, value in filters.items()):
+                    calls.append((call_id, call))
+
+        return [self._to_dict(call_id, call, fields) for call_id, call in calls]
+
+    def put_many(self, calls: Iterable[Tuple[str, CallData]]) -> None:
+        calls = [(call_id, self._normalize(call)) for call_id, call in calls]
+        with self._lock:
+            for call_id, call in calls:
+                self._store(call_id, call)
+
+    def delete_many(self, call_ids: Iterable[str]) -> None:
+        with self._lock:
+            for call_id in call_ids:
+                call = self._calls.pop(call_id, None)
+                if call is not None:
+                    del self._order[bisect.bisect_left(self._order, (call.created_at, call_id))]
+
+    def replace_all(self, calls: Iterable[Tuple[str, CallData]]) -> None:
+        calls = {call_id: self._normalize(call) for call_id, call in calls}
+        order = sorted((call.created_at, call_id) for call_id, call in calls.items())
+        with self._lock:
+            self._calls = calls
+            self._order = order
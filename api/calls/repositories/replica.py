@@ -0,0 +1,352 @@
+"""
+Local read replica of the Firestore calls collection.
+
+A CallsReplica mirrors the collection into a LocalCallRepository (the SQLite
+database or process memory, settings.CALLS_REPLICA) with a Firestore
+on_snapshot listener. ReplicatedCallRepository serves list and detail reads
+from the mirror while it is in sync and sends every write to Firestore.
+
+The SQLite mirror is one table shared by every process, so only the process
+holding the CallsReplicaLease listens and writes to it; the others read it
+while the lease holder reports it in sync.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone as django_timezone
+from google.cloud.firestore_v1.watch import ChangeType
+
+from api import metrics, settings
+from api.calls.models import CallsReplicaLease
+from api.calls.repositories.base import (
+    CallAlreadyExists, CallNotFound, CallRepository, ListPosition, LocalCallRepository
+)
+from api.calls.repositories.memory import InMemoryCallRepository
+from api.calls.repositories.sqlite import SQLiteCallRepository
+from api.calls.schemas import CallData
+from api.calls.services.transcripts import (
+    TRANSCRIPT_DOC_ID, TRANSCRIPT_SUBCOLLECTION, decode_transcript, is_in_subcollection
+)
+from api.database import get_firestore_client
+
+logger = logging.getLogger(__name__)
+
+LOCAL_REPOSITORIES = {
+    'sqlite': SQLiteCallRepository,
+    'memory': InMemoryCallRepository,
+}
+
+LEASE_NAME = 'calls'
+
+# The lease on a shared mirror lasts this many supervisor checks, so another
+# process takes over a few checks after its holder dies
+LEASE_CHECKS = 3
+
+
+class CallsReplica:
+    """
+    Mirrors the calls collection into `local` with an on_snapshot listener.
+
+    The first snapshot a listener delivers is the whole collection and
+    replaces the local copy (a full resync); later snapshots apply just the
+    changed documents. A supervisor thread checks the listener every
+    `check_interval` seconds and, if its stream has stopped or a snapshot
+    failed to apply, starts a new listener, and so a new full resync.
+    Reads must not be served locally unless `is_synced`.
+
+    When `local` is shared between processes, the supervisor listens only
+    while it holds the lease, and otherwise follows the holder's sync state.
+    """
+
+    def __init__(self, local: LocalCallRepository, client=None, check_interval: float = None):
+        self.local = local
+        self._client = client
+        self._check_interval = settings.CALLS_REPLICA_CHECK_INTERVAL if check_interval is None else check_interval
+        self._watch = None
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._needs_resync = True
+        self._failed = False
+        # Serializes snapshot application, which runs on the listener's thread
+        self._apply_lock = threading.Lock()
+        self._last_snapshot_at = None
+        self._supervisor = None
+        self._owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    @property
+    def is_synced(self) -> bool:
+        return self._synced.is_set()
+
+    @property
+    def is_started(self) -> bool:
+        return self._supervisor is not None
+
+    @property
+    def is_listening(self) -> bool:
+        return self._watch is not None and self._watch.is_active and not self._failed
+
+    def seconds_since_snapshot(self) -> Optional[float]:
+        """
+        Time since the listener last delivered a snapshot. Firestore only
+        sends one when something changes, so on a quiet collection this grows
+        while the replica is still current.
+        """
+        if self._last_snapshot_at is None:
+            return None
+        return round(time.monotonic() - self._last_snapshot_at, 3)
+
+    def start(self):
+        """Start the supervisor thread, which starts the listener and restarts it"""
+        self._supervisor = threading.Thread(target=self._supervise, name='calls-replica', daemon=True)
+        self._supervisor.start()
+
+        metrics.register_gauge('calls_replica.synced', lambda: int(self.is_synced))
+        metrics.register_gauge('calls_replica.listening', lambda: int(self.is_listening))
+        metrics.register_gauge('calls_replica.seconds_since_snapshot', self.seconds_since_snapshot)
+
+    def stop(self):
+        self._stopped.set()
+        self._unlisten()
+        if self.local.shared:
+            # Let another process take over without waiting for the lease to run out
+            CallsReplicaLease.objects.filter(name=LEASE_NAME, owner=self._owner).update(
+                lease_until=None, synced=False
+            )
+
+    def _listen(self):
+        client = self._client or get_firestore_client()
+        self._synced.clear()
+        self._set_shared_synced(False)
+        self._needs_resync = True
+        self._failed = False
+        self._watch = client.collection('calls').on_snapshot(self._on_snapshot)
+
+    def _unlisten(self):
+        self._synced.clear()
+        if self._watch is not None:
+            self._watch.unsubscribe()
+            self._watch = None
+
+    def _claim_lease(self) -> bool:
+        """Take the lease on the shared mirror, or renew it. Returns whether this process holds it."""
+        now = django_timezone.now()
+        CallsReplicaLease.objects.get_or_create(name=LEASE_NAME)
+        return bool(CallsReplicaLease.objects.filter(
+            Q(owner=self._owner) | Q(lease_until__isnull=True) | Q(lease_until__lt=now),
+            name=LEASE_NAME
+        ).update(
+            owner=self._owner,
+            lease_until=now + timedelta(seconds=self._check_interval * LEASE_CHECKS)
+        ))
+
+    def _set_shared_synced(self, synced: bool):
+        """Tell the processes reading the shared mirror whether it is in sync"""
+        if self.local.shared:
+            CallsReplicaLease.objects.filter(name=LEASE_NAME, owner=self._owner).update(synced=synced)
+
+    def _follow(self):
+        """Take the sync state of the shared mirror from its lease holder"""
+        lease = CallsReplicaLease.objects.filter(name=LEASE_NAME).first()
+        if lease is not None and lease.synced and lease.lease_until and lease.lease_until > django_timezone.now():
+            self._synced.set()
+        else:
+            self._synced.clear()
+
+    def _supervise(self):
+        while True:
+            try:
+                self._check()
+            except Exception as e:
+                # Firestore or the database unreachable; try again on the next check
+                logger.error(f"Error checking calls replica: {str(e)}")
+            finally:
+                close_old_connections()
+            if self._stopped.wait(self._check_interval):
+                return
+
+    def _check(self):
+        if self.local.shared and not self._claim_lease():
+            if self._watch is not None:
+                logger.warning("Another process took over the calls replica, stopping this listener")
+                self._unlisten()
+            self._follow()
+            return
+
+        if self.is_listening:
+            return
+
+        if self._watch is not None:
+            logger.warning("Calls replica listener stopped, restarting it with a full resync")
+            metrics.increment('calls_replica.restarts')
+            self._unlisten()
+        self._listen()
+
+    def _on_snapshot(self, docs, changes, read_time):
+        # The listener thread is long-lived; drop a broken or expired database connection
+        close_old_connections()
+        try:
+            with self._apply_lock:
+                if self._needs_resync:
+                    self._resync(docs)
+                else:
+                    self._apply(changes)
+                self._last_snapshot_at = time.monotonic()
+
+            # How far behind Firestore the replica was when this snapshot landed
+            lag = (datetime.now(timezone.utc) - read_time).total_seconds()
+            metrics.observe_latency('calls_replica.lag', max(lag, 0.0))
+        except Exception as e:
+            logger.error(f"Error applying calls snapshot, the replica will resync: {str(e)}", exc_info=True)
+            metrics.increment('calls_replica.errors')
+            self._synced.clear()
+            self._failed = True
+            try:
+                self._set_shared_synced(False)
+            except Exception:
+                # The lease runs out instead
+                pass
+
+    def _resync(self, docs):
+        start = time.perf_counter()
+        calls = self._load(docs)
+        self.local.replace_all(calls)
+        elapsed = time.perf_counter() - start
+
+        self._needs_resync = False
+        self._set_shared_synced(True)
+        self._synced.set()
+        metrics.increment('calls_replica.resyncs')
+        metrics.observe_latency('calls_replica.resync', elapsed)
+        logger.info(f"Calls replica synced {len(calls)} calls in {elapsed:.2f}s")
+
+    def _apply(self, changes):
+        removed = [change.document.id for change in changes if change.type == ChangeType.REMOVED]
+        changed = [change.document for change in changes if change.type != ChangeType.REMOVED]
+
+        if removed:
+            self.local.delete_many(removed)
+        if changed:
+            self.local.put_many(self._load(changed))
+        metrics.increment('calls_replica.changes', len(changes))
+
+    def _load(self, snapshots) -> List[Tuple[str, CallData]]:
+        """
+        Convert document snapshots into CallData. Transcripts stored in the
+        subcollection are read in one batched get_all.
+        """
+        documents = [(snapshot, snapshot.to_dict()) for snapshot in snapshots]
+        transcript_refs = [
+            snapshot.reference.collection(TRANSCRIPT_SUBCOLLECTION).document(TRANSCRIPT_DOC_ID)
+            for snapshot, data in documents
+            if is_in_subcollection(data.get('transcript'))
+        ]
+
+        subcollection_transcripts = {}
+        if transcript_refs:
+            client = self._client or get_firestore_client()
+            for transcript in client.get_all(transcript_refs):
+                # The call document is the parent of the transcript subcollection
+                call_id = transcript.reference.parent.parent.id
+                subcollection_transcripts[call_id] = transcript.to_dict() if transcript.exists else None
+
+        calls = []
+        for snapshot, data in documents:
+            stored = data.pop('transcript', None)
+            if is_in_subcollection(stored):
+                stored = subcollection_transcripts.get(snapshot.id)
+            calls.append((snapshot.id, CallData.model_validate({**data, 'transcript': decode_transcript(stored)})))
+        return calls
+
+
+class ReplicatedCallRepository(CallRepository):
+    """
+    Reads from the replica's local copy while it is in sync, and from
+    Firestore otherwise (at startup and during a resync). Writes go to
+    Firestore, then straight into the local copy so a client sees its own
+    change before the listener delivers it.
+    """
+
+    def __init__(self, source: CallRepository, replica: CallsReplica):
+        self.source = source
+        self.replica = replica
+
+    def _reader(self) -> CallRepository:
+        if self.replica.is_synced:
+            metrics.increment('calls_replica.local_reads')
+            return self.replica.local
+        metrics.increment('calls_replica.source_reads')
+        return self.source
+
+    async def add(self, call_id: str, call: CallData) -> None:
+        await self.source.add(call_id, call)
+        try:
+            await self.replica.local.add(call_id, call)
+        except CallAlreadyExists:
+            # The listener got there first
+            pass
+
+    async def get(self, call_id: str, fields: Optional[Sequence[str]] = None) -> Optional[dict]:
+        return await self._reader().get(call_id, fields)
+
+    async def update(self, call_id: str, changes: dict) -> None:
+        await self.source.update(call_id, changes)
+        try:
+            await self.replica.local.update(call_id, changes)
+        except CallNotFound:
+            # Not mirrored yet; the listener will bring the updated call
+            pass
+
+    async def bulk_update(self, call_ids: Sequence[str], changes: dict) -> List[str]:
+        not_found = await self.source.bulk_update(call_ids, changes)
+        await self.replica.local.bulk_update([call_id for call_id in call_ids if call_id not in not_found], changes)
+        return not_found
+
+    async def list(
+            self,
+            limit: int,
+            after: Optional[ListPosition] = None,
+            fields: Optional[Sequence[str]] = None,
+            filters: Optional[Dict[str, object]] = None) -> List[dict]:
+        return await self._reader().list(limit, after, fields, filters)
+
+
+# The replica of this process, created on first use
+calls_replica = None
+calls_replica_lock = threading.Lock()
+
+
+def get_calls_replica() -> CallsReplica:
+    """Get the replica selected by settings.CALLS_REPLICA (not started)"""
+    global calls_replica
+
+    with calls_replica_lock:
+        if calls_replica is None:
+            try:
+                local_class = LOCAL_REPOSITORIES[settings.CALLS_REPLICA]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown CALLS_REPLICA {settings.CALLS_REPLICA!r}, "
+                    f"expected one of: {', '.join(LOCAL_REPOSITORIES)}"
+                ) from None
+            calls_replica = CallsReplica(local_class())
+    return calls_replica
+
+
+def start_calls_replica():
+    """Start mirroring the calls collection, if CALLS_REPLICA is set and it isn't running"""
+    if not settings.CALLS_REPLICA or settings.CALLS_REPOSITORY != 'firestore':
+        return
+
+    replica = get_calls_replica()
+    with calls_replica_lock:
+        if not replica.is_started:
+            replica.start()
+            logger.info(f"Started calls replica ({settings.CALLS_REPLICA})")
@@ -0,0 +1,109 @@
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+from api.calls.models import CallRecord
+from api.calls.repositories.base import (
+    CALL_FIELDS, CallAlreadyExists, CallNotFound, ListPosition, LocalCallRepository, as_utc, check_filters
+)
+from api.calls.schemas import CallData
+from api.calls.services.transcripts import compress_turns, decompress_turns, render_transcript
+
+DATETIME_FIELDS = ('created_at', 'started_at', 'ended_at')
+
+# Rows written or deleted per statement when mirroring
+WRITE_BATCH_SIZE = 500
+
+
+def to_columns(values: dict) -> dict:
+    """CallData field values as CallRecord column values"""
+    columns = dict(values)
+    for field in DATETIME_FIELDS:
+        if field in columns:
+            columns[field] = as_utc(columns[field])
+    if 'transcript' in columns:
+        columns['transcript'] = compress_turns(columns['transcript'])
+    return columns
+
+
+def from_row(row: dict) -> dict:
+    """A CallRecord values() row as a call dict"""
+    if 'transcript' in row:
+        row['transcript'] = render_transcript(decompress_turns(bytes(row['transcript'])))
+    return row
+
+
+class SQLiteCallRepository(LocalCallRepository):
+    """
+    Calls in the CallRecord table of the Django database (SQLite, see
+    DATABASES), with indexes for the newest-first list, on its own and
+    filtered by did_respond. Transcripts are stored compressed.
+    """
+
+    shared = True
+
+    async def add(self, call_id: str, call: CallData) -> None:
+        columns = to_columns({field: getattr(call, field) for field in CALL_FIELDS})
+        try:
+            await CallRecord.objects.acreate(id=call_id, **columns)
+        except IntegrityError as e:
+            raise CallAlreadyExists(call_id) from e
+
+    async def get(self, call_id: str, fields: Optional[Sequence[str]] = None) -> Optional[dict]:
+        fields = CALL_FIELDS if fields is None else fields
+        row = await CallRecord.objects.filter(id=call_id).values('id', *fields).afirst()
+        return None if row is None else from_row(row)
+
+    async def update(self, call_id: str, changes: dict) -> None:
+        if not await CallRecord.objects.filter(id=call_id).aupdate(**to_columns(changes)):
+            raise CallNotFound(call_id)
+
+    async def bulk_update(self, call_ids: Sequence[str], changes: dict) -> List[str]:
+        existing = {call_id async for call_id in CallRecord.objects.filter(id__in=call_ids).values_list('id', flat=True)}
+        if existing:
+            await CallRecord.objects.filter(id__in=existing).aupdate(**to_columns(changes))
+        return [call_id for call_id in call_ids if call_id not in existing]
+
+    async def list(
+            self,
+            limit: int,
+            after: Optional[ListPosition] = None,
+            fields: Optional[Sequence[str]] = None,
+            filters: Optional[Dict[str, object]] = None) -> List[dict]:
+        fields = CALL_FIELDS if fields is None else fields
+
+        queryset = CallRecord.objects.filter(**check_filters(filters))
+        if after is not None:
+            created_at, call_id = as_utc(after[0]), after[1]
+            queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=call_id))
+
+        queryset = queryset.order_by('-created_at', '-id').values('id', *fields)[:limit]
+        return [from_row(row) async for row in queryset]
+
+    def put_many(self, calls: Iterable[Tuple[str, CallData]]) -> None:
+        records = (
+            CallRecord(id=call_id, **to_columns({field: getattr(call, field) for field in CALL_FIELDS}))
+            for call_id, call in calls
+        )
+        with transaction.atomic():
+            while batch := list(islice(records, WRITE_BATCH_SIZE)):
+                CallRecord.objects.bulk_create(
+                    batch, update_conflicts=True, unique_fields=['id'], update_fields=list(CALL_FIELDS)
+                )
+
+    def delete_many(self, call_ids: Iterable[str]) -> None:
+        call_ids = iter(call_ids)
+        with transaction.atomic():
+            while batch := list(islice(call_ids, WRITE_BATCH_SIZE)):
+                CallRecord.objects.filter(id__in=batch).delete()
+
+    def replace_all(self, calls: Iterable[Tuple[str, CallData]]) -> None:
+        calls = list(calls)
+        keep = {call_id for call_id, _ in calls}
+        with transaction.atomic():
+            # Upsert, then drop the rest, so other connections never see the table emptied
+            self.put_many(calls)
+            stale = [call_id for call_id in CallRecord.objects.values_list('id', flat=True) if call_id not in keep]
+            self.delete_many(stale)
@@ -1,13 +1,26 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
 
+class TranscriptTurn(BaseModel):
+    """One turn of a call transcript"""
+    role: str = Field(..., description="Who spoke, `agent` or `user`")
+    message: str = Field(default="", description="What was said")
+    time_in_call_secs: Optional[float] = Field(None, description="Offset of the turn from the start of the call")
+
+    @field_validator('message', mode='before')
+    @classmethod
+    def convert_none_to_empty_string(cls, v):
+        """Convert None values to empty strings (e.g. tool call turns)"""
+        return "" if v is None else v
+
+
 class CallData(BaseModel):
-    """Pydantic model for call data saved to Firestore"""
+    """Pydantic model for the data stored for each call"""
     summary: Optional[str] = Field(default="", description="AI-generated summary of the call")
-    transcript: Optional[str] = Field(default="", description="Complete transcript of the call")
+    transcript: List[TranscriptTurn] = Field(default_factory=list, description="Turns of the call transcript")
     recording_url: Optional[str] = Field(default="", description="URL to the call recording")
     started_at: Optional[datetime] = Field(None, description="When the call started")
     ended_at: Optional[datetime] = Field(None, description="When the call ended")
@@ -20,7 +33,6 @@ class CallData(BaseModel):
     did_respond: bool = Field(default=False, description="If the owner has responded to the call")
 
     @field_validator('summary',
-                     'transcript',
                      'recording_url',
                      'ended_reason',
                      'caller_name',
@@ -32,11 +44,34 @@ class CallData(BaseModel):
         """Convert None values to empty strings"""
         return "" if v is None else v
 
+    @field_validator('transcript', mode='before')
+    @classmethod
+    def parse_transcript_text(cls, v):
+        """Accept legacy `role: message` transcript strings"""
+        if v is None:
+            return []
+        if not isinstance(v, str):
+            return v
+
+        turns = []
+        for line in v.splitlines():
+            role, sep, message = line.partition(': ')
+            if sep and role in ('agent', 'user'):
+                turns.append({'role': role, 'message': message})
+            elif turns:
+                # Continuation of a multi-line message
+                turns[-1]['message'] += f"\n{line}"
+            elif line:
+                turns.append({'role': 'unknown', 'message': line})
+        return turns
+
     class Config:
         json_schema_extra = {
             "example": {
                 "summary": "Customer called asking about product availability",
-                "transcript": "Hello, I was wondering if you have product XYZ in stock...",
+                "transcript": [
+                    {"role": "user", "message": "Hello, do you have product XYZ in stock?", "time_in_call_secs": 2}
+                ],
                 "recording_url": "https://example.com/recording.mp3",
                 "started_at": "2025-07-19T00:06:31.932000",
                 "ended_at": "2025-07-19T00:08:15.432000",
@@ -51,6 +86,53 @@ class CallData(BaseModel):
         }
 
 
+class ElevenLabsPhoneCall(BaseModel):
+    """Phone details of an ElevenLabs conversation"""
+    external_number: str = Field(..., description="Caller's phone number")
+
+
+class ElevenLabsMetadata(BaseModel):
+    """ElevenLabs conversation metadata"""
+    start_time_unix_secs: int = Field(..., description="When the call started (unix seconds)")
+    call_duration_secs: int = Field(..., description="Call duration in seconds")
+    cost: Optional[float] = Field(default=0.0, description="Cost of the call")
+    termination_reason: Optional[str] = Field(default="", description="Reason why the call ended")
+    phone_call: Optional[ElevenLabsPhoneCall] = Field(None, description="Missing for web calls")
+
+
+class ElevenLabsDataCollectionResult(BaseModel):
+    """One extracted data collection value"""
+    value: Optional[Any] = Field(None, description="Extracted value")
+
+
+class ElevenLabsAnalysis(BaseModel):
+    """ElevenLabs post-call analysis"""
+    transcript_summary: Optional[str] = Field(default="", description="AI-generated summary of the call")
+    call_successful: Optional[str] = Field(default="", description="Success evaluation")
+    data_collection_results: Dict[str, ElevenLabsDataCollectionResult] = Field(
+        default_factory=dict,
+        description="Structured data extracted from the call, e.g. `name`"
+    )
+
+
+class ElevenLabsConversation(BaseModel):
+    """The `data` object of an ElevenLabs post-call webhook"""
+    conversation_id: str = Field(..., min_length=1, description="ElevenLabs conversation ID")
+    transcript: List[TranscriptTurn] = Field(default_factory=list, description="Turns of the conversation")
+    metadata: ElevenLabsMetadata
+    analysis: ElevenLabsAnalysis = Field(default_factory=ElevenLabsAnalysis)
+
+
+class ElevenLabsWebhookPayload(BaseModel):
+    """
+    ElevenLabs post-call transcription webhook.
+    Validate raw request bytes with `model_validate_json`; unknown fields are ignored.
+    """
+    type: Optional[str] = Field(None, description="Webhook event type")
+    event_timestamp: Optional[int] = Field(None, description="When the event was sent (unix seconds)")
+    data: ElevenLabsConversation
+
+
 class CallEditRequest(BaseModel):
     """Simple request model for editing call response status"""
     did_respond: Optional[bool] = Field(None, description="Whether the owner has responded to this call")
@@ -63,6 +145,113 @@ class CallEditRequest(BaseModel):
         }
 
 
+class CallBulkEditRequest(BaseModel):
+    """Request model for setting the response status of many calls at once"""
+    call_ids: List[str] = Field(..., min_length=1, max_length=500, description="IDs of the calls to update")
+    did_respond: bool = Field(..., description="Whether the owner has responded to these calls")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "call_ids": ["conv_01", "conv_02"],
+                "did_respond": True
+            }
+        }
+
+
+class CallFieldsQuery(BaseModel):
+    """Field projection query parameter shared by the list and export endpoints"""
+    fields: Optional[List[str]] = Field(
+        None,
+        description="Call fields to return (comma separated); defaults to every field except the transcript"
+    )
+
+    @field_validator('fields', mode='before')
+    @classmethod
+    def split_fields(cls, v):
+        """Accept the comma separated form used in query strings"""
+        if isinstance(v, str):
+            return [field.strip() for field in v.split(',') if field.strip()]
+        return v
+
+    @field_validator('fields')
+    @classmethod
+    def check_fields(cls, v):
+        """Only allow CallData fields"""
+        if v is None:
+            return v
+        unknown = [field for field in v if field not in CallData.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown call fields: {', '.join(unknown)}")
+        return v
+
+
+class CallsListQuery(CallFieldsQuery):
+    """Query parameters for paginating the calls list"""
+    limit: int = Field(default=20, ge=1, le=100, description="Maximum number of calls to return")
+    cursor: Optional[str] = Field(None, description="Opaque cursor from a previous page's `next` value")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "limit": 20,
+                "cursor": None,
+                "fields": ["caller_name", "phone_number", "summary", "did_respond"]
+            }
+        }
+
+
+class CallsExportQuery(CallFieldsQuery):
+    """Query parameters for streaming every call"""
+    mode: Literal['ndjson', 'json'] = Field(
+        default='ndjson',
+        description="`ndjson` for one call per line, `json` for a single JSON array"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "mode": "ndjson",
+                "fields": ["caller_name", "phone_number", "summary"]
+            }
+        }
+
+
+class CallSearchQuery(BaseModel):
+    """Query parameters for searching calls"""
+    q: str = Field(..., min_length=1, max_length=200, description="Words or a phone number to search for")
+    limit: int = Field(default=20, ge=1, le=100, description="Maximum number of hits to return")
+    offset: int = Field(default=0, ge=0, le=1000, description="Hits to skip, from a previous page's `next_offset`")
+    created_after: Optional[datetime] = Field(None, description="Only calls created at or after this time")
+    created_before: Optional[datetime] = Field(None, description="Only calls created before this time")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "q": "botox pricing",
+                "limit": 20,
+                "offset": 0,
+                "created_after": "2026-09-01T00:00:00Z"
+            }
+        }
+
+
+class CallEventsQuery(BaseModel):
+    """Query parameters for subscribing to call events"""
+    last_event_id: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Resume after this event ID; EventSource sends it as the Last-Event-ID header on reconnect"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "last_event_id": 1042
+            }
+        }
+
+
 class ErrorResponse(BaseModel):
     """Generic error response model"""
     error: str = Field(..., description="Error message")
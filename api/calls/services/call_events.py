@@ -0,0 +1,242 @@
+"""
+Push channel for new and updated calls, served as Server-Sent Events.
+
+Events are CallEvent rows, so their IDs are ordered across worker processes
+and a client that reconnects with Last-Event-ID gets everything it missed.
+Each event loop has one CallEventHub: a single poller task reads new events
+into a ring buffer and wakes every subscriber, so an idle subscriber costs
+one pending asyncio wait and no database queries.
+"""
+
+import asyncio
+import logging
+import weakref
+from collections import deque
+from datetime import timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from django.utils import timezone
+
+from api import metrics, settings
+from api.calls.models import CallEvent
+from api.calls.repositories.base import as_utc
+from api.calls.schemas import CallData
+from api.renderers import dumps
+
+logger = logging.getLogger(__name__)
+
+# Reconnection delay suggested to EventSource clients
+SSE_RETRY_MS = 5000
+
+HEARTBEAT = b": keepalive\n\n"
+
+# (event ID, encoded SSE message)
+EncodedEvent = Tuple[int, bytes]
+
+# Hubs by event loop (subscribers wait on asyncio primitives of their own loop)
+hubs = weakref.WeakKeyDictionary()
+
+
+def encode_event(event_id: int, event_type: str, data: str) -> bytes:
+    return f"id: {event_id}\nevent: {event_type}\ndata: {data}\n\n".encode('utf-8')
+
+
+def call_event_data(call_id: str, call: CallData) -> dict:
+    """A new call as it appears in the calls list (no transcript)"""
+    data = call.model_dump(exclude={'transcript'})
+    for field in ('created_at', 'started_at', 'ended_at'):
+        data[field] = as_utc(data[field])
+    data['id'] = call_id
+    return data
+
+
+async def publish_call_events(event_type: str, events: Iterable[Tuple[str, dict]]):
+    """
+    Record (call_id, data) events and wake this process's subscribers.
+    Errors are logged, not raised: the change itself is already stored.
+    """
+    records = [
+        CallEvent(type=event_type, call_id=call_id, data=dumps(data).decode('utf-8'))
+        for call_id, data in events
+    ]
+    if not records:
+        return
+
+    try:
+        await CallEvent.objects.abulk_create(records)
+    except Exception as e:
+        logger.error(f"Error recording {len(records)} {event_type} events: {str(e)}", exc_info=True)
+        return
+    metrics.increment('call_events.published', len(records))
+    wake_hubs()
+
+
+async def publish_call_event(event_type: str, call_id: str, data: dict):
+    await publish_call_events(event_type, [(call_id, data)])
+
+
+def wake_hubs():
+    """Make every hub poll now instead of at its next interval. Safe from any thread."""
+    for loop, hub in list(hubs.items()):
+        try:
+            loop.call_soon_threadsafe(hub.wake)
+        except RuntimeError:
+            # Loop closed
+            pass
+
+
+def purge_old_events() -> int:
+    """Delete events older than CALL_EVENTS_RETENTION_HOURS."""
+    cutoff = timezone.now() - timedelta(hours=settings.CALL_EVENTS_RETENTION_HOURS)
+    deleted, _ = CallEvent.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
+
+
+async def fetch_events(after_id: int, limit: int) -> List[EncodedEvent]:
+    queryset = CallEvent.objects.filter(id__gt=after_id).order_by('id').values_list('id', 'type', 'data')[:limit]
+    return [(event_id, encode_event(event_id, event_type, data)) async for event_id, event_type, data in queryset]
+
+
+async def latest_event_id() -> int:
+    return await CallEvent.objects.order_by('-id').values_list('id', flat=True).afirst() or 0
+
+
+async def oldest_event_id() -> Optional[int]:
+    return await CallEvent.objects.order_by('id').values_list('id', flat=True).afirst()
+
+
+class CallEventHub:
+    """
+    Fans events out to the subscribers on one event loop. The buffer holds
+    the events after `_floor` up to `_last_id`; subscribers behind the floor
+    are replayed from the database.
+    """
+
+    def __init__(self):
+        self._buffer = deque(maxlen=settings.CALL_EVENTS_BUFFER_SIZE)
+        self._floor = None
+        self._last_id = None
+        self._changed = asyncio.Event()
+        self._wake = asyncio.Event()
+        self._subscribers = 0
+        self._poller = None
+
+    def wake(self):
+        self._wake.set()
+
+    async def _start(self):
+        if self._poller is not None and not self._poller.done():
+            return
+        # First subscriber since the hub was created or went idle: nothing was
+        # polled meanwhile, so start again from the latest event
+        last_id = await latest_event_id()
+        if self._poller is None or self._poller.done():
+            self._buffer.clear()
+            self._last_id = self._floor = last_id
+            self._poller = asyncio.create_task(self._poll())
+
+    async def _poll(self):
+        # Runs while anyone is subscribed; the next subscriber restarts it
+        while self._subscribers:
+            try:
+                await asyncio.wait_for(self._wake.wait(), settings.CALL_EVENTS_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                events = await fetch_events(self._last_id, settings.CALL_EVENTS_BUFFER_SIZE)
+            except Exception as e:
+                logger.error(f"Error reading call events: {str(e)}")
+                continue
+            if not events:
+                continue
+
+            for event in events:
+                if len(self._buffer) == self._buffer.maxlen:
+                    self._floor = self._buffer[0][0]
+                self._buffer.append(event)
+            self._last_id = events[-1][0]
+
+            changed, self._changed = self._changed, asyncio.Event()
+            changed.set()
+            if len(events) == settings.CALL_EVENTS_BUFFER_SIZE:
+                # More are waiting
+                self._wake.set()
+
+    def _since(self, cursor: int) -> Optional[List[EncodedEvent]]:
+        """Buffered events after `cursor`, or None if the buffer doesn't reach back that far"""
+        if cursor < self._floor:
+            return None
+        events = []
+        for event in reversed(self._buffer):
+            if event[0] <= cursor:
+                break
+            events.append(event)
+        events.reverse()
+        return events
+
+    async def _replay(self, cursor: int) -> Optional[List[EncodedEvent]]:
+        """
+        Events after `cursor` from the database, or None if some of them
+        were already purged (or there are too many to replay).
+        """
+        oldest = await oldest_event_id()
+        if oldest is not None and cursor < oldest - 1:
+            return None
+        events = await fetch_events(cursor, settings.CALL_EVENTS_BUFFER_SIZE)
+        if len(events) == settings.CALL_EVENTS_BUFFER_SIZE:
+            return None
+        return events
+
+    async def subscribe(self, last_event_id: Optional[int] = None):
+        """
+        Yield SSE message bytes: events after `last_event_id` (or from now on),
+        a heartbeat comment every CALL_EVENTS_HEARTBEAT_INTERVAL seconds
+        without events, and a `reset` event when the missed events can't be
+        replayed, telling the client to reload the calls list.
+        """
+        self._subscribers += 1
+        metrics.increment('call_events.subscriptions')
+        try:
+            await self._start()
+            cursor = self._last_id if last_event_id is None else last_event_id
+            yield f"retry: {SSE_RETRY_MS}\n\n".encode('ascii')
+
+            if cursor > self._last_id:
+                # An ID this database never issued
+                cursor = self._last_id
+                yield encode_event(cursor, 'reset', '{}')
+
+            while True:
+                changed = self._changed
+                events = self._since(cursor)
+                if events is None:
+                    events = await self._replay(cursor)
+                    metrics.increment('call_events.replays')
+                if events is None:
+                    cursor = self._last_id
+                    yield encode_event(cursor, 'reset', '{}')
+                    continue
+
+                if events:
+                    cursor = events[-1][0]
+                    yield b"".join(message for _, message in events)
+                    continue
+
+                try:
+                    await asyncio.wait_for(changed.wait(), settings.CALL_EVENTS_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+        finally:
+            self._subscribers -= 1
+
+
+def get_call_event_hub() -> CallEventHub:
+    """Get the CallEventHub for the running event loop."""
+    loop = asyncio.get_running_loop()
+    hub = hubs.get(loop)
+    if hub is None:
+        hub = CallEventHub()
+        hubs[loop] = hub
+    return hub
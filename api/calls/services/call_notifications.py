@@ -0,0 +1,309 @@
+import functools
+import itertools
+import logging
+import uuid
+from collections import defaultdict
+from datetime import timedelta, timezone as dt_timezone, tzinfo
+from html import escape
+from typing import Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.db.models import Min, Q
+from django.urls import reverse
+from django.utils import timezone as django_timezone
+
+from api import settings
+from api.calls.models import DigestEntry
+from api.calls.schemas import CallData
+from api.calls.services.email_templates import (
+    CALL_HTML, CALL_SECTION_HTML, CALL_SECTION_PLAIN, CALLER_NAME_HTML, CALLER_NAME_PLAIN, DIGEST_HTML,
+    DIGEST_SECTION_HTML, DIGEST_SECTION_PLAIN, DIGEST_SEPARATOR_PLAIN, TRUNCATED_ID_HTML, TRUNCATED_ID_PLAIN,
+    TRUNCATED_LINK_HTML, TRUNCATED_LINK_PLAIN
+)
+from api.calls.services.transcripts import render_transcript
+from api.email_service import send_email
+
+logger = logging.getLogger(__name__)
+
+# Claimed digest entries not sent within this time are claimed again
+DIGEST_CLAIM_TIMEOUT = timedelta(minutes=10)
+
+# Turns rendered at a time when capping transcripts for emails
+TRANSCRIPT_RENDER_CHUNK_TURNS = 100
+
+
+@functools.lru_cache(maxsize=None)
+def get_zone(name: str) -> tzinfo:
+    """
+    Cached ZoneInfo for a time zone name, falling back to EMAIL_DEFAULT_TIMEZONE,
+    or to UTC when that is not a known time zone either
+    """
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        if name == settings.EMAIL_DEFAULT_TIMEZONE:
+            logger.error(f"Unknown EMAIL_DEFAULT_TIMEZONE {name!r}, using UTC")
+            return dt_timezone.utc
+        logger.error(f"Unknown time zone {name!r}, using {settings.EMAIL_DEFAULT_TIMEZONE}")
+        return get_zone(settings.EMAIL_DEFAULT_TIMEZONE)
+
+
+def get_recipient_timezone(recipient: str) -> str:
+    """Display time zone name for a summary recipient"""
+    return settings.EMAIL_RECIPIENT_TIMEZONES.get(recipient.lower(), settings.EMAIL_DEFAULT_TIMEZONE)
+
+
+def get_call_url(doc_id: str) -> str:
+    """Public link to a call, or "" when CALL_LINK_BASE_URL is not set"""
+    if not settings.CALL_LINK_BASE_URL:
+        return ""
+    return settings.CALL_LINK_BASE_URL.rstrip('/') + reverse('calls:call-detail', args=[doc_id])
+
+
+def cap_transcript(turns) -> Tuple[str, bool]:
+    """
+    Render transcript text, cut to EMAIL_TRANSCRIPT_MAX_CHARS.
+    Returns (text, truncated). Turns are rendered in chunks, so rendering
+    stops soon after the cap instead of building the whole transcript.
+    """
+    max_chars = settings.EMAIL_TRANSCRIPT_MAX_CHARS
+    if not max_chars:
+        return render_transcript(turns), False
+
+    turns = iter(turns)
+    chunks, size = [], 0
+    while chunk := render_transcript(itertools.islice(turns, TRANSCRIPT_RENDER_CHUNK_TURNS)):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_chars:
+            return "".join(chunks)[:max_chars], True
+    return "".join(chunks), False
+
+
+def format_call_details(call_data: CallData, timezone=None):
+    """Format the display fields of a call (phone, dates, duration) for emails"""
+
+    # Format phone number for subject
+    phone_display = call_data.phone_number
+    if phone_display and len(phone_display) == 11 and phone_display.startswith('1'):
+        # Format US number: +1XXXXXXXXXX -> (XXX) XXX-XXXX
+        phone_display = f"({phone_display[1:4]}) {phone_display[4:7]}-{phone_display[7:]}"
+    elif phone_display and len(phone_display) == 10:
+        # Format US number: XXXXXXXXXX -> (XXX) XXX-XXXX
+        phone_display = f"({phone_display[:3]}) {phone_display[3:6]}-{phone_display[6:]}"
+
+    # Convert UTC datetime to the display time zone (assume UTC if naive)
+    date_str = ""
+    formatted_date = ""
+    if call_data.started_at:
+        started_at = call_data.started_at
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=dt_timezone.utc)
+        display_datetime = started_at.astimezone(get_zone(timezone or settings.EMAIL_DEFAULT_TIMEZONE))
+
+        # MM/DD for the subject; %Z gives the abbreviation in effect (EST or EDT)
+        date_str = display_datetime.strftime("%m/%d")
+        formatted_date = display_datetime.strftime("%B %d, %Y at %I:%M %p (%Z)")
+
+    # Calculate duration
+    duration_str = "Unknown"
+    if call_data.started_at and call_data.ended_at:
+        duration_seconds = (call_data.ended_at - call_data.started_at).total_seconds()
+        minutes = int(duration_seconds // 60)
+        seconds = int(duration_seconds % 60)
+        if minutes > 0:
+            duration_str = f"{minutes}m {seconds}s"
+        else:
+            duration_str = f"{seconds}s"
+
+    return {
+        'phone_display': phone_display,
+        'date_str': date_str,
+        'formatted_date': formatted_date,
+        'duration_str': duration_str,
+    }
+
+
+def call_context(call_data: CallData, doc_id: str, timezone=None):
+    """Template context for one call"""
+    transcript, truncated = cap_transcript(call_data.transcript)
+    return {
+        **format_call_details(call_data, timezone),
+        'doc_id': doc_id,
+        'phone_number': call_data.phone_number,
+        'caller_name': (call_data.caller_name or '').strip(),
+        'summary': call_data.summary,
+        'transcript': transcript,
+        'transcript_truncated': truncated,
+        'url': get_call_url(doc_id) if truncated else "",
+    }
+
+
+def format_call_section_plain(call: dict):
+    """Render the plain text details, summary and transcript for one call"""
+    caller_name = CALLER_NAME_PLAIN.format(caller_name=call['caller_name']) if call['caller_name'] else ""
+
+    transcript_note = ""
+    if call['transcript_truncated']:
+        if call['url']:
+            transcript_note = TRUNCATED_LINK_PLAIN.format(url=call['url'])
+        else:
+            transcript_note = TRUNCATED_ID_PLAIN.format(doc_id=call['doc_id'])
+
+    return CALL_SECTION_PLAIN.format(
+        phone_number=call['phone_number'],
+        caller_name=caller_name,
+        formatted_date=call['formatted_date'],
+        duration_str=call['duration_str'],
+        summary=call['summary'],
+        transcript=call['transcript'],
+        transcript_note=transcript_note
+    )
+
+
+def format_call_section_html(call: dict):
+    """Render the HTML details, summary and transcript blocks for one call, escaping every value"""
+    caller_name = CALLER_NAME_HTML.format(caller_name=escape(call['caller_name'])) if call['caller_name'] else ""
+
+    transcript_note = ""
+    if call['transcript_truncated']:
+        if call['url']:
+            transcript_note = TRUNCATED_LINK_HTML.format(url=escape(call['url']))
+        else:
+            transcript_note = TRUNCATED_ID_HTML.format(doc_id=escape(call['doc_id']))
+
+    return CALL_SECTION_HTML.format(
+        phone_number=escape(call['phone_number']),
+        caller_name=caller_name,
+        formatted_date=escape(call['formatted_date']),
+        duration_str=escape(call['duration_str']),
+        summary=escape(call['summary']),
+        transcript=escape(call['transcript']),
+        transcript_note=transcript_note
+    )
+
+
+def format_call_email(call_data: CallData, doc_id: str, timezone=None):
+    """Format call data into email subject, plain text body and HTML body"""
+    call = call_context(call_data, doc_id, timezone)
+    subject = f"[{call['date_str']} Call from {call['phone_display']}]"
+    plain_body = format_call_section_plain(call)
+    html_body = CALL_HTML.format(section=format_call_section_html(call))
+
+    return subject, plain_body, html_body
+
+
+def format_digest_email(calls, timezone=None):
+    """Format several (call_data, doc_id) pairs into one digest email subject and body"""
+    contexts = [call_context(call_data, doc_id, timezone) for call_data, doc_id in calls]
+
+    date_strs = sorted({call['date_str'] for call in contexts if call['date_str']})
+    # Calls without a start time have no date, like single call subjects
+    date_range = f"{date_strs[0]}-{date_strs[-1]}" if len(date_strs) > 1 else "".join(date_strs)
+    subject = f"[{date_range} Call Digest: {len(calls)} call{'s' if len(calls) != 1 else ''}]"
+
+    plain_body = DIGEST_SEPARATOR_PLAIN.join(
+        DIGEST_SECTION_PLAIN.format(index=index, count=len(contexts), section=format_call_section_plain(call))
+        for index, call in enumerate(contexts, start=1)
+    )
+
+    html_sections = "".join(
+        DIGEST_SECTION_HTML.format(
+            index=index,
+            count=len(contexts),
+            phone_display=escape(call['phone_display']),
+            section=format_call_section_html(call)
+        )
+        for index, call in enumerate(contexts, start=1)
+    )
+    html_body = DIGEST_HTML.format(sections=html_sections)
+
+    return subject, plain_body, html_body
+
+
+def is_urgent_call(call_data: CallData):
+    """Whether a call should bypass the digest (mentions an urgent keyword)"""
+    texts = itertools.chain([call_data.summary], (turn.message for turn in call_data.transcript))
+    return any(
+        keyword in text.lower()
+        for text in texts
+        for keyword in settings.EMAIL_DIGEST_URGENT_KEYWORDS
+    )
+
+
+def send_call_notification(call_data: CallData, doc_id: str):
+    """
+    Notify every summary recipient about a saved call.
+    In digest mode non-urgent calls are stored for the next digest instead of
+    being emailed one by one.
+    """
+    if settings.EMAIL_DIGEST_ENABLED and not is_urgent_call(call_data):
+        for recipient in settings.EMAIL_SUMMARY_RECIPIENTS:
+            # A retried notification must not add the call twice
+            _, created = DigestEntry.objects.get_or_create(
+                recipient=recipient,
+                call_id=doc_id,
+                defaults={'call_json': call_data.model_dump_json()}
+            )
+            if created:
+                logger.info(f"Added call {doc_id} to digest for {recipient}")
+
+            # Entries claimed by a flush in progress are already on their way
+            if DigestEntry.objects.filter(recipient=recipient, claim_token="").count() >= settings.EMAIL_DIGEST_MAX_CALLS:
+                flush_digest(recipient)
+        return
+
+    # Render once per display time zone and send to everyone using it
+    recipients_by_timezone = defaultdict(list)
+    for recipient in settings.EMAIL_SUMMARY_RECIPIENTS:
+        recipients_by_timezone[get_recipient_timezone(recipient)].append(recipient)
+
+    for timezone, recipients in recipients_by_timezone.items():
+        subject, plain_body, html_body = format_call_email(call_data, doc_id, timezone)
+        for recipient in recipients:
+            send_email(recipient, subject, plain_body, html_body)
+
+
+def flush_digest(recipient: str):
+    """
+    Send one digest email with every pending call for a recipient.
+    Entries are claimed with a token first so concurrent flushes never send the
+    same call twice; entries are deleted once the email is handed to the mailer.
+    Returns the number of calls sent.
+    """
+    now = django_timezone.now()
+    claim_token = uuid.uuid4().hex
+
+    claimed = DigestEntry.objects.filter(
+        Q(claim_token="") | Q(claimed_at__lt=now - DIGEST_CLAIM_TIMEOUT),
+        recipient=recipient
+    ).update(claim_token=claim_token, claimed_at=now)
+
+    if not claimed:
+        return 0
+
+    entries = list(DigestEntry.objects.filter(claim_token=claim_token))
+    calls = [(CallData.model_validate_json(entry.call_json), entry.call_id) for entry in entries]
+
+    subject, plain_body, html_body = format_digest_email(calls, get_recipient_timezone(recipient))
+    send_email(recipient, subject, plain_body, html_body)
+
+    DigestEntry.objects.filter(claim_token=claim_token).delete()
+    logger.info(f"Sent digest of {len(calls)} calls to {recipient}")
+    return len(calls)
+
+
+def flush_due_digests():
+    """
+    Send digests whose oldest pending call has waited EMAIL_DIGEST_WINDOW_SECONDS.
+    Called periodically by the webhook queue worker.
+    """
+    window_start = django_timezone.now() - timedelta(seconds=settings.EMAIL_DIGEST_WINDOW_SECONDS)
+    due_recipients = (
+        DigestEntry.objects.values('recipient')
+        .annotate(oldest=Min('created_at'))
+        .filter(oldest__lte=window_start)
+        .values_list('recipient', flat=True)
+    )
+
+    return sum(flush_digest(recipient) for recipient in list(due_recipients))
@@ -0,0 +1,193 @@
+"""
+Full-text search over calls, backed by the calls_call_search SQLite FTS5 index
+of CallSearchDocument rows (see migration 0006).
+
+Calls are indexed when their webhook is ingested; `manage.py
+rebuild_call_search` indexes calls stored before that.
+"""
+
+import html
+import logging
+import re
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.db import connection
+
+from api.calls.models import CallSearchDocument
+from api.calls.repositories.base import as_utc
+from api.calls.schemas import CallData
+from api.calls.services.transcripts import render_transcript
+
+logger = logging.getLogger(__name__)
+
+# bm25 weights of the indexed columns: caller_name, phone_digits, summary, transcript
+COLUMN_WEIGHTS = (5.0, 5.0, 2.0, 1.0)
+
+# Tokens around each match in a snippet
+SNIPPET_TOKENS = 16
+
+# Match markers in snippets, replaced by <mark> after HTML escaping
+MATCH_START = '\x02'
+MATCH_END = '\x03'
+
+WORD_PATTERN = re.compile(r'\w+')
+PHONE_QUERY_PATTERN = re.compile(r'^[\d\s()+.\-]+$')
+
+SEARCH_SQL = f"""
+    SELECT calls_call_search.rowid,
+           snippet(calls_call_search, -1, char(2), char(3), '…', {SNIPPET_TOKENS}),
+           bm25(calls_call_search, {', '.join(str(weight) for weight in COLUMN_WEIGHTS)}) AS score
+    FROM calls_call_search
+    JOIN calls_callsearchdocument document ON document.id = calls_call_search.rowid
+    WHERE calls_call_search MATCH %s
+    {{filters}}
+    ORDER BY score
+    LIMIT %s OFFSET %s
+"""
+
+
+def phone_tokens(phone_number: str) -> str:
+    """
+    The digits of a phone number plus their last 10, 7 and 4 digits, so a
+    number matches whether it's searched with or without country or area code
+    """
+    digits = re.sub(r'\D', '', phone_number or '')
+    if not digits:
+        return ''
+    return ' '.join(dict.fromkeys(digits[-length:] for length in (len(digits), 10, 7, 4)))
+
+
+def phone_query_digits(text: str) -> Optional[str]:
+    """The digits of a query that looks like a phone number (at least 4), or None"""
+    text = text.strip()
+    digits = re.sub(r'\D', '', text)
+    if PHONE_QUERY_PATTERN.match(text) and len(digits) >= 4:
+        return digits
+    return None
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """
+    Turn what a user typed into an FTS5 query. Every word must match
+    (stemmed), and the last word may be incomplete. Something that looks like
+    a phone number, in any punctuation, also matches the phone column by digit
+    prefix, so "1500" finds both a phone number and a price.
+    Returns None if there is nothing to search for.
+    """
+    words = WORD_PATTERN.findall(text)
+    if not words:
+        return None
+    # Quoted, so words like AND/NEAR and column names are taken literally
+    text_query = ' '.join(f'"{word}"' for word in words) + '*'
+
+    digits = phone_query_digits(text)
+    if digits is not None:
+        return f'phone_digits : "{digits}"* OR ({text_query})'
+    return text_query
+
+
+def snippet_html(snippet: str) -> str:
+    return html.escape(snippet).replace(MATCH_START, '<mark>').replace(MATCH_END, '</mark>')
+
+
+def search_document(call_id: str, call: CallData) -> dict:
+    return {
+        'call_id': call_id,
+        'caller_name': call.caller_name or '',
+        'phone_number': call.phone_number or '',
+        'phone_digits': phone_tokens(call.phone_number),
+        'summary': call.summary or '',
+        'transcript': render_transcript(call.transcript),
+        'created_at': as_utc(call.created_at),
+    }
+
+
+async def index_call(call_id: str, call: CallData):
+    """
+    Add a call to the search index, or refresh it. Errors are logged, not
+    raised: the call itself is already stored, and rebuild_call_search can
+    index it later.
+    """
+    document = search_document(call_id, call)
+    try:
+        await CallSearchDocument.objects.aupdate_or_create(call_id=call_id, defaults=document)
+    except Exception as e:
+        logger.error(f"Error indexing call {call_id} for search: {str(e)}", exc_info=True)
+
+
+def index_calls(calls: Iterable[Tuple[str, CallData]]) -> int:
+    """Add or refresh many calls in one statement. Returns how many."""
+    documents = [CallSearchDocument(**search_document(call_id, call)) for call_id, call in calls]
+    CallSearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=['call_id'],
+        update_fields=['caller_name', 'phone_number', 'phone_digits', 'summary', 'transcript', 'created_at']
+    )
+    return len(documents)
+
+
+def _search(match_query: str, phone_digits: Optional[str], limit: int, offset: int,
+            created_after: Optional[datetime], created_before: Optional[datetime]) -> List[dict]:
+    filters = []
+    params = [match_query]
+    if created_after is not None:
+        filters.append("AND document.created_at >= %s")
+        params.append(connection.ops.adapt_datetimefield_value(created_after))
+    if created_before is not None:
+        filters.append("AND document.created_at < %s")
+        params.append(connection.ops.adapt_datetimefield_value(created_before))
+    params.extend([limit, offset])
+
+    with connection.cursor() as cursor:
+        cursor.execute(SEARCH_SQL.format(filters=' '.join(filters)), params)
+        hits = cursor.fetchall()
+
+    documents = CallSearchDocument.objects.only(
+        'call_id', 'caller_name', 'phone_number', 'phone_digits', 'summary', 'created_at'
+    ).in_bulk([rowid for rowid, _, _ in hits])
+
+    results = []
+    for rowid, snippet, score in hits:
+        document = documents.get(rowid)
+        if document is None:
+            # Deleted since the index was read
+            continue
+        # The phone column holds digit tokens; show the number as stored instead
+        if phone_digits and any(token.startswith(phone_digits) for token in document.phone_digits.split()):
+            snippet = f'<mark>{html.escape(document.phone_number)}</mark>'
+        else:
+            snippet = snippet_html(snippet)
+        results.append({
+            'id': document.call_id,
+            'caller_name': document.caller_name,
+            'phone_number': document.phone_number,
+            'summary': document.summary,
+            'created_at': document.created_at,
+            'snippet': snippet,
+            # bm25 is lower for better matches; flip it so higher is better
+            'score': round(-score, 4),
+        })
+    return results
+
+
+async def search_calls(text: str, limit: int = 20, offset: int = 0,
+                       created_after: Optional[datetime] = None, created_before: Optional[datetime] = None):
+    """
+    Search calls by caller name, phone number, summary and transcript.
+    Returns a tuple of (hits, next_offset), best match first; each hit has the
+    call's list fields plus an HTML `snippet` with matches in <mark>.
+    next_offset is None on the last page.
+    """
+    match_query = build_match_query(text)
+    if match_query is None:
+        return [], None
+
+    # One extra hit to know whether another page exists
+    hits = await sync_to_async(_search)(
+        match_query, phone_query_digits(text), limit + 1, offset, as_utc(created_after), as_utc(created_before)
+    )
+    next_offset = offset + limit if len(hits) > limit else None
+    return hits[:limit], next_offset
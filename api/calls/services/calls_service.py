@@ -1,46 +1,213 @@
+import base64
+import hashlib
+import json
 import logging
+import time
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 
-from api.database import get_calls_collection
+from django.core.cache import caches
+from django.utils.http import quote_etag
+
+from api.calls.models import CallEvent
+from api.calls.repositories import CallNotFound, get_call_repository
+from api.calls.repositories.base import ListPosition
+from api.calls.schemas import CallData
+from api.calls.services.call_events import publish_call_event, publish_call_events
+from api.renderers import dumps
 
 logger = logging.getLogger(__name__)
 
+CALLS_LIST_GENERATION_KEY = 'calls:list:generation'
+
+# The list leaves out the transcript, by far the largest field; it is served
+# by the call detail endpoint instead
+DEFAULT_LIST_FIELDS = tuple(field for field in CallData.model_fields if field != 'transcript')
+
+
+# Documents read per query when streaming every call
+EXPORT_PAGE_SIZE = 500
 
-def get_all_calls():
+
+def get_list_fields(fields: Optional[Sequence[str]] = None) -> Tuple[str, ...]:
     """
-    Fetch all calls from Firebase Firestore.
-    Returns a list of call documents as dictionaries.
+    Normalize a requested field list for projection and cache keys.
+    created_at is always included since cursors are built from it.
     """
-    calls_collection = get_calls_collection()
-    docs = calls_collection.stream()
+    return tuple(sorted(set(fields or DEFAULT_LIST_FIELDS) | {'created_at'}))
 
-    calls_list = []
-    for doc in docs:
-        call_data = doc.to_dict()
-        call_data['id'] = doc.id  # Include document ID
-        calls_list.append(call_data)
 
-    return calls_list
+def encode_cursor(created_at: datetime, doc_id: str) -> str:
+    """
+    Encode the position of the last call on a page into an opaque cursor string.
+    """
+    payload = json.dumps({'created_at': created_at.isoformat(), 'id': doc_id})
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
 
 
-def update_call_response_status(call_id: str, did_respond: bool):
+def decode_cursor(cursor: str) -> ListPosition:
     """
-    Update the did_respond field for a specific call by ID.
+    Decode a cursor string into the (created_at, id) list position it encodes.
+    Raises ValueError if the cursor is malformed.
     """
-    logger.info(f"Marking {call_id} with did_respond: {did_respond}")
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return datetime.fromisoformat(payload['created_at']), payload['id']
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+async def get_calls_page(limit: int, cursor: Optional[str] = None, fields: Optional[Sequence[str]] = None):
+    """
+    Fetch one page of calls from the call repository, newest first.
+    Keyset pagination on (created_at, call ID), so each page is a single bounded query.
+    Only `fields` (default DEFAULT_LIST_FIELDS) are read.
+    Returns a tuple of (calls_list, next_cursor); next_cursor is None on the last page.
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    # Fetch one extra call to know whether another page exists
+    calls = await get_call_repository().list(limit + 1, after, get_list_fields(fields))
+    calls_list = calls[:limit]
+
+    next_cursor = None
+    if len(calls) > limit:
+        last_call = calls_list[-1]
+        next_cursor = encode_cursor(last_call['created_at'], last_call['id'])
 
-    calls_collection = get_calls_collection()
-    doc_ref = calls_collection.document(call_id)
+    return calls_list, next_cursor
 
-    # First check if the document exists
-    doc = doc_ref.get()
-    if not doc.exists:
-        logger.error(f"Document with ID {call_id} does not exist")
+
+async def iter_calls(fields: Optional[Sequence[str]] = None):
+    """
+    Yield every call, newest first, as they are read from the call repository.
+    Reads EXPORT_PAGE_SIZE calls per query so no single query runs into
+    the RPC deadline; only the current page is held in memory.
+    """
+    async for call_data in get_call_repository().iter_all(get_list_fields(fields), page_size=EXPORT_PAGE_SIZE):
+        yield call_data
+
+
+async def get_call(call_id: str) -> dict:
+    """
+    Fetch a single call with every field, including the transcript.
+    Raises ValueError if the call does not exist.
+    """
+    call_data = await get_call_repository().get(call_id)
+    if call_data is None:
         raise ValueError(f"Call with ID {call_id} not found")
+    return call_data
+
+
+def get_calls_cache():
+    """Get the cache backend used for the calls list (see CACHES['calls'])."""
+    return caches['calls']
+
+
+async def _calls_page_cache_key(limit: int, cursor: Optional[str], fields: Optional[Sequence[str]]) -> str:
+    """
+    Build the cache key for a list page. Keys embed the current generation so
+    that bumping it invalidates every cached page at once, in any backend.
+    """
+    cache = get_calls_cache()
+    generation = await cache.aget_or_set(CALLS_LIST_GENERATION_KEY, time.time_ns, timeout=None)
+    return f"calls:list:{generation}:{limit}:{cursor or ''}:{','.join(get_list_fields(fields))}"
+
+
+def _compute_etag(calls_list, next_cursor) -> str:
+    """Strong ETag over the serialized page content."""
+    payload = dumps({'results': calls_list, 'next': next_cursor}, sort_keys=True)
+    return quote_etag(hashlib.sha1(payload).hexdigest())
 
+
+async def get_cached_calls_page_etag(
+        limit: int, cursor: Optional[str] = None, fields: Optional[Sequence[str]] = None):
+    """
+    Return the ETag of a cached list page without touching the call repository,
+    or None if the page is not cached.
+    """
+    cached_page = await get_calls_cache().aget(await _calls_page_cache_key(limit, cursor, fields))
+    return cached_page['etag'] if cached_page else None
+
+
+async def get_calls_page_cached(
+        limit: int, cursor: Optional[str] = None, fields: Optional[Sequence[str]] = None):
+    """
+    Read-through cache in front of get_calls_page.
+    Returns a tuple of (calls_list, next_cursor, etag).
+    """
+    cache = get_calls_cache()
+    cache_key = await _calls_page_cache_key(limit, cursor, fields)
+
+    cached_page = await cache.aget(cache_key)
+    if cached_page is not None:
+        return cached_page['calls'], cached_page['next'], cached_page['etag']
+
+    calls_list, next_cursor = await get_calls_page(limit, cursor, fields)
+    etag = _compute_etag(calls_list, next_cursor)
+    await cache.aset(cache_key, {'calls': calls_list, 'next': next_cursor, 'etag': etag})
+
+    return calls_list, next_cursor, etag
+
+
+async def invalidate_calls_cache():
+    """
+    Invalidate every cached calls list page.
+    Called by the write paths (webhook ingest, call edits).
+    """
+    cache = get_calls_cache()
     try:
-        doc_ref.update({'did_respond': did_respond})
-        return {'id': call_id, 'did_respond': did_respond}
+        await cache.aincr(CALLS_LIST_GENERATION_KEY)
+    except ValueError:
+        # Generation key missing (never set or evicted), restart from a
+        # timestamp so it can't collide with pages cached under an old value
+        await cache.aset(CALLS_LIST_GENERATION_KEY, time.time_ns(), timeout=None)
+
 
+async def update_call_response_status(call_id: str, did_respond: bool):
+    """
+    Update the did_respond field for a specific call by ID.
+    The update requires the call to exist, so this is a single round trip.
+    """
+    logger.info(f"Marking {call_id} with did_respond: {did_respond}")
+
+    try:
+        await get_call_repository().update(call_id, {'did_respond': did_respond})
+    except CallNotFound:
+        logger.error(f"Call with ID {call_id} does not exist")
+        raise ValueError(f"Call with ID {call_id} not found")
     except Exception as e:
         logger.error(f"Error updating call {call_id}: {str(e)}")
         raise
+
+    await invalidate_calls_cache()
+    await publish_call_event(CallEvent.Type.UPDATED, call_id, {'id': call_id, 'did_respond': did_respond})
+    return {'id': call_id, 'did_respond': did_respond}
+
+
+async def bulk_update_call_response_status(call_ids: List[str], did_respond: bool):
+    """
+    Update the did_respond field for many calls in one bulk write
+    (see CallRepository.bulk_update).
+    Returns the updated and not found call IDs.
+    """
+    call_ids = list(dict.fromkeys(call_ids))
+    logger.info(f"Marking {len(call_ids)} calls with did_respond: {did_respond}")
+
+    not_found = set(await get_call_repository().bulk_update(call_ids, {'did_respond': did_respond}))
+    if not_found:
+        logger.warning(f"Calls not found for bulk update: {sorted(not_found)}")
+
+    updated = [call_id for call_id in call_ids if call_id not in not_found]
+    if updated:
+        await invalidate_calls_cache()
+        await publish_call_events(
+            CallEvent.Type.UPDATED,
+            [(call_id, {'id': call_id, 'did_respond': did_respond}) for call_id in updated]
+        )
+
+    return {
+        'updated': updated,
+        'not_found': [call_id for call_id in call_ids if call_id in not_found],
+        'did_respond': did_respond
+    }
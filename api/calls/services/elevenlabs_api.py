@@ -1,21 +1,108 @@
-import requests
+import asyncio
+import logging
+import random
+import weakref
+
+import httpx
 
 from api import settings
 
-ELEVENLABS_HEADERS = {"xi-api-key": settings.ELEVENLABS_API_KEY}
+logger = logging.getLogger(__name__)
+
+ELEVENLABS_HEADERS = {"xi-api-key": settings.ELEVENLABS_API_KEY or ""}
+
+# Upstream statuses worth retrying on an idempotent GET
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
+AUDIO_CHUNK_SIZE = 64 * 1024
 
-def stream_conversation_audio(conversation_id):
+# Async HTTP clients, one per event loop (connection pools are bound to the
+# loop that created them)
+http_clients = weakref.WeakKeyDictionary()
+
+
+def get_http_client():
     """
-    Stream audio from ElevenLabs API for a given conversation ID.
-    Returns a requests Response object with stream=True for proxying.
+    Get the ElevenLabs AsyncClient for the running event loop.
+    The client keeps a bounded pool of keep-alive connections so playbacks reuse
+    the TLS session, and every request has connect/read timeouts.
+    """
+    loop = asyncio.get_running_loop()
+    client = http_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url=settings.ELEVENLABS_BASE_URL,
+            headers=ELEVENLABS_HEADERS,
+            timeout=httpx.Timeout(
+                settings.ELEVENLABS_READ_TIMEOUT,
+                connect=settings.ELEVENLABS_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.ELEVENLABS_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.ELEVENLABS_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.ELEVENLABS_KEEPALIVE_EXPIRY
+            )
+        )
+        http_clients[loop] = client
+    return client
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given (0-based) retry attempt."""
+    return settings.ELEVENLABS_RETRY_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+async def send_with_retries(request: httpx.Request) -> httpx.Response:
     """
-    conversation_audio_url = f"{settings.ELEVENLABS_BASE_URL}/v1/convai/conversations/{conversation_id}/audio"
+    Send an idempotent request with bounded retries and backoff.
+    Retries transport errors (connect failures, timeouts) and retryable statuses
+    until ELEVENLABS_MAX_RETRIES is used up; the last response or error is returned/raised.
+    The response body is not read, so the caller must aclose() it.
+    """
+    client = get_http_client()
+
+    for attempt in range(settings.ELEVENLABS_MAX_RETRIES + 1):
+        is_last_attempt = attempt == settings.ELEVENLABS_MAX_RETRIES
+        try:
+            response = await client.send(request, stream=True)
+        except httpx.TransportError as e:
+            if is_last_attempt:
+                raise
+            logger.warning(f"ElevenLabs request {request.url} failed ({e!r}), retrying")
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES or is_last_attempt:
+                return response
+            logger.warning(f"ElevenLabs request {request.url} returned {response.status_code}, retrying")
+            await response.aclose()
+
+        await asyncio.sleep(_retry_delay(attempt))
 
-    response = requests.get(
-        conversation_audio_url,
-        headers=ELEVENLABS_HEADERS,
-        stream=True
+
+async def stream_conversation_audio(conversation_id, headers=None):
+    """
+    Stream audio from ElevenLabs API for a given conversation ID.
+    Extra headers (e.g. Range) are forwarded upstream.
+    Returns an httpx Response with an unread body for proxying; the caller must
+    consume it with iter_audio() or aclose() it.
+    """
+    client = get_http_client()
+    request = client.build_request(
+        "GET",
+        f"/v1/convai/conversations/{conversation_id}/audio",
+        headers=headers
     )
 
-    return response
+    return await send_with_retries(request)
+
+
+async def iter_audio(response: httpx.Response, chunk_size: int = AUDIO_CHUNK_SIZE):
+    """
+    Async iterator over an upstream audio body that releases the pooled
+    connection when the iteration finishes or the client disconnects.
+    """
+    try:
+        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+            if chunk:
+                yield chunk
+    finally:
+        await response.aclose()
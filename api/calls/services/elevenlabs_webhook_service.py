@@ -1,173 +1,175 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
-import pytz
-from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from django.db.models import Q
+from django.utils import timezone
 
 from api import settings
-from api.calls.schemas import CallData
-from api.database import get_calls_collection
-from api.email_service import send_email
+from api.calls.models import CallEvent, CallIngest
+from api.calls.repositories import CallAlreadyExists, get_call_repository
+from api.calls.schemas import CallData, ElevenLabsWebhookPayload
+from api.calls.services.call_events import call_event_data, publish_call_event
+from api.calls.services.call_notifications import send_call_notification
+from api.calls.services.call_search import index_call
+from api.calls.services.calls_service import invalidate_calls_cache
+from api.calls.services.recording_prefetch import schedule_recording_prefetch
+from api.calls.services.webhook_dedup import record_duplicate_delivery, remember_delivery
 
 logger = logging.getLogger(__name__)
 
 
-def format_call_email(call_data: CallData, doc_id: str, timezone='US/Eastern'):
-    """Format call data into email subject and body"""
-
-    # Format phone number for subject
-    phone_display = call_data.phone_number
-    if phone_display and len(phone_display) == 11 and phone_display.startswith('1'):
-        # Format US number: +1XXXXXXXXXX -> (XXX) XXX-XXXX
-        phone_display = f"({phone_display[1:4]}) {phone_display[4:7]}-{phone_display[7:]}"
-    elif phone_display and len(phone_display) == 10:
-        # Format US number: XXXXXXXXXX -> (XXX) XXX-XXXX
-        phone_display = f"({phone_display[:3]}) {phone_display[3:6]}-{phone_display[6:]}"
-
-    # Convert UTC datetime to specified timezone for display
-    display_datetime = None
-    if call_data.started_at:
-        # Ensure datetime is timezone-aware (assume UTC if naive)
-        if call_data.started_at.tzinfo is None:
-            utc_datetime = pytz.UTC.localize(call_data.started_at)
-        else:
-            utc_datetime = call_data.started_at.astimezone(pytz.UTC)
-
-        # Convert to display timezone
-        target_tz = pytz.timezone(timezone)
-        display_datetime = utc_datetime.astimezone(target_tz)
-
-    # Format date for subject (MM/DD)
-    date_str = ""
-    if display_datetime:
-        date_str = display_datetime.strftime("%m/%d")
-
-    # Create subject
-    subject = f"[{date_str} Call from {phone_display}]"
-
-    # Format date and time for body with timezone indicator
-    formatted_date = ""
-    if display_datetime:
-        tz_abbr = "EST" if timezone == 'US/Eastern' else display_datetime.strftime("%Z")
-        formatted_date = display_datetime.strftime(f"%B %d, %Y at %I:%M %p ({tz_abbr})")
-
-    # Calculate duration
-    duration_str = "Unknown"
-    if call_data.started_at and call_data.ended_at:
-        duration_seconds = (call_data.ended_at - call_data.started_at).total_seconds()
-        minutes = int(duration_seconds // 60)
-        seconds = int(duration_seconds % 60)
-        if minutes > 0:
-            duration_str = f"{minutes}m {seconds}s"
-        else:
-            duration_str = f"{seconds}s"
-
-    # Create plain text body
-    body_parts = []
-    body_parts.append(f"Caller Phone Number: {call_data.phone_number}")
-
-    if call_data.caller_name and call_data.caller_name.strip():
-        body_parts.append(f"Caller Name: {call_data.caller_name}")
-
-    body_parts.append(f"Date: {formatted_date}")
-    body_parts.append(f"Duration: {duration_str}")
-    body_parts.append(f"Summary: {call_data.summary}")
-    body_parts.append(f"Full Transcript:\n{call_data.transcript}")
-
-    plain_body = "\n".join(body_parts)
-
-    # Create HTML body
-    html_body = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <h2 style="color: #2c5282;">Call Summary</h2>
-        
-        <div style="background-color: #f7fafc; padding: 20px; border-radius: 8px; margin: 20px 0;">
-          <p><strong>Caller Phone Number:</strong> {call_data.phone_number}</p>
-          {"<p><strong>Caller Name:</strong> " + call_data.caller_name + "</p>" if call_data.caller_name and call_data.caller_name.strip() else ""}
-          <p><strong>Date:</strong> {formatted_date}</p>
-          <p><strong>Duration:</strong> {duration_str}</p>
-        </div>
-        
-        <div style="margin: 20px 0;">
-          <h3 style="color: #2c5282;">Summary</h3>
-          <p style="background-color: #e6f3ff; padding: 15px; border-radius: 5px; border-left: 4px solid #3182ce;">
-            {call_data.summary}
-          </p>
-        </div>
-        
-        <div style="margin: 20px 0;">
-          <h3 style="color: #2c5282;">Full Transcript</h3>
-          <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; white-space: pre-wrap; font-family: monospace; border: 1px solid #e9ecef;">
-{call_data.transcript}
-          </div>
-        </div>
-      </body>
-    </html>
-    """
+def build_call_data(payload: ElevenLabsWebhookPayload) -> CallData:
+    """Map a validated ElevenLabs webhook onto the CallData stored for it"""
+    conversation = payload.data
+    metadata = conversation.metadata
+    analysis = conversation.analysis
+
+    caller_name = analysis.data_collection_results.get('name')
+
+    return CallData(
+        summary=analysis.transcript_summary,
+        transcript=conversation.transcript,
+        # API url that will stream the audio
+        recording_url=f"/calls/elevenlabs_stream/{conversation.conversation_id}/",
+        started_at=datetime.fromtimestamp(metadata.start_time_unix_secs),
+        ended_at=datetime.fromtimestamp(metadata.start_time_unix_secs + metadata.call_duration_secs),
+        ended_reason=metadata.termination_reason,
+        caller_name=str(caller_name.value) if caller_name and caller_name.value is not None else "",
+        success_evaluation=analysis.call_successful,
+        cost=metadata.cost or 0.0,
+        phone_number=metadata.phone_call.external_number if metadata.phone_call else "",
+        did_respond=False
+    )
+
 
-    return subject, plain_body, html_body
+class IngestInProgress(Exception):
+    """Another attempt is running the steps for this call right now; retry later"""
 
 
-def handle_elevenlabs_webhook(report: dict):
-    """Handle ElevenLabs webhook data"""
+async def claim_ingest(conversation_id: str) -> Tuple[Optional[CallIngest], bool]:
+    """
+    Lease the conversation's CallIngest for this attempt, creating it on the
+    first delivery. Returns (ingest, created), or (None, False) if an earlier
+    attempt already completed every step. Raises IngestInProgress while
+    another attempt holds the lease.
+    """
+    ingest, created = await CallIngest.objects.aget_or_create(conversation_id=conversation_id)
+    if ingest.completed_at is not None:
+        return None, False
+
+    now = timezone.now()
+    leased = await CallIngest.objects.filter(
+        Q(leased_until__isnull=True) | Q(leased_until__lt=now),
+        id=ingest.id,
+        completed_at__isnull=True
+    ).aupdate(leased_until=now + timedelta(seconds=settings.WEBHOOK_QUEUE_VISIBILITY_TIMEOUT))
+    if not leased:
+        await ingest.arefresh_from_db()
+        if ingest.completed_at is not None:
+            return None, False
+        raise IngestInProgress(f"Call {conversation_id} is being ingested by another attempt")
+    return ingest, created
+
+
+async def mark_step_done(ingest: CallIngest, step: str):
+    """Record that a step (a CallIngest timestamp field) has completed"""
+    now = timezone.now()
+    setattr(ingest, step, now)
+    await CallIngest.objects.filter(id=ingest.id).aupdate(**{step: now})
+
+
+def purge_completed_ingests() -> int:
+    """Delete completed CallIngest rows older than WEBHOOK_QUEUE_RETENTION_DAYS."""
+    cutoff = timezone.now() - timedelta(days=settings.WEBHOOK_QUEUE_RETENTION_DAYS)
+    deleted, _ = CallIngest.objects.filter(completed_at__lt=cutoff).delete()
+    return deleted
+
+
+async def handle_elevenlabs_webhook(payload: ElevenLabsWebhookPayload):
+    """
+    Handle a validated ElevenLabs webhook.
+    Returns a status dict: ok, duplicate or ignored (debug number).
+
+    Safe to run again for the same conversation: steps an earlier attempt
+    completed (tracked in CallIngest) are skipped and the rest are run, so a
+    job retried after failing part way still indexes, publishes and emails
+    the call. Only a delivery of a fully processed call is a duplicate.
+    """
     logger.info("=== ELEVENLABS WEBHOOK RECEIVED ===")
-    logger.info(report)
+    logger.debug(payload)
+
+    conversation_id = payload.data.conversation_id
+    call_data = build_call_data(payload)
 
-    # concatenate transcript
-    transcript_str = ""
-    for transcript_item in report["data"]["transcript"]:
-        transcript_str += f"{transcript_item['role']}: {transcript_item['message']}\n"
+    if call_data.phone_number in settings.DEBUG_NUMBERS:
+        logger.info(f"Debug number found, not saving to database: {call_data.phone_number}")
+        return {"status": "ignored"}
 
-    # construct the API url that will stream the audio
-    conversation_id = report["data"]["conversation_id"]
-    recording_url = f"/calls/elevenlabs_stream/{conversation_id}/"
+    ingest, created = await claim_ingest(conversation_id)
+    if ingest is None:
+        record_duplicate_delivery(conversation_id)
+        return {"status": "duplicate"}
 
     try:
-        phone_number = report["data"]["metadata"]["phone_call"]["external_number"]
-        if phone_number in settings.DEBUG_NUMBERS:
-            logger.info(f"Debug number found, not saving to database: {phone_number}")
-            return()
-
-        # Convert unix timestamps to datetime objects
-        started_at = datetime.fromtimestamp(report["data"]["metadata"]["start_time_unix_secs"])
-        ended_at = datetime.fromtimestamp(
-            report["data"]["metadata"]["start_time_unix_secs"] +
-            report["data"]["metadata"]["call_duration_secs"]
-        )
-
-        call_data = CallData(
-            summary=report["data"]["analysis"]["transcript_summary"],
-            transcript=transcript_str,
-            recording_url=recording_url,
-            started_at=started_at,
-            ended_at=ended_at,
-            ended_reason=report["data"]["metadata"]["termination_reason"],
-            caller_name=report["data"]["analysis"]["data_collection_results"]["name"]["value"],
-            success_evaluation=report["data"]["analysis"]["call_successful"],
-            cost=report["data"]["metadata"]["cost"],
-            phone_number=phone_number,
-            did_respond=False
-        )
-
-    except KeyError:
-        logger.error("ERROR: Could not parse elevenlabs webhook data!!")
-        return ()
-
-    # Save to Firestore (convert to dict for Firestore)
-    calls_collection = get_calls_collection()
-    doc_ref = calls_collection.add(call_data.model_dump())
-    doc_id = doc_ref[1].id
-
-    # Send formatted email summary (display times in EST)
-    subject, plain_body, html_body = format_call_email(call_data, doc_id, timezone='US/Eastern')
-    send_email(settings.EMAIL_SUMMARY_RECIPIENT, subject, plain_body, html_body)
-
-    logger.info(f"Saved call to Firestore with ID: {doc_id}")
-    logger.info(f"Caller: {call_data.caller_name}")
-    logger.info(f"Summary: {call_data.summary}")
+        return await run_ingest_steps(ingest, created, call_data)
+    finally:
+        # Let a retry take over now rather than when the lease runs out
+        await CallIngest.objects.filter(id=ingest.id).aupdate(leased_until=None)
 
 
+async def run_ingest_steps(ingest: CallIngest, created: bool, call_data: CallData):
+    """
+    Run the ingest steps for a claimed call, in order: store, index, publish,
+    notify. Returns a status dict like handle_elevenlabs_webhook.
+
+    Each step's CallIngest timestamp is set as soon as it succeeds and a step
+    that already has one is skipped, so a retry resumes after the last step
+    that completed. Invalidating the cache and indexing are idempotent and run
+    on every attempt. An exception leaves the remaining steps for the retry;
+    the delivery is only remembered once every step has completed.
+    """
+    conversation_id = ingest.conversation_id
+
+    # Store keyed by conversation ID
+    doc_id = conversation_id
+    if ingest.stored_at is None:
+        try:
+            await get_call_repository().add(doc_id, call_data)
+        except CallAlreadyExists:
+            if created:
+                # Stored by a delivery from before steps were tracked
+                await mark_step_done(ingest, 'completed_at')
+                record_duplicate_delivery(conversation_id)
+                return {"status": "duplicate"}
+            # Otherwise an earlier attempt stored it and failed before recording that
+            logger.info(f"Call {doc_id} already stored, finishing an earlier attempt")
+        await mark_step_done(ingest, 'stored_at')
+
+    # Idempotent, so rerun on every attempt
+    await invalidate_calls_cache()
+    await index_call(doc_id, call_data)
+
+    if ingest.published_at is None:
+        await publish_call_event(CallEvent.Type.CREATED, doc_id, call_event_data(doc_id, call_data))
+        await mark_step_done(ingest, 'published_at')
+
+    # Warm the recording cache so playback starts instantly
+    schedule_recording_prefetch(conversation_id)
+
+    if ingest.notified_at is None:
+        # Email the summary now, or add it to the recipients' digests
+        # (smtplib and the digest store are blocking, run them off the event loop)
+        await sync_to_async(send_call_notification, thread_sensitive=False)(call_data, doc_id)
+        await mark_step_done(ingest, 'notified_at')
+
+    await mark_step_done(ingest, 'completed_at')
+    remember_delivery(conversation_id)
+
+    logger.info(f"Saved call with ID: {doc_id}")
+    logger.info(f"Caller: {call_data.caller_name}")
+    logger.info(f"Summary: {call_data.summary}")
 
     # Return success response
-    return JsonResponse({"status": "ok"})
+    return {"status": "ok"}
@@ -0,0 +1,72 @@
+"""
+Templates for call notification emails.
+
+Templates are `str.format` strings, which are formatted in C and are much
+cheaper than a template engine for these flat layouts. Values formatted into
+the HTML templates must already be escaped (see
+call_notifications.format_call_section_html).
+"""
+
+CALL_SECTION_PLAIN = """\
+Caller Phone Number: {phone_number}
+{caller_name}Date: {formatted_date}
+Duration: {duration_str}
+Summary: {summary}
+Full Transcript:
+{transcript}{transcript_note}"""
+
+CALLER_NAME_PLAIN = "Caller Name: {caller_name}\n"
+TRUNCATED_LINK_PLAIN = "\n[Transcript shortened. Full call: {url}]"
+TRUNCATED_ID_PLAIN = "\n[Transcript shortened. See call {doc_id} for the full transcript.]"
+
+DIGEST_SECTION_PLAIN = "Call {index} of {count}\n{section}"
+DIGEST_SEPARATOR_PLAIN = "\n\n" + "-" * 40 + "\n\n"
+
+CALL_SECTION_HTML = """\
+        <div style="background-color: #f7fafc; padding: 20px; border-radius: 8px; margin: 20px 0;">
+          <p><strong>Caller Phone Number:</strong> {phone_number}</p>
+          {caller_name}
+          <p><strong>Date:</strong> {formatted_date}</p>
+          <p><strong>Duration:</strong> {duration_str}</p>
+        </div>
+
+        <div style="margin: 20px 0;">
+          <h3 style="color: #2c5282;">Summary</h3>
+          <p style="background-color: #e6f3ff; padding: 15px; border-radius: 5px; border-left: 4px solid #3182ce;">
+            {summary}
+          </p>
+        </div>
+
+        <div style="margin: 20px 0;">
+          <h3 style="color: #2c5282;">Full Transcript</h3>
+          <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; white-space: pre-wrap; font-family: monospace; border: 1px solid #e9ecef;">{transcript}</div>
+          {transcript_note}
+        </div>
+"""
+
+CALLER_NAME_HTML = "<p><strong>Caller Name:</strong> {caller_name}</p>"
+TRUNCATED_LINK_HTML = '<p><em>Transcript shortened. <a href="{url}">View the full call</a></em></p>'
+TRUNCATED_ID_HTML = "<p><em>Transcript shortened. See call {doc_id} for the full transcript.</em></p>"
+
+CALL_HTML = """\
+    <html>
+      <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <h2 style="color: #2c5282;">Call Summary</h2>
+{section}
+      </body>
+    </html>
+"""
+
+DIGEST_SECTION_HTML = """\
+        <h2 style="color: #2c5282;">Call {index} of {count} - {phone_display}</h2>
+{section}
+        <hr style="border: none; border-top: 1px solid #e9ecef;">
+"""
+
+DIGEST_HTML = """\
+    <html>
+      <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+{sections}
+      </body>
+    </html>
+"""
@@ -0,0 +1,154 @@
+import asyncio
+import contextlib
+import logging
+import os
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from api import settings
+
+logger = logging.getLogger(__name__)
+
+RECORDING_SUFFIX = '.mp3'
+PARTIAL_SUFFIX = '.part'
+FILE_CHUNK_SIZE = 64 * 1024
+
+# Partial downloads older than this are leftovers from a crashed worker
+STALE_PARTIAL_SECONDS = 60 * 60
+
+# Conversation IDs become file names, so only allow a safe character set
+CONVERSATION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,128}$')
+
+
+def get_cache_dir() -> Path:
+    """Get the recording cache directory, creating it if necessary."""
+    cache_dir = Path(settings.RECORDING_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def is_cacheable(conversation_id: str) -> bool:
+    """Whether recordings for this conversation ID can be cached on disk."""
+    return settings.RECORDING_CACHE_ENABLED and bool(CONVERSATION_ID_PATTERN.match(conversation_id))
+
+
+def get_recording_path(conversation_id: str) -> Path:
+    """Path of the cached recording for a conversation (may not exist)."""
+    return get_cache_dir() / f"{conversation_id}{RECORDING_SUFFIX}"
+
+
+def get_cached_recording(conversation_id: str) -> Optional[Path]:
+    """
+    Return the path of a fully cached recording, or None on a cache miss.
+    A hit refreshes the file's mtime, which is what LRU eviction orders by.
+    """
+    if not is_cacheable(conversation_id):
+        return None
+
+    path = get_recording_path(conversation_id)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+
+async def iter_file(path: Path, start: int = 0, length: Optional[int] = None, chunk_size: int = FILE_CHUNK_SIZE):
+    """
+    Async iterator over a cached recording, or `length` bytes of it from `start`.
+    File I/O runs in a worker thread, so a slow disk or a cold page cache
+    doesn't stall the event loop.
+    """
+    f = await asyncio.to_thread(open, path, 'rb')
+    try:
+        await asyncio.to_thread(f.seek, start)
+        remaining = length
+        while remaining is None or remaining > 0:
+            chunk = await asyncio.to_thread(f.read, chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+    finally:
+        await asyncio.to_thread(f.close)
+
+
+async def tee_to_cache(conversation_id: str, chunks, expected_length: Optional[int] = None):
+    """
+    Proxy an async iterator of audio chunks while writing them to the cache.
+    Chunks go to a unique temporary file that is renamed into place only once
+    the download completes (and matches expected_length, if known), so readers
+    never see a partial recording. Aborted downloads are discarded. File I/O
+    runs in a worker thread.
+    """
+    path = get_recording_path(conversation_id)
+    partial_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}{PARTIAL_SUFFIX}")
+
+    completed = False
+    bytes_written = 0
+    try:
+        async with contextlib.aclosing(chunks):
+            f = await asyncio.to_thread(open, partial_path, 'wb')
+            try:
+                async for chunk in chunks:
+                    await asyncio.to_thread(f.write, chunk)
+                    bytes_written += len(chunk)
+                    yield chunk
+            finally:
+                await asyncio.to_thread(f.close)
+
+        if expected_length is not None and bytes_written != expected_length:
+            logger.warning(
+                f"Not caching recording {conversation_id}: got {bytes_written} of {expected_length} bytes")
+        else:
+            await asyncio.to_thread(os.replace, partial_path, path)
+            completed = True
+            logger.info(f"Cached recording {conversation_id} ({bytes_written} bytes)")
+
+    finally:
+        if not completed:
+            await asyncio.to_thread(partial_path.unlink, missing_ok=True)
+
+    await asyncio.to_thread(evict_recordings)
+
+
+def evict_recordings(max_bytes: Optional[int] = None):
+    """
+    Delete least recently used recordings until the cache fits in
+    RECORDING_CACHE_MAX_BYTES, and clean up stale partial downloads.
+    """
+    if max_bytes is None:
+        max_bytes = settings.RECORDING_CACHE_MAX_BYTES
+
+    now = time.time()
+    recordings = []
+    total_bytes = 0
+
+    with os.scandir(get_cache_dir()) as entries:
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+
+            if entry.name.endswith(PARTIAL_SUFFIX):
+                if now - stat.st_mtime > STALE_PARTIAL_SECONDS:
+                    Path(entry.path).unlink(missing_ok=True)
+                continue
+
+            if entry.name.endswith(RECORDING_SUFFIX):
+                recordings.append((stat.st_mtime, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+
+    # Oldest first
+    recordings.sort()
+    for mtime, size, path in recordings:
+        if total_bytes <= max_bytes:
+            break
+        Path(path).unlink(missing_ok=True)
+        total_bytes -= size
+        logger.info(f"Evicted cached recording {path}")
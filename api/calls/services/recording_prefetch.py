@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import threading
+
+from api import settings
+from api.calls.services.elevenlabs_api import iter_audio, stream_conversation_audio
+from api.calls.services.recording_cache import get_cached_recording, is_cacheable, tee_to_cache
+
+logger = logging.getLogger(__name__)
+
+# Background event loop that runs prefetch downloads, started on first use
+prefetch_loop = None
+prefetch_semaphore = None
+prefetch_lock = threading.Lock()
+
+# Conversation IDs queued or downloading, so webhook retries don't double up
+pending_conversation_ids = set()
+
+
+def get_prefetch_loop():
+    """
+    Get the prefetch event loop, starting its daemon thread if necessary.
+    Prefetches run on their own loop so they outlive the request that queued them.
+    """
+    global prefetch_loop, prefetch_semaphore
+
+    with prefetch_lock:
+        if prefetch_loop is None:
+            loop = asyncio.new_event_loop()
+            prefetch_semaphore = asyncio.Semaphore(settings.RECORDING_PREFETCH_CONCURRENCY)
+            threading.Thread(target=loop.run_forever, name='recording-prefetch', daemon=True).start()
+            prefetch_loop = loop
+    return prefetch_loop
+
+
+async def download_recording(conversation_id):
+    """
+    Download a recording into the recording cache.
+    Returns True on success, False if ElevenLabs did not return the audio.
+    """
+    elevenlabs_response = await stream_conversation_audio(conversation_id)
+    if elevenlabs_response.status_code != 200:
+        logger.warning(
+            f"Prefetch of recording {conversation_id} got status {elevenlabs_response.status_code}")
+        await elevenlabs_response.aclose()
+        return False
+
+    content_length = elevenlabs_response.headers.get('Content-Length')
+    async for _ in tee_to_cache(
+            conversation_id,
+            iter_audio(elevenlabs_response),
+            expected_length=int(content_length) if content_length else None
+    ):
+        pass
+
+    return get_cached_recording(conversation_id) is not None
+
+
+async def prefetch_recording(conversation_id):
+    """
+    Prefetch a recording with bounded concurrency and retries.
+    The first attempt waits RECORDING_PREFETCH_DELAY, since ElevenLabs may still
+    be finalizing the audio when the post-call webhook arrives.
+    """
+    try:
+        await asyncio.sleep(settings.RECORDING_PREFETCH_DELAY)
+
+        for attempt in range(settings.RECORDING_PREFETCH_RETRIES + 1):
+            if get_cached_recording(conversation_id) is not None:
+                return
+
+            try:
+                async with prefetch_semaphore:
+                    if await download_recording(conversation_id):
+                        logger.info(f"Prefetched recording {conversation_id}")
+                        return
+            except Exception as e:
+                logger.warning(f"Error prefetching recording {conversation_id}: {e}")
+
+            await asyncio.sleep(settings.RECORDING_PREFETCH_BACKOFF * (2 ** attempt))
+
+        logger.error(f"Giving up prefetching recording {conversation_id}")
+
+    finally:
+        pending_conversation_ids.discard(conversation_id)
+
+
+def schedule_recording_prefetch(conversation_id):
+    """
+    Queue a background download of a call recording, if prefetching is enabled.
+    Returns immediately; the download runs on the prefetch loop.
+    """
+    if not settings.RECORDING_PREFETCH_ENABLED or not is_cacheable(conversation_id):
+        return
+    if get_cached_recording(conversation_id) is not None:
+        return
+
+    with prefetch_lock:
+        if conversation_id in pending_conversation_ids:
+            return
+        pending_conversation_ids.add(conversation_id)
+
+    asyncio.run_coroutine_threadsafe(prefetch_recording(conversation_id), get_prefetch_loop())
+    logger.info(f"Queued recording prefetch for {conversation_id}")
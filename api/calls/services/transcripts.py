@@ -0,0 +1,139 @@
+"""
+Compact storage for call transcripts.
+
+Transcripts are stored on the call document's `transcript` field in one of
+these forms:
+
+- `{'turns': [{'r': role, 'm': message, 't': time_in_call_secs}, ...]}`
+- `{'zlib': <compressed JSON of the turns>}` once above TRANSCRIPT_COMPRESS_THRESHOLD
+- `{'subcollection': True, 'turn_count': n}`, with one of the above forms in
+  the `transcript/turns` subdocument
+- a `role: message` string, for calls saved before structured transcripts
+"""
+
+import asyncio
+import zlib
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+
+from api import settings
+from api.calls.schemas import CallData, TranscriptTurn
+
+TRANSCRIPT_SUBCOLLECTION = 'transcript'
+TRANSCRIPT_DOC_ID = 'turns'
+
+
+def pack_turns(turns: Iterable[TranscriptTurn]) -> list:
+    """
+    Turns as a list of short-key maps (`r`, `m` and, when known, `t`), the
+    uncompressed stored form. Maps rather than arrays, as Firestore arrays
+    can't nest arrays.
+    """
+    packed = []
+    for turn in turns:
+        item = {'r': turn.role, 'm': turn.message}
+        if turn.time_in_call_secs is not None:
+            item['t'] = turn.time_in_call_secs
+        packed.append(item)
+    return packed
+
+
+def unpack_turns(packed: list) -> List[TranscriptTurn]:
+    """Turns from the short-key maps pack_turns returns"""
+    return [TranscriptTurn(role=item['r'], message=item['m'], time_in_call_secs=item.get('t')) for item in packed]
+
+
+def compress_turns(turns: Iterable[TranscriptTurn]) -> bytes:
+    """
+    zlib compressed JSON of the packed turns, as stored under `zlib` and in
+    CallRecord.transcript
+    """
+    return zlib.compress(orjson.dumps(pack_turns(turns)))
+
+
+def decompress_turns(data: bytes) -> List[TranscriptTurn]:
+    """Turns from compress_turns output; empty bytes give no turns"""
+    return unpack_turns(orjson.loads(zlib.decompress(data))) if data else []
+
+
+def encode_transcript(turns: List[TranscriptTurn]) -> Tuple[dict, int]:
+    """
+    Encode turns for storage: `{'turns': packed}` as plain maps, or
+    `{'zlib': compressed}` once their JSON is above TRANSCRIPT_COMPRESS_THRESHOLD.
+    Returns the stored form and its size in bytes (the JSON or the compressed
+    data), which decides whether it goes in the subcollection.
+    """
+    packed = pack_turns(turns)
+    raw = orjson.dumps(packed)
+    if len(raw) <= settings.TRANSCRIPT_COMPRESS_THRESHOLD:
+        return {'turns': packed}, len(raw)
+
+    compressed = zlib.compress(raw)
+    return {'zlib': compressed}, len(compressed)
+
+
+def decode_transcript(stored) -> List[TranscriptTurn]:
+    """
+    Decode an inline stored transcript (any form except the subcollection
+    marker) back into turns, decompressing `zlib` forms and parsing legacy
+    strings. Empty or missing transcripts give no turns.
+    """
+    if not stored:
+        return []
+    if isinstance(stored, str):
+        return CallData.model_validate({'transcript': stored}).transcript
+    if 'zlib' in stored:
+        return decompress_turns(stored['zlib'])
+    return unpack_turns(stored.get('turns', []))
+
+
+def is_in_subcollection(stored) -> bool:
+    """Whether the stored transcript is only a marker for the subcollection document"""
+    return isinstance(stored, dict) and stored.get('subcollection', False)
+
+
+def build_call_document(call_data: CallData) -> Tuple[dict, Optional[dict]]:
+    """
+    Build the Firestore document for a call.
+    Returns (call_document, transcript_document); transcript_document is None
+    unless the transcript goes in the subcollection.
+    """
+    document = call_data.model_dump(exclude={'transcript'})
+    stored, size = encode_transcript(call_data.transcript)
+
+    if settings.TRANSCRIPT_SUBCOLLECTION_ENABLED and size > settings.TRANSCRIPT_SUBCOLLECTION_MIN_BYTES:
+        document['transcript'] = {'subcollection': True, 'turn_count': len(call_data.transcript)}
+        return document, stored
+
+    document['transcript'] = stored
+    return document, None
+
+
+async def load_transcript(doc_ref, stored) -> List[TranscriptTurn]:
+    """Get the turns of a call, reading the subcollection if that's where they are"""
+    if not is_in_subcollection(stored):
+        return decode_transcript(stored)
+
+    snapshot = await doc_ref.collection(TRANSCRIPT_SUBCOLLECTION).document(TRANSCRIPT_DOC_ID).get()
+    return decode_transcript(snapshot.to_dict() if snapshot.exists else None)
+
+
+async def load_transcripts(calls: List[dict], doc_refs) -> None:
+    """Replace stored transcripts in call dicts with rendered text, in place"""
+    transcripts = await asyncio.gather(*(
+        load_transcript(doc_ref, call.get('transcript')) for call, doc_ref in zip(calls, doc_refs)
+    ))
+    for call, turns in zip(calls, transcripts):
+        call['transcript'] = render_transcript(turns)
+
+
+def iter_transcript_lines(turns: Iterable[TranscriptTurn]) -> Iterator[str]:
+    """Lazily render turns as `role: message` lines"""
+    for turn in turns:
+        yield f"{turn.role}: {turn.message}\n"
+
+
+def render_transcript(turns: Iterable[TranscriptTurn]) -> str:
+    """Render turns as the `role: message` text shown in emails and the API"""
+    return "".join(iter_transcript_lines(turns))
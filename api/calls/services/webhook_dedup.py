@@ -0,0 +1,58 @@
+import logging
+import threading
+from collections import OrderedDict
+
+from api import metrics, settings
+
+logger = logging.getLogger(__name__)
+
+
+class RecentIdFilter:
+    """Thread-safe, bounded set of recently seen IDs with LRU eviction"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, item_id):
+        with self._lock:
+            if item_id in self._ids:
+                self._ids.move_to_end(item_id)
+                return True
+            return False
+
+    def add(self, item_id):
+        with self._lock:
+            self._ids[item_id] = None
+            self._ids.move_to_end(item_id)
+            while len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+
+
+# Conversation IDs this process has already accepted
+recent_conversation_ids = RecentIdFilter(settings.WEBHOOK_DEDUP_CACHE_SIZE)
+
+
+def record_duplicate_delivery(conversation_id):
+    """Count and log a webhook delivery that was rejected as a duplicate."""
+    metrics.increment('webhook.deduplicated')
+    logger.info(f"Ignoring duplicate webhook delivery for conversation {conversation_id}")
+
+
+def is_recent_delivery(conversation_id):
+    """
+    Whether this process recently accepted a webhook for the conversation.
+    Cheap in-process check that rejects retry storms before they reach the
+    queue, Firestore or SMTP; Firestore create() is the authoritative check.
+    """
+    if conversation_id and conversation_id in recent_conversation_ids:
+        record_duplicate_delivery(conversation_id)
+        return True
+    return False
+
+
+def remember_delivery(conversation_id):
+    """Remember that a webhook for the conversation was accepted."""
+    if conversation_id:
+        recent_conversation_ids.add(conversation_id)
@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.db.models import F, Q
+from django.utils import timezone
+from pydantic import ValidationError
+
+from api import settings
+from api.calls.models import WebhookJob
+from api.calls.schemas import ElevenLabsWebhookPayload
+from api.calls.services.call_events import purge_old_events
+from api.calls.services.call_notifications import flush_due_digests
+from api.calls.services.elevenlabs_webhook_service import handle_elevenlabs_webhook, purge_completed_ingests
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_SECONDS = 60 * 60
+
+# In-process worker thread, started by start_webhook_worker()
+worker_thread = None
+worker_lock = threading.Lock()
+
+
+async def enqueue_webhook(raw_body: str) -> WebhookJob:
+    """
+    Durably store a raw webhook payload for background processing.
+    """
+    job = await WebhookJob.objects.acreate(payload=raw_body)
+    logger.info(f"Queued ElevenLabs webhook as job {job.pk}")
+    return job
+
+
+def claim_next_job():
+    """
+    Atomically claim the next job that is due, or return None.
+    Jobs stuck in processing past the visibility timeout are reclaimed, so a
+    crashed worker's job runs again (at-least-once delivery).
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.WEBHOOK_QUEUE_VISIBILITY_TIMEOUT)
+    claimable = (
+        Q(status=WebhookJob.Status.PENDING, available_at__lte=now) |
+        Q(status=WebhookJob.Status.PROCESSING, locked_at__lt=stale_before)
+    )
+
+    for job_id in WebhookJob.objects.filter(claimable).values_list('id', flat=True)[:10]:
+        # Conditional update so only one worker wins the claim
+        claimed = WebhookJob.objects.filter(claimable, id=job_id).update(
+            status=WebhookJob.Status.PROCESSING,
+            locked_at=now,
+            attempts=F('attempts') + 1,
+            updated_at=now
+        )
+        if claimed:
+            return WebhookJob.objects.get(id=job_id)
+
+    return None
+
+
+def complete_job(job: WebhookJob):
+    """Mark a job as successfully processed."""
+    WebhookJob.objects.filter(id=job.id).update(
+        status=WebhookJob.Status.DONE,
+        locked_at=None,
+        last_error="",
+        updated_at=timezone.now()
+    )
+
+
+def fail_job(job: WebhookJob, error: Exception, retry: bool = True):
+    """
+    Schedule a failed job for retry with exponential backoff, or dead-letter it
+    once WEBHOOK_QUEUE_MAX_ATTEMPTS is reached (or right away if retry=False).
+    """
+    now = timezone.now()
+    if not retry or job.attempts >= settings.WEBHOOK_QUEUE_MAX_ATTEMPTS:
+        logger.error(f"Webhook job {job.id} failed {job.attempts} times, moving to dead letters: {error}")
+        status, available_at = WebhookJob.Status.DEAD, now
+    else:
+        delay = settings.WEBHOOK_QUEUE_RETRY_BACKOFF * (2 ** (job.attempts - 1))
+        logger.warning(f"Webhook job {job.id} failed (attempt {job.attempts}), retrying in {delay:.0f}s: {error}")
+        status, available_at = WebhookJob.Status.PENDING, now + timedelta(seconds=delay)
+
+    WebhookJob.objects.filter(id=job.id).update(
+        status=status,
+        available_at=available_at,
+        locked_at=None,
+        last_error=repr(error),
+        updated_at=now
+    )
+
+
+def requeue_dead_jobs() -> int:
+    """Move dead-lettered jobs back to pending. Returns the number requeued."""
+    return WebhookJob.objects.filter(status=WebhookJob.Status.DEAD).update(
+        status=WebhookJob.Status.PENDING,
+        attempts=0,
+        available_at=timezone.now(),
+        updated_at=timezone.now()
+    )
+
+
+def purge_done_jobs() -> int:
+    """Delete processed jobs older than WEBHOOK_QUEUE_RETENTION_DAYS."""
+    cutoff = timezone.now() - timedelta(days=settings.WEBHOOK_QUEUE_RETENTION_DAYS)
+    deleted, _ = WebhookJob.objects.filter(status=WebhookJob.Status.DONE, updated_at__lt=cutoff).delete()
+    return deleted
+
+
+async def process_job(job: WebhookJob):
+    """Run the ingestion pipeline for one job and record the outcome."""
+    try:
+        payload = ElevenLabsWebhookPayload.model_validate_json(job.payload)
+        await handle_elevenlabs_webhook(payload)
+    except ValidationError as e:
+        # Retrying can't fix a malformed payload
+        logger.error(f"Invalid payload in webhook job {job.id}: {str(e)}")
+        await sync_to_async(fail_job)(job, e, retry=False)
+    except Exception as e:
+        logger.error(f"Error processing webhook job {job.id}: {str(e)}", exc_info=True)
+        await sync_to_async(fail_job)(job, e)
+    else:
+        await sync_to_async(complete_job)(job)
+
+
+async def run_worker(stop_event: threading.Event = None, drain: bool = False):
+    """
+    Process queued webhook jobs until stop_event is set.
+    With drain=True, return as soon as no job is due instead of polling.
+    """
+    last_purge = 0.0
+
+    while stop_event is None or not stop_event.is_set():
+        # Claim up to WEBHOOK_QUEUE_CONCURRENCY jobs and process them together,
+        # so a burst of calls is written to Firestore in shared batches
+        jobs = []
+        try:
+            while len(jobs) < settings.WEBHOOK_QUEUE_CONCURRENCY:
+                job = await sync_to_async(claim_next_job)()
+                if job is None:
+                    break
+                jobs.append(job)
+        except Exception as e:
+            logger.error(f"Error claiming webhook job: {str(e)}", exc_info=True)
+
+        if jobs:
+            await asyncio.gather(*(process_job(job) for job in jobs))
+            continue
+
+        if drain:
+            return
+
+        if settings.EMAIL_DIGEST_ENABLED:
+            try:
+                await sync_to_async(flush_due_digests, thread_sensitive=False)()
+            except Exception as e:
+                logger.error(f"Error sending email digests: {str(e)}", exc_info=True)
+
+        if time.monotonic() - last_purge > PURGE_INTERVAL_SECONDS:
+            last_purge = time.monotonic()
+            try:
+                purged = await sync_to_async(purge_done_jobs)()
+                if purged:
+                    logger.info(f"Purged {purged} processed webhook jobs")
+            except Exception as e:
+                logger.error(f"Error purging webhook jobs: {str(e)}", exc_info=True)
+
+            try:
+                purged = await sync_to_async(purge_completed_ingests)()
+                if purged:
+                    logger.info(f"Purged {purged} completed call ingests")
+            except Exception as e:
+                logger.error(f"Error purging call ingests: {str(e)}", exc_info=True)
+
+            try:
+                purged = await sync_to_async(purge_old_events)()
+                if purged:
+                    logger.info(f"Purged {purged} call events")
+            except Exception as e:
+                logger.error(f"Error purging call events: {str(e)}", exc_info=True)
+
+        await sync_to_async(close_old_connections)()
+        await asyncio.sleep(settings.WEBHOOK_QUEUE_POLL_INTERVAL)
+
+
+def start_webhook_worker():
+    """
+    Start the in-process webhook worker thread, if enabled and not running.
+    The thread runs its own event loop so async clients are reused across jobs.
+    """
+    global worker_thread
+
+    if not settings.WEBHOOK_QUEUE_INLINE_WORKER:
+        return
+
+    with worker_lock:
+        if worker_thread is None or not worker_thread.is_alive():
+            worker_thread = threading.Thread(
+                target=asyncio.run,
+                args=(run_worker(),),
+                name='webhook-worker',
+                daemon=True
+            )
+            worker_thread.start()
+            logger.info("Started webhook queue worker")
@@ -0,0 +1,104 @@
+import asyncio
+import json
+import smtplib
+
+import httpx
+from django.test import SimpleTestCase
+
+from api import database
+from api.calls.benchmarks.fake_elevenlabs import FakeElevenLabsServer
+from api.calls.benchmarks.fake_firestore import FakeAsyncClient
+from api.calls.benchmarks.payloads import synthetic_payload
+from api.calls.benchmarks.smtp_sink import SMTPSink
+from api.calls.management.commands.bench_e2e import compare_with_baseline, percentile, summarize
+from api.calls.schemas import ElevenLabsWebhookPayload
+
+AUDIO_PATH = '/v1/convai/conversations/conv_1/audio'
+
+
+class FakeElevenLabsServerTests(SimpleTestCase):
+    async def test_serves_full_and_ranged_audio(self):
+        server = FakeElevenLabsServer(audio_size=1000)
+        base_url = await server.start()
+        try:
+            async with httpx.AsyncClient(base_url=base_url) as client:
+                full = await client.get(AUDIO_PATH)
+                ranged = await client.get(AUDIO_PATH, headers={'Range': 'bytes=10-19'})
+                suffix = await client.get(AUDIO_PATH, headers={'Range': 'bytes=-5'})
+                missing = await client.get('/v1/other')
+        finally:
+            await server.close()
+
+        self.assertEqual((full.status_code, len(full.content)), (200, 1000))
+        self.assertEqual(ranged.status_code, 206)
+        self.assertEqual(ranged.headers['Content-Range'], 'bytes 10-19/1000')
+        self.assertEqual(ranged.content, full.content[10:20])
+        self.assertEqual(suffix.content, full.content[-5:])
+        self.assertEqual(missing.status_code, 404)
+        # One keep-alive connection served every request
+        self.assertEqual(server.requests, 4)
+
+
+class SMTPSinkTests(SimpleTestCase):
+    async def test_counts_messages(self):
+        sink = SMTPSink()
+        port = await sink.start()
+
+        def send():
+            with smtplib.SMTP('127.0.0.1', port) as smtp:
+                for _ in range(2):
+                    smtp.sendmail('from@example.com', ['to@example.com'], 'Subject: Hi\r\n\r\nHello\r\n.\r\n')
+
+        try:
+            await asyncio.to_thread(send)
+        finally:
+            await sink.close()
+
+        self.assertEqual((sink.connections, sink.messages), (1, 2))
+
+
+class BenchmarkReportTests(SimpleTestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 0.50), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.95), 7)
+
+    def test_summarize(self):
+        summary = summarize([0.002, 0.001, 0.004, 0.003], errors=1, elapsed=2)
+
+        self.assertEqual(summary['requests'], 4)
+        self.assertEqual(summary['errors'], 1)
+        self.assertEqual((summary['p50_ms'], summary['max_ms']), (2.0, 4.0))
+        self.assertEqual(summary['throughput_per_sec'], 2.0)
+
+    def test_compare_with_baseline(self):
+        results = {'scenarios': {
+            'list': {'p50_ms': 5.0, 'p95_ms': 8.0, 'throughput_per_sec': 300.0},
+            'edit': {'p50_ms': 1.0},
+        }}
+        baseline = {'scenarios': {'list': {'p50_ms': 10.0, 'p95_ms': 0, 'throughput_per_sec': 200.0}}}
+
+        compare_with_baseline(results, baseline)
+
+        self.assertEqual(results['scenarios']['list']['vs_baseline'], {'p50_ms': 0.5, 'throughput_per_sec': 1.5})
+        self.assertNotIn('vs_baseline', results['scenarios']['edit'])
+
+
+class BenchmarkStandInTests(SimpleTestCase):
+    def test_synthetic_payload_is_a_valid_webhook(self):
+        body = json.loads(synthetic_payload(3, conversation_id='conv_7', phone_number='+16195550101'))
+
+        payload = ElevenLabsWebhookPayload.model_validate(body)
+
+        self.assertEqual(payload.data.conversation_id, 'conv_7')
+        self.assertEqual(len(payload.data.transcript), 3)
+
+    async def test_registered_async_client_is_used(self):
+        client = FakeAsyncClient()
+        database.async_clients[asyncio.get_running_loop()] = client
+        try:
+            self.assertIs(database.get_async_firestore_client(), client)
+        finally:
+            del database.async_clients[asyncio.get_running_loop()]
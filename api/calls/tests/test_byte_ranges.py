@@ -0,0 +1,47 @@
+from django.test import SimpleTestCase
+
+from api.calls.utils import parse_byte_range
+
+
+class ParseByteRangeTests(SimpleTestCase):
+    def test_no_header_serves_everything(self):
+        self.assertIsNone(parse_byte_range(None, 1000))
+        self.assertIsNone(parse_byte_range('', 1000))
+
+    def test_closed_range(self):
+        self.assertEqual(parse_byte_range('bytes=100-199', 1000), (100, 199))
+
+    def test_end_is_capped_at_size(self):
+        self.assertEqual(parse_byte_range('bytes=900-5000', 1000), (900, 999))
+
+    def test_open_ended_range(self):
+        self.assertEqual(parse_byte_range('bytes=100-', 1000), (100, 999))
+        self.assertEqual(parse_byte_range('bytes=0-', 1000), (0, 999))
+
+    def test_suffix_range(self):
+        self.assertEqual(parse_byte_range('bytes=-10', 1000), (990, 999))
+
+    def test_suffix_longer_than_resource(self):
+        self.assertEqual(parse_byte_range('bytes=-5000', 1000), (0, 999))
+
+    def test_whitespace_and_unit_case(self):
+        self.assertEqual(parse_byte_range(' Bytes = 5 - 9 ', 1000), (5, 9))
+
+    def test_start_past_end_is_unsatisfiable(self):
+        with self.assertRaises(ValueError):
+            parse_byte_range('bytes=1000-', 1000)
+        with self.assertRaises(ValueError):
+            parse_byte_range('bytes=2000-3000', 1000)
+
+    def test_empty_suffix_is_unsatisfiable(self):
+        with self.assertRaises(ValueError):
+            parse_byte_range('bytes=-0', 1000)
+
+    def test_multiple_ranges_serve_everything(self):
+        self.assertIsNone(parse_byte_range('bytes=0-9,20-29', 1000))
+
+    def test_unsupported_or_malformed_serve_everything(self):
+        for header in ('items=0-9', 'bytes=9-0', 'bytes=abc-', 'bytes=5', 'bytes=-'):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_byte_range(header, 1000))
+
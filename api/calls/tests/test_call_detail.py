@@ -0,0 +1,72 @@
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from api.calls.repositories.memory import InMemoryCallRepository
+from api.calls.schemas import CallData, TranscriptTurn
+from api.calls.services import calls_service
+
+
+class CallProjectionTests(TestCase):
+    def setUp(self):
+        self.repository = InMemoryCallRepository()
+        self.repository.put_many([
+            ('conv_1', CallData(
+                summary='Asked about hours',
+                caller_name='Ann',
+                transcript=[TranscriptTurn(role='user', message='Hi'), TranscriptTurn(role='agent', message='Hello')],
+                created_at=datetime(2026, 3, 1, tzinfo=dt_timezone.utc)
+            )),
+            ('list', CallData(summary='Unlucky ID', created_at=datetime(2026, 3, 2, tzinfo=dt_timezone.utc))),
+        ])
+
+        patcher = mock.patch.object(calls_service, 'get_call_repository', return_value=self.repository)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        calls_service.get_calls_cache().clear()
+
+    async def test_list_leaves_out_transcript(self):
+        response = await self.async_client.get(reverse('calls:calls-list'))
+
+        self.assertEqual(response.status_code, 200)
+        call = response.json()['results'][1]
+        self.assertEqual(call['summary'], 'Asked about hours')
+        self.assertNotIn('transcript', call)
+
+    async def test_list_projects_requested_fields(self):
+        response = await self.async_client.get(reverse('calls:calls-list'), {'fields': 'caller_name, summary'})
+
+        self.assertEqual(
+            response.json()['results'][1],
+            {'id': 'conv_1', 'caller_name': 'Ann', 'summary': 'Asked about hours', 'created_at': '2026-03-01T00:00:00Z'}
+        )
+
+    async def test_list_rejects_unknown_fields(self):
+        response = await self.async_client.get(reverse('calls:calls-list'), {'fields': 'summary,password'})
+
+        self.assertEqual(response.status_code, 400)
+
+    async def test_detail_includes_transcript(self):
+        response = await self.async_client.get(reverse('calls:call-detail', args=['conv_1']))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['id'], 'conv_1')
+        self.assertEqual(response.json()['transcript'], 'user: Hi\nagent: Hello\n')
+
+    async def test_detail_of_missing_call(self):
+        response = await self.async_client.get(reverse('calls:call-detail', args=['missing']))
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_detail_of_id_named_like_an_endpoint(self):
+        response = await self.async_client.get(reverse('calls:call-detail', args=['list']))
+
+        self.assertEqual(response.json()['summary'], 'Unlucky ID')
+
+    async def test_unknown_path_is_not_a_call(self):
+        response = await self.async_client.get('/calls/lsit/')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('Call not found', response.content.decode())
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from api import settings
+from api.calls.models import DigestEntry
+from api.calls.schemas import CallData
+from api.calls.services import call_notifications
+from api.calls.services.call_notifications import flush_digest, flush_due_digests, send_call_notification
+
+
+def make_call(summary='Asked about opening hours'):
+    return CallData(summary=summary, phone_number='+15551234567', caller_name='Ann')
+
+
+class CallDigestTests(TestCase):
+    def setUp(self):
+        for patcher in (
+                mock.patch.object(settings, 'EMAIL_DIGEST_ENABLED', True),
+                mock.patch.object(settings, 'EMAIL_DIGEST_MAX_CALLS', 3),
+                mock.patch.object(settings, 'EMAIL_DIGEST_URGENT_KEYWORDS', ['urgent']),
+                mock.patch.object(settings, 'EMAIL_SUMMARY_RECIPIENTS', ['a@example.com', 'b@example.com']),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(call_notifications, 'send_email')
+        self.send_email = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sent_to(self):
+        return sorted(call.args[0] for call in self.send_email.call_args_list)
+
+    def test_call_is_added_to_each_digest(self):
+        send_call_notification(make_call(), 'conv_1')
+
+        self.send_email.assert_not_called()
+        self.assertEqual(
+            sorted(DigestEntry.objects.values_list('recipient', 'call_id')),
+            [('a@example.com', 'conv_1'), ('b@example.com', 'conv_1')]
+        )
+
+    def test_urgent_call_is_emailed_at_once(self):
+        send_call_notification(make_call('URGENT: water leak'), 'conv_1')
+
+        self.assertEqual(self.sent_to(), ['a@example.com', 'b@example.com'])
+        self.assertFalse(DigestEntry.objects.exists())
+
+    def test_retried_notification_is_added_once(self):
+        send_call_notification(make_call(), 'conv_1')
+        send_call_notification(make_call(), 'conv_1')
+
+        self.assertEqual(DigestEntry.objects.filter(recipient='a@example.com').count(), 1)
+
+    def test_digest_is_sent_when_full(self):
+        for index in range(3):
+            send_call_notification(make_call(), f'conv_{index}')
+
+        self.assertEqual(self.sent_to(), ['a@example.com', 'b@example.com'])
+        subject = self.send_email.call_args.args[1]
+        self.assertIn('3 calls', subject)
+        self.assertFalse(DigestEntry.objects.exists())
+
+    def test_claimed_entries_do_not_count_towards_full(self):
+        for index in range(2):
+            DigestEntry.objects.create(
+                recipient='a@example.com', call_id=f'old_{index}', call_json=make_call().model_dump_json(),
+                claim_token='flushing', claimed_at=timezone.now()
+            )
+
+        send_call_notification(make_call(), 'conv_1')
+
+        self.send_email.assert_not_called()
+
+    def test_flush_sends_each_call_once(self):
+        send_call_notification(make_call(), 'conv_1')
+        send_call_notification(make_call(), 'conv_2')
+
+        self.assertEqual(flush_digest('a@example.com'), 2)
+        self.assertEqual(flush_digest('a@example.com'), 0)
+        self.assertEqual(self.sent_to(), ['a@example.com'])
+        self.assertEqual(DigestEntry.objects.filter(recipient='a@example.com').count(), 0)
+
+    def test_digest_subject_spans_call_dates(self):
+        for day in (2, 4):
+            call = make_call()
+            call.started_at = datetime(2026, 3, day, 15, tzinfo=dt_timezone.utc)
+            send_call_notification(call, f'conv_{day}')
+        send_call_notification(make_call(), 'conv_undated')
+
+        flush_digest('a@example.com')
+
+        self.assertEqual(self.send_email.call_args.args[1], '[03/02-03/04 Call Digest: 3 calls]')
+
+    def test_flush_skips_entries_claimed_by_another_flush(self):
+        DigestEntry.objects.create(
+            recipient='a@example.com', call_id='conv_1', call_json=make_call().model_dump_json(),
+            claim_token='flushing', claimed_at=timezone.now()
+        )
+
+        self.assertEqual(flush_digest('a@example.com'), 0)
+        self.send_email.assert_not_called()
+
+    def test_flush_takes_over_abandoned_claim(self):
+        DigestEntry.objects.create(
+            recipient='a@example.com', call_id='conv_1', call_json=make_call().model_dump_json(),
+            claim_token='crashed', claimed_at=timezone.now() - timedelta(days=1)
+        )
+
+        self.assertEqual(flush_digest('a@example.com'), 1)
+
+    def test_flush_due_digests(self):
+        send_call_notification(make_call(), 'conv_1')
+        DigestEntry.objects.filter(recipient='a@example.com').update(
+            created_at=timezone.now() - timedelta(seconds=settings.EMAIL_DIGEST_WINDOW_SECONDS + 1)
+        )
+
+        self.assertEqual(flush_due_digests(), 1)
+        self.assertEqual(self.sent_to(), ['a@example.com'])
+        self.assertTrue(DigestEntry.objects.filter(recipient='b@example.com').exists())
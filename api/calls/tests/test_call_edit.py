@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from api.calls.models import CallEvent
+from api.calls.repositories.memory import InMemoryCallRepository
+from api.calls.schemas import CallData
+from api.calls.services import calls_service
+
+
+class CallEditTestCase(TestCase):
+    def setUp(self):
+        self.repository = InMemoryCallRepository()
+        self.repository.put_many((call_id, CallData(summary=f'Call {call_id}')) for call_id in ('conv_1', 'conv_2'))
+
+        patcher = mock.patch.object(calls_service, 'get_call_repository', return_value=self.repository)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def did_respond(self, call_id):
+        return (await self.repository.get(call_id, ['did_respond']))['did_respond']
+
+
+class CallBulkEditViewTests(CallEditTestCase):
+    url = reverse('calls:call-bulk-edit')
+
+    async def post(self, body):
+        return await self.async_client.post(self.url, body, content_type='application/json')
+
+    async def test_updates_calls_and_reports_missing(self):
+        response = await self.post({'call_ids': ['conv_1', 'missing', 'conv_2', 'conv_1'], 'did_respond': True})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {'updated': ['conv_1', 'conv_2'], 'not_found': ['missing'], 'did_respond': True}
+        )
+        self.assertTrue(await self.did_respond('conv_1'))
+        self.assertTrue(await self.did_respond('conv_2'))
+
+    async def test_publishes_an_event_per_updated_call(self):
+        await self.post({'call_ids': ['conv_1', 'missing'], 'did_respond': True})
+
+        events = [event async for event in CallEvent.objects.all()]
+        self.assertEqual([(event.type, event.call_id) for event in events], [(CallEvent.Type.UPDATED, 'conv_1')])
+
+    async def test_invalid_bodies(self):
+        bodies = [
+            {'call_ids': [], 'did_respond': True},
+            {'call_ids': ['conv_1']},
+            {'call_ids': [f'conv_{i}' for i in range(501)], 'did_respond': True},
+            ['conv_1'],
+            '"conv_1"',
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                response = await self.post(body)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()['error'], 'Invalid request')
+
+
+class CallEditViewTests(CallEditTestCase):
+    async def post(self, call_id, body):
+        url = reverse('calls:call-edit', args=[call_id])
+        return await self.async_client.post(url, body, content_type='application/json')
+
+    async def test_updates_call(self):
+        response = await self.post('conv_1', {'did_respond': True})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'id': 'conv_1', 'did_respond': True})
+        self.assertTrue(await self.did_respond('conv_1'))
+        self.assertFalse(await self.did_respond('conv_2'))
+
+    async def test_missing_call(self):
+        response = await self.post('missing', {'did_respond': True})
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,148 @@
+import datetime
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api import settings
+from api.calls.schemas import CallData, TranscriptTurn
+from api.calls.services import call_notifications
+from api.calls.services.call_notifications import (
+    cap_transcript, format_call_email, get_zone, send_call_notification
+)
+
+UTC = datetime.timezone.utc
+
+
+def make_call(**fields):
+    defaults = {
+        'summary': 'Asked about hours',
+        'phone_number': '16195551234',
+        'caller_name': 'Ann',
+        'started_at': datetime.datetime(2026, 7, 4, 18, 30, tzinfo=UTC),
+        'ended_at': datetime.datetime(2026, 7, 4, 18, 32, 5, tzinfo=UTC),
+        'transcript': [TranscriptTurn(role='agent', message='Hello'), TranscriptTurn(role='user', message='Hi')],
+    }
+    return CallData(**{**defaults, **fields})
+
+
+class CallEmailTestCase(SimpleTestCase):
+    def setUp(self):
+        for patcher in (
+                mock.patch.object(settings, 'EMAIL_DEFAULT_TIMEZONE', 'America/New_York'),
+                mock.patch.object(settings, 'EMAIL_TRANSCRIPT_MAX_CHARS', 20000),
+                mock.patch.object(settings, 'CALL_LINK_BASE_URL', ''),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        get_zone.cache_clear()
+        self.addCleanup(get_zone.cache_clear)
+
+
+class FormatCallEmailTests(CallEmailTestCase):
+    def test_subject_and_plain_body(self):
+        subject, plain_body, html_body = format_call_email(make_call(), 'conv_1')
+
+        self.assertEqual(subject, '[07/04 Call from (619) 555-1234]')
+        self.assertEqual(plain_body, (
+            'Caller Phone Number: 16195551234\n'
+            'Caller Name: Ann\n'
+            'Date: July 04, 2026 at 02:30 PM (EDT)\n'
+            'Duration: 2m 5s\n'
+            'Summary: Asked about hours\n'
+            'Full Transcript:\n'
+            'agent: Hello\nuser: Hi\n'
+        ))
+        self.assertIn('<strong>Caller Name:</strong> Ann', html_body)
+
+    def test_display_time_zone(self):
+        _, plain_body, _ = format_call_email(make_call(), 'conv_1', 'Europe/Paris')
+
+        self.assertIn('Date: July 04, 2026 at 08:30 PM (CEST)', plain_body)
+
+    def test_naive_start_is_utc(self):
+        call = make_call(started_at=datetime.datetime(2026, 1, 4, 18, 30), ended_at=None)
+
+        _, plain_body, _ = format_call_email(call, 'conv_1')
+
+        self.assertIn('Date: January 04, 2026 at 01:30 PM (EST)', plain_body)
+        self.assertIn('Duration: Unknown', plain_body)
+
+    def test_unknown_time_zones_fall_back(self):
+        _, plain_body, _ = format_call_email(make_call(), 'conv_1', 'Mars/Olympus')
+        self.assertIn('(EDT)', plain_body)
+
+        get_zone.cache_clear()
+        with mock.patch.object(settings, 'EMAIL_DEFAULT_TIMEZONE', 'Mars/Olympus'):
+            _, plain_body, _ = format_call_email(make_call(), 'conv_1')
+        self.assertIn('06:30 PM (UTC)', plain_body)
+
+    def test_html_escapes_call_values(self):
+        call = make_call(
+            caller_name='<b>Ann</b>',
+            summary='Tom & Jerry <script>',
+            transcript=[TranscriptTurn(role='user', message='a < b')]
+        )
+
+        _, plain_body, html_body = format_call_email(call, 'conv_1')
+
+        self.assertIn('&lt;b&gt;Ann&lt;/b&gt;', html_body)
+        self.assertIn('Tom &amp; Jerry &lt;script&gt;', html_body)
+        self.assertIn('user: a &lt; b', html_body)
+        self.assertNotIn('<script>', html_body)
+        self.assertIn('Summary: Tom & Jerry <script>', plain_body)
+
+    def test_missing_caller_name_and_phone(self):
+        subject, plain_body, _ = format_call_email(make_call(caller_name=None, phone_number='', started_at=None), 'c')
+
+        self.assertEqual(subject, '[ Call from ]')
+        self.assertNotIn('Caller Name', plain_body)
+
+
+class CapTranscriptTests(CallEmailTestCase):
+    def long_call(self):
+        return make_call(transcript=[TranscriptTurn(role='user', message='x' * 50) for _ in range(300)])
+
+    def test_short_transcript_is_not_cut(self):
+        self.assertEqual(cap_transcript(make_call().transcript), ('agent: Hello\nuser: Hi\n', False))
+
+    @mock.patch.object(settings, 'EMAIL_TRANSCRIPT_MAX_CHARS', 1000)
+    def test_long_transcript_is_cut(self):
+        text, truncated = cap_transcript(self.long_call().transcript)
+
+        self.assertTrue(truncated)
+        self.assertEqual(len(text), 1000)
+
+    @mock.patch.object(settings, 'EMAIL_TRANSCRIPT_MAX_CHARS', 0)
+    def test_zero_never_cuts(self):
+        text, truncated = cap_transcript(self.long_call().transcript)
+
+        self.assertFalse(truncated)
+        self.assertEqual(len(text), 300 * 57)
+
+    @mock.patch.object(settings, 'EMAIL_TRANSCRIPT_MAX_CHARS', 1000)
+    def test_cut_transcript_links_to_call(self):
+        _, plain_body, _ = format_call_email(self.long_call(), 'conv_1')
+        self.assertTrue(plain_body.endswith('[Transcript shortened. See call conv_1 for the full transcript.]'))
+
+        with mock.patch.object(settings, 'CALL_LINK_BASE_URL', 'https://calls.example.com/'):
+            _, plain_body, html_body = format_call_email(self.long_call(), 'conv_1')
+        self.assertTrue(plain_body.endswith('Full call: https://calls.example.com/calls/detail/conv_1/]'))
+        self.assertIn('<a href="https://calls.example.com/calls/detail/conv_1/">', html_body)
+
+
+class SendCallNotificationTests(CallEmailTestCase):
+    def test_renders_once_per_time_zone(self):
+        recipients = ['a@example.com', 'B@example.com', 'c@example.com']
+        time_zones = {'b@example.com': 'Europe/Paris'}
+        with mock.patch.object(settings, 'EMAIL_DIGEST_ENABLED', False), \
+                mock.patch.object(settings, 'EMAIL_SUMMARY_RECIPIENTS', recipients), \
+                mock.patch.object(settings, 'EMAIL_RECIPIENT_TIMEZONES', time_zones), \
+                mock.patch.object(call_notifications, 'send_email') as send_email, \
+                mock.patch.object(call_notifications, 'format_call_email', wraps=format_call_email) as format_email:
+            send_call_notification(make_call(), 'conv_1')
+
+        self.assertEqual(format_email.call_count, 2)
+        sent = {call.args[0]: call.args[2] for call in send_email.call_args_list}
+        self.assertEqual(sorted(sent), ['B@example.com', 'a@example.com', 'c@example.com'])
+        self.assertIn('(CEST)', sent['B@example.com'])
+        self.assertIn('(EDT)', sent['c@example.com'])
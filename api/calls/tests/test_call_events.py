@@ -0,0 +1,145 @@
+import asyncio
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from api import settings
+from api.calls.models import CallEvent
+from api.calls.services import call_events
+from api.calls.services.call_events import HEARTBEAT, get_call_event_hub, publish_call_event
+
+
+def event(event_id, event_type, data):
+    return call_events.encode_event(event_id, event_type, data)
+
+
+class CallEventHubTests(TestCase):
+    def setUp(self):
+        for name, value in (
+                ('CALL_EVENTS_POLL_INTERVAL', 0.01),
+                ('CALL_EVENTS_HEARTBEAT_INTERVAL', 5),
+                ('CALL_EVENTS_BUFFER_SIZE', 10),
+        ):
+            patcher = mock.patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def subscribe(self, last_event_id=None):
+        """Subscribe to this loop's hub, returning the hub and the stream after its retry message"""
+        hub = get_call_event_hub()
+        stream = hub.subscribe(last_event_id)
+        self.assertEqual(await self.next(stream), b"retry: 5000\n\n")
+        return hub, stream
+
+    async def next(self, stream):
+        return await asyncio.wait_for(stream.__anext__(), 1)
+
+    async def close(self, hub, stream):
+        await stream.aclose()
+        hub._poller.cancel()
+
+    async def create_events(self, count):
+        events = [
+            await CallEvent.objects.acreate(type=CallEvent.Type.UPDATED, call_id=f'conv_{i}', data='{}')
+            for i in range(count)
+        ]
+        return [event.id for event in events]
+
+    async def test_published_event_reaches_subscribers(self):
+        hub, first = await self.subscribe()
+        _, second = await self.subscribe()
+
+        await publish_call_event(CallEvent.Type.UPDATED, 'conv_1', {'id': 'conv_1', 'did_respond': True})
+
+        event_id = (await CallEvent.objects.alatest('id')).id
+        expected = event(event_id, 'call.updated', '{"id":"conv_1","did_respond":true}')
+        self.assertEqual(await self.next(first), expected)
+        self.assertEqual(await self.next(second), expected)
+        await self.close(hub, first)
+        await second.aclose()
+
+    async def test_resumes_after_last_event_id(self):
+        first, second, third = await self.create_events(3)
+
+        hub, stream = await self.subscribe(first)
+
+        self.assertEqual(
+            await self.next(stream),
+            event(second, 'call.updated', '{}') + event(third, 'call.updated', '{}')
+        )
+        await self.close(hub, stream)
+
+    async def test_reset_for_unknown_event_id(self):
+        (latest,) = await self.create_events(1)
+
+        hub, stream = await self.subscribe(latest + 100)
+
+        self.assertEqual(await self.next(stream), event(latest, 'reset', '{}'))
+        await self.close(hub, stream)
+
+    async def test_reset_when_missed_events_were_purged(self):
+        ids = await self.create_events(3)
+        await CallEvent.objects.filter(id__in=ids[:2]).adelete()
+
+        hub, stream = await self.subscribe(ids[0] - 1)
+
+        self.assertEqual(await self.next(stream), event(ids[2], 'reset', '{}'))
+        await self.close(hub, stream)
+
+    async def test_reset_when_too_many_events_were_missed(self):
+        ids = await self.create_events(settings.CALL_EVENTS_BUFFER_SIZE + 1)
+
+        hub, stream = await self.subscribe(ids[0] - 1)
+
+        self.assertEqual(await self.next(stream), event(ids[-1], 'reset', '{}'))
+        await self.close(hub, stream)
+
+    async def test_heartbeat_without_events(self):
+        with mock.patch.object(settings, 'CALL_EVENTS_HEARTBEAT_INTERVAL', 0.01):
+            hub, stream = await self.subscribe()
+
+            self.assertEqual(await self.next(stream), HEARTBEAT)
+        await self.close(hub, stream)
+
+    async def test_restart_after_idle_starts_from_latest_event(self):
+        hub, stream = await self.subscribe()
+        await self.close(hub, stream)
+        (missed,) = await self.create_events(1)
+
+        hub, stream = await self.subscribe()
+
+        self.assertEqual((hub._last_id, hub._floor), (missed, missed))
+        await publish_call_event(CallEvent.Type.UPDATED, 'conv_2', {'id': 'conv_2'})
+        self.assertEqual(await self.next(stream), event(missed + 1, 'call.updated', '{"id":"conv_2"}'))
+        await self.close(hub, stream)
+
+    def test_purge_old_events(self):
+        old, recent = (
+            CallEvent.objects.create(type=CallEvent.Type.UPDATED, call_id='conv_1', data='{}', created_at=created_at)
+            for created_at in (timezone.now() - timedelta(hours=25), timezone.now())
+        )
+
+        self.assertEqual(call_events.purge_old_events(), 1)
+        self.assertEqual(list(CallEvent.objects.values_list('id', flat=True)), [recent.id])
+
+
+class CallEventsViewTests(TestCase):
+    url = reverse('calls:call-events')
+
+    async def test_last_event_id_header_takes_precedence(self):
+        with mock.patch.object(call_events.CallEventHub, 'subscribe', return_value=iter([])) as subscribe:
+            response = await self.async_client.get(self.url, {'last_event_id': 3}, headers={'Last-Event-ID': '7'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(response['Cache-Control'], 'no-store')
+        subscribe.assert_called_once_with(7)
+
+    async def test_invalid_event_id(self):
+        response = await self.async_client.get(self.url, {'last_event_id': 'abc'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Invalid event ID')
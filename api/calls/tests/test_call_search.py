@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from api.calls.models import CallSearchDocument
+from api.calls.schemas import CallData, TranscriptTurn
+from api.calls.services.call_search import (
+    build_match_query, index_call, index_calls, phone_query_digits, phone_tokens, search_calls
+)
+
+START = datetime(2026, 3, 1, tzinfo=dt_timezone.utc)
+
+
+class QueryTests(SimpleTestCase):
+    def test_phone_tokens(self):
+        self.assertEqual(phone_tokens('+1 (619) 555-1234'), '16195551234 6195551234 5551234 1234')
+        self.assertEqual(phone_tokens('1234'), '1234')
+        self.assertEqual(phone_tokens(None), '')
+
+    def test_phone_query_digits(self):
+        self.assertEqual(phone_query_digits(' (619) 555-1234 '), '6195551234')
+        self.assertEqual(phone_query_digits('1500'), '1500')
+        self.assertIsNone(phone_query_digits('150'))
+        self.assertIsNone(phone_query_digits('botox 1500'))
+
+    def test_build_match_query(self):
+        self.assertEqual(build_match_query('botox price'), '"botox" "price"*')
+        self.assertEqual(build_match_query('NEAR and'), '"NEAR" "and"*')
+        self.assertEqual(build_match_query('555-1234'), 'phone_digits : "5551234"* OR ("555" "1234"*)')
+        self.assertIsNone(build_match_query(' -- '))
+
+
+class SearchCallsTests(TestCase):
+    def setUp(self):
+        index_calls([
+            ('conv_1', CallData(
+                caller_name='Ann Lee',
+                phone_number='+1 (619) 555-1234',
+                summary='Asked about botox prices',
+                created_at=START
+            )),
+            ('conv_2', CallData(
+                caller_name='Bob',
+                phone_number='+1 858 555 9876',
+                summary='Booked a facial',
+                transcript=[TranscriptTurn(role='user', message='Is the facial still 1500 <dollars>?')],
+                created_at=START + timedelta(days=1)
+            )),
+        ])
+
+    async def ids(self, text, **kwargs):
+        hits, _ = await search_calls(text, **kwargs)
+        return [hit['id'] for hit in hits]
+
+    async def test_words_match_stemmed_and_by_prefix(self):
+        self.assertEqual(await self.ids('pricing'), ['conv_1'])
+        self.assertEqual(await self.ids('fac'), ['conv_2'])
+        self.assertEqual(await self.ids('botox facial'), [])
+
+    async def test_phone_number_in_any_form(self):
+        for text in ('6195551234', '619-555-1234', '+1 619 555 1234', '1234'):
+            self.assertEqual(await self.ids(text), ['conv_1'], text)
+
+    async def test_phone_snippet_shows_stored_number(self):
+        hits, _ = await search_calls('555-1234')
+
+        self.assertEqual(hits[0]['snippet'], '<mark>+1 (619) 555-1234</mark>')
+
+    async def test_digits_also_match_text(self):
+        hits, _ = await search_calls('1500')
+
+        self.assertEqual([hit['id'] for hit in hits], ['conv_2'])
+        self.assertIn('<mark>1500</mark>', hits[0]['snippet'])
+        self.assertIn('&lt;dollars&gt;', hits[0]['snippet'])
+
+    async def test_created_filters(self):
+        self.assertEqual(await self.ids('555', created_after=START + timedelta(hours=1)), ['conv_2'])
+        self.assertEqual(await self.ids('555', created_before=START + timedelta(hours=1)), ['conv_1'])
+
+    async def test_pages(self):
+        first, next_offset = await search_calls('555', limit=1)
+        second, last_offset = await search_calls('555', limit=1, offset=next_offset)
+
+        self.assertEqual(next_offset, 1)
+        self.assertIsNone(last_offset)
+        self.assertEqual({first[0]['id'], second[0]['id']}, {'conv_1', 'conv_2'})
+
+    async def test_index_call_refreshes_document(self):
+        await index_call('conv_1', CallData(caller_name='Ann Lee', summary='Asked about fillers', created_at=START))
+
+        self.assertEqual(await self.ids('botox'), [])
+        self.assertEqual(await self.ids('fillers'), ['conv_1'])
+        self.assertEqual(await CallSearchDocument.objects.filter(call_id='conv_1').acount(), 1)
+
+    async def test_deleted_document_leaves_index(self):
+        await CallSearchDocument.objects.filter(call_id='conv_1').adelete()
+
+        self.assertEqual(await self.ids('botox'), [])
+
+
+class CallSearchViewTests(TestCase):
+    url = reverse('calls:call-search')
+
+    async def test_returns_hits(self):
+        await index_call('conv_1', CallData(summary='Asked about botox prices', created_at=START))
+
+        response = await self.async_client.get(self.url, {'q': 'botox'})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([hit['id'] for hit in body['results']], ['conv_1'])
+        self.assertEqual(body['results'][0]['snippet'], 'Asked about <mark>botox</mark> prices')
+        self.assertIsNone(body['next_offset'])
+
+    async def test_invalid_query(self):
+        for params in ({}, {'q': 'botox', 'limit': 0}):
+            response = await self.async_client.get(self.url, params)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['error'], 'Invalid query parameters')
@@ -0,0 +1,93 @@
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from api.calls.repositories.memory import InMemoryCallRepository
+from api.calls.schemas import CallData
+from api.calls.services import calls_service
+from api.calls.views import calls_export
+from api.calls.views.calls_export import encode_calls
+
+
+async def async_iter(items, error=None):
+    for item in items:
+        yield item
+    if error is not None:
+        raise error
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+class EncodeCallsTests(SimpleTestCase):
+    async def test_ndjson(self):
+        body = b''.join(await collect(encode_calls(async_iter([{'id': 'a'}, {'id': 'b'}]), 'ndjson')))
+
+        self.assertEqual(body, b'{"id":"a"}\n{"id":"b"}\n')
+
+    async def test_json_array(self):
+        body = b''.join(await collect(encode_calls(async_iter([{'id': 'a'}, {'id': 'b'}]), 'json')))
+
+        self.assertEqual(json.loads(body), [{'id': 'a'}, {'id': 'b'}])
+
+    async def test_empty_export(self):
+        self.assertEqual(await collect(encode_calls(async_iter([]), 'json')), [b'[]'])
+        self.assertEqual(await collect(encode_calls(async_iter([]), 'ndjson')), [])
+
+    @mock.patch.object(calls_export, 'EXPORT_CHUNK_SIZE', 30)
+    async def test_buffers_calls_into_chunks(self):
+        chunks = await collect(encode_calls(async_iter([{'id': f'call_{i}'} for i in range(10)]), 'ndjson'))
+
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(len(b''.join(chunks).splitlines()), 10)
+
+    async def test_read_error_truncates_export(self):
+        chunks = encode_calls(async_iter([{'id': 'a'}], error=RuntimeError('deadline exceeded')), 'json')
+
+        body = b''.join(await collect(chunks))
+
+        self.assertEqual(body, b'')
+
+
+class CallsExportViewTests(SimpleTestCase):
+    def setUp(self):
+        repository = InMemoryCallRepository()
+        start = datetime(2026, 3, 1, tzinfo=dt_timezone.utc)
+        repository.put_many(
+            (f'conv_{i}', CallData(summary=f'Call {i}', created_at=start + timedelta(minutes=i))) for i in range(3)
+        )
+
+        patcher = mock.patch.object(calls_service, 'get_call_repository', return_value=repository)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def get(self, **params):
+        response = await self.async_client.get(reverse('calls:calls-export'), params)
+        body = b''.join(await collect(response.streaming_content)) if response.streaming else response.content
+        return response, body
+
+    async def test_streams_every_call_newest_first(self):
+        response, body = await self.get()
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        calls = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([call['id'] for call in calls], ['conv_2', 'conv_1', 'conv_0'])
+        self.assertNotIn('transcript', calls[0])
+
+    async def test_json_mode_with_fields(self):
+        response, body = await self.get(mode='json', fields='summary')
+
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(
+            json.loads(body)[0],
+            {'id': 'conv_2', 'summary': 'Call 2', 'created_at': '2026-03-01T00:02:00Z'}
+        )
+
+    async def test_invalid_mode(self):
+        response, _ = await self.get(mode='csv')
+
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,119 @@
+import gzip
+from unittest import mock
+
+from django.core.cache import caches
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from api import compression
+from api.calls.utils import etag_matches
+from api.compression import CompressionMiddleware, choose_encoding, parse_accept_encoding
+
+JSON_BODY = b'[' + b','.join(b'{"id": "conv_%d", "summary": "Asked about hours"}' % i for i in range(50)) + b']'
+
+
+class NegotiationTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(compression, 'ENCODINGS', dict.fromkeys(['zstd', 'br', 'gzip']))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_parse_accept_encoding(self):
+        self.assertEqual(
+            parse_accept_encoding('gzip, BR;q=0.5, zstd;q=bad, ,identity;q=0'),
+            {'gzip': 1.0, 'br': 0.5, 'zstd': 0.0, 'identity': 0.0}
+        )
+
+    def test_server_preference_breaks_ties(self):
+        self.assertEqual(choose_encoding('gzip, br, zstd'), 'zstd')
+        self.assertEqual(choose_encoding('gzip, br'), 'br')
+
+    def test_client_q_values_rank_first(self):
+        self.assertEqual(choose_encoding('zstd;q=0.5, gzip'), 'gzip')
+
+    def test_wildcard(self):
+        self.assertEqual(choose_encoding('*'), 'zstd')
+        self.assertEqual(choose_encoding('*, zstd;q=0'), 'br')
+
+    def test_nothing_acceptable(self):
+        self.assertIsNone(choose_encoding(''))
+        self.assertIsNone(choose_encoding('identity, deflate'))
+        self.assertIsNone(choose_encoding('gzip;q=0'))
+
+
+class EtagMatchesTests(SimpleTestCase):
+    def test_no_header(self):
+        self.assertFalse(etag_matches('"a"', None))
+        self.assertFalse(etag_matches('"a"', ''))
+
+    def test_exact_and_listed(self):
+        self.assertTrue(etag_matches('"a"', '"a"'))
+        self.assertTrue(etag_matches('"a"', '"b", "a"'))
+        self.assertFalse(etag_matches('"a"', '"b"'))
+
+    def test_weak_comparison(self):
+        self.assertTrue(etag_matches('W/"a"', '"a"'))
+        self.assertTrue(etag_matches('"a"', 'W/"a"'))
+
+    def test_wildcard(self):
+        self.assertTrue(etag_matches('"a"', '*'))
+
+
+@override_settings(COMPRESSION_ENABLED=True, COMPRESSION_MIN_SIZE=200, COMPRESSION_CACHE_VARIANTS=True)
+class CompressionMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = CompressionMiddleware(lambda request: None)
+        caches['compression'].clear()
+
+    def process(self, response, accept_encoding='gzip'):
+        request = self.factory.get('/calls/list/', headers={'Accept-Encoding': accept_encoding})
+        return self.middleware.process_response(request, response)
+
+    def json_response(self, body=JSON_BODY):
+        response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = '"page"'
+        return response
+
+    def test_compresses_json(self):
+        response = self.process(self.json_response())
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), JSON_BODY)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        self.assertEqual(response['ETag'], 'W/"page"')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_leaves_small_and_non_json_bodies(self):
+        for response in (self.json_response(b'{}'), HttpResponse(JSON_BODY, content_type='audio/mpeg')):
+            with self.subTest(content_type=response['Content-Type']):
+                response = self.process(response)
+                self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_client_without_supported_encoding(self):
+        response = self.process(self.json_response(), accept_encoding='identity')
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, JSON_BODY)
+        self.assertEqual(response['ETag'], '"page"')
+
+    def test_reuses_cached_compressed_body(self):
+        with mock.patch.object(compression.gzip, 'compress', wraps=gzip.compress) as compress:
+            first = self.process(self.json_response())
+            second = self.process(self.json_response())
+
+        self.assertEqual(compress.call_count, 1)
+        self.assertEqual(first.content, second.content)
+
+    def test_compresses_streaming_response(self):
+        chunks = [JSON_BODY[:100], JSON_BODY[100:]]
+        response = self.process(StreamingHttpResponse(iter(chunks), content_type='application/x-ndjson'))
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), JSON_BODY)
+
+    @override_settings(COMPRESSION_ENABLED=False)
+    def test_disabled(self):
+        response = self.process(self.json_response())
+
+        self.assertFalse(response.has_header('Content-Encoding'))
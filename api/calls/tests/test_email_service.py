@@ -0,0 +1,165 @@
+import smtplib
+import socket
+from datetime import timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from api import email_service
+from api.calls.models import EmailOutboxMessage
+from api.email_service import (
+    OUTBOX_CLAIM_TIMEOUT, SMTPConnectionPool, claim_outbox_message, flush_outbox, is_transient_error, send_email
+)
+
+
+class IsTransientErrorTests(SimpleTestCase):
+    def test_transient_errors(self):
+        errors = [
+            smtplib.SMTPServerDisconnected('gone'),
+            smtplib.SMTPResponseException(421, b'try later'),
+            smtplib.SMTPRecipientsRefused({'a@example.com': (450, b'busy')}),
+            socket.timeout('timed out'),
+            ConnectionResetError(),
+        ]
+        for error in errors:
+            with self.subTest(error=error):
+                self.assertTrue(is_transient_error(error))
+
+    def test_permanent_errors(self):
+        errors = [
+            smtplib.SMTPAuthenticationError(535, b'bad login'),
+            smtplib.SMTPResponseException(550, b'no such user'),
+            smtplib.SMTPRecipientsRefused({'a@example.com': (450, b'busy'), 'b@example.com': (550, b'no')}),
+            smtplib.SMTPNotSupportedError('no STARTTLS'),
+            ValueError('not an SMTP error'),
+        ]
+        for error in errors:
+            with self.subTest(error=error):
+                self.assertFalse(is_transient_error(error))
+
+
+@override_settings(EMAIL_NOOP_INTERVAL=30)
+class SMTPConnectionPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.pool = SMTPConnectionPool(2)
+        patcher = mock.patch.object(self.pool, '_connect', side_effect=lambda: mock.Mock())
+        self.connect = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reuses_released_connection(self):
+        client = self.pool.acquire()
+        self.pool.release(client)
+
+        self.assertIs(self.pool.acquire(), client)
+        self.assertEqual(self.connect.call_count, 1)
+
+    def test_broken_connection_is_closed(self):
+        client = self.pool.acquire()
+        self.pool.release(client, broken=True)
+
+        client.quit.assert_called_once()
+        self.assertIsNot(self.pool.acquire(), client)
+
+    @override_settings(EMAIL_NOOP_INTERVAL=0)
+    def test_idle_connection_is_checked_with_noop(self):
+        client = self.pool.acquire()
+        client.noop.side_effect = smtplib.SMTPServerDisconnected('gone')
+        self.pool.release(client)
+
+        self.assertIsNot(self.pool.acquire(), client)
+        client.noop.assert_called_once()
+
+    def test_failed_connect_frees_its_slot(self):
+        self.connect.side_effect = OSError('unreachable')
+        for _ in range(3):
+            with self.assertRaises(OSError):
+                self.pool.acquire()
+
+        self.connect.side_effect = lambda: mock.Mock()
+        self.pool.acquire()
+        self.pool.acquire()
+
+
+@override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=3, EMAIL_OUTBOX_RETRY_BACKOFF=60)
+class EmailOutboxTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(email_service, 'start_outbox_worker')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def deliver(self, side_effect=None):
+        patcher = mock.patch.object(email_service, 'deliver_message', side_effect=side_effect)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_transient_failure_goes_to_outbox(self):
+        self.deliver(smtplib.SMTPServerDisconnected('gone'))
+
+        send_email('a@example.com', 'Subject', 'Body')
+
+        message = EmailOutboxMessage.objects.get()
+        self.assertEqual(message.status, EmailOutboxMessage.Status.PENDING)
+        self.assertEqual(message.attempts, 1)
+        email_service.start_outbox_worker.assert_called_once()
+
+    def test_permanent_failure_is_not_retried(self):
+        self.deliver(smtplib.SMTPRecipientsRefused({'a@example.com': (550, b'no such user')}))
+
+        send_email('a@example.com', 'Subject', 'Body')
+
+        self.assertEqual(EmailOutboxMessage.objects.get().status, EmailOutboxMessage.Status.FAILED)
+        email_service.start_outbox_worker.assert_not_called()
+
+    def test_flush_sends_due_messages(self):
+        EmailOutboxMessage.objects.create(to='a@example.com', subject='Subject', body='Body', attempts=1)
+        EmailOutboxMessage.objects.create(
+            to='b@example.com', subject='Later', body='Body', attempts=1,
+            available_at=timezone.now() + timedelta(minutes=5)
+        )
+        deliver = self.deliver()
+
+        self.assertEqual(flush_outbox(), 1)
+        self.assertEqual(deliver.call_args.args[0]['To'], 'a@example.com')
+        self.assertEqual(list(EmailOutboxMessage.objects.values_list('to', flat=True)), ['b@example.com'])
+
+    def test_flush_backs_off_then_gives_up(self):
+        message = EmailOutboxMessage.objects.create(to='a@example.com', subject='Subject', body='Body', attempts=1)
+        self.deliver(smtplib.SMTPServerDisconnected('gone'))
+
+        before = timezone.now()
+        self.assertEqual(flush_outbox(), 0)
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutboxMessage.Status.PENDING)
+        self.assertEqual(message.attempts, 2)
+        self.assertIsNone(message.locked_at)
+        self.assertAlmostEqual((message.available_at - before).total_seconds(), 120, delta=1)
+
+        EmailOutboxMessage.objects.filter(id=message.id).update(available_at=timezone.now())
+        flush_outbox()
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutboxMessage.Status.FAILED)
+
+    def test_flush_fails_permanent_rejection(self):
+        message = EmailOutboxMessage.objects.create(to='a@example.com', subject='Subject', body='Body', attempts=1)
+        self.deliver(smtplib.SMTPResponseException(550, b'no such user'))
+
+        flush_outbox()
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutboxMessage.Status.FAILED)
+        self.assertEqual(message.attempts, 2)
+
+    def test_claimed_message_is_not_claimed_again(self):
+        message = EmailOutboxMessage.objects.create(to='a@example.com', subject='Subject', body='Body')
+
+        self.assertEqual(claim_outbox_message().id, message.id)
+        self.assertIsNone(claim_outbox_message())
+
+    def test_abandoned_claim_is_taken_over(self):
+        message = EmailOutboxMessage.objects.create(
+            to='a@example.com', subject='Subject', body='Body', status=EmailOutboxMessage.Status.SENDING,
+            locked_at=timezone.now() - OUTBOX_CLAIM_TIMEOUT - timedelta(seconds=1)
+        )
+
+        self.assertEqual(claim_outbox_message().id, message.id)
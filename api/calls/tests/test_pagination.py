@@ -0,0 +1,39 @@
+import base64
+from datetime import datetime, timezone as dt_timezone
+
+from django.test import SimpleTestCase
+
+from api.calls.services.calls_service import decode_cursor, encode_cursor
+
+
+class CursorTests(SimpleTestCase):
+    def test_round_trip(self):
+        created_at = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=dt_timezone.utc)
+        self.assertEqual(decode_cursor(encode_cursor(created_at, 'conv_123')), (created_at, 'conv_123'))
+
+    def test_round_trip_naive_datetime(self):
+        created_at = datetime(2026, 3, 1, 12, 30)
+        self.assertEqual(decode_cursor(encode_cursor(created_at, 'a')), (created_at, 'a'))
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(datetime(2026, 3, 1, tzinfo=dt_timezone.utc), '???>>>')
+        self.assertNotRegex(cursor, r'[+/]')
+
+    def test_malformed_cursors(self):
+        def encode(text):
+            return base64.urlsafe_b64encode(text.encode('utf-8')).decode('ascii')
+
+        cursors = [
+            'not a cursor',
+            'é',
+            encode('not json'),
+            encode('[1, 2]'),
+            encode('"text"'),
+            encode('{"id": "a"}'),
+            encode('{"created_at": "2026-03-01T00:00:00"}'),
+            encode('{"created_at": "yesterday", "id": "a"}'),
+        ]
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError):
+                    decode_cursor(cursor)
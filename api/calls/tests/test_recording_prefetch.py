@@ -0,0 +1,125 @@
+import asyncio
+import tempfile
+from unittest import mock
+
+import httpx
+from django.test import SimpleTestCase
+
+from api import settings
+from api.calls.services import recording_prefetch
+from api.calls.services.recording_cache import get_cached_recording, get_recording_path
+
+
+def audio_response(status_code=200, content=b'audio-bytes'):
+    return httpx.Response(status_code, content=content, headers={'Content-Length': str(len(content))})
+
+
+class RecordingPrefetchTests(SimpleTestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        for name, value in (
+                ('RECORDING_CACHE_ENABLED', True),
+                ('RECORDING_CACHE_DIR', cache_dir.name),
+                ('RECORDING_PREFETCH_ENABLED', True),
+                ('RECORDING_PREFETCH_DELAY', 0),
+                ('RECORDING_PREFETCH_BACKOFF', 0),
+                ('RECORDING_PREFETCH_RETRIES', 2),
+        ):
+            patcher = mock.patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(recording_prefetch, 'prefetch_semaphore', asyncio.Semaphore(1))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def patch_upstream(self, *responses):
+        patcher = mock.patch.object(
+            recording_prefetch, 'stream_conversation_audio', mock.AsyncMock(side_effect=responses)
+        )
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    async def test_download_caches_recording(self):
+        self.patch_upstream(audio_response())
+
+        self.assertTrue(await recording_prefetch.download_recording('conv_1'))
+        self.assertEqual(get_recording_path('conv_1').read_bytes(), b'audio-bytes')
+
+    async def test_download_of_missing_recording(self):
+        self.patch_upstream(audio_response(404, b'not found'))
+
+        self.assertFalse(await recording_prefetch.download_recording('conv_1'))
+        self.assertIsNone(get_cached_recording('conv_1'))
+
+    async def test_prefetch_retries_until_downloaded(self):
+        upstream = self.patch_upstream(
+            httpx.ConnectError('refused'), audio_response(503, b''), audio_response()
+        )
+        recording_prefetch.pending_conversation_ids.add('conv_1')
+
+        await recording_prefetch.prefetch_recording('conv_1')
+
+        self.assertEqual(upstream.await_count, 3)
+        self.assertIsNotNone(get_cached_recording('conv_1'))
+        self.assertNotIn('conv_1', recording_prefetch.pending_conversation_ids)
+
+    async def test_prefetch_gives_up_after_retries(self):
+        upstream = self.patch_upstream(*[audio_response(503, b'')] * 3)
+
+        await recording_prefetch.prefetch_recording('conv_1')
+
+        self.assertEqual(upstream.await_count, 3)
+        self.assertIsNone(get_cached_recording('conv_1'))
+
+    async def test_prefetch_skips_cached_recording(self):
+        get_recording_path('conv_1').write_bytes(b'cached')
+        upstream = self.patch_upstream()
+
+        await recording_prefetch.prefetch_recording('conv_1')
+
+        upstream.assert_not_awaited()
+
+
+class ScheduleRecordingPrefetchTests(SimpleTestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        for patcher in (
+                mock.patch.object(settings, 'RECORDING_CACHE_ENABLED', True),
+                mock.patch.object(settings, 'RECORDING_CACHE_DIR', cache_dir.name),
+                mock.patch.object(settings, 'RECORDING_PREFETCH_ENABLED', True),
+                mock.patch.object(recording_prefetch, 'pending_conversation_ids', set()),
+                mock.patch.object(recording_prefetch, 'get_prefetch_loop'),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # Close the coroutine instead of running it on the prefetch loop
+        patcher = mock.patch.object(
+            recording_prefetch.asyncio, 'run_coroutine_threadsafe', side_effect=lambda coro, loop: coro.close()
+        )
+        self.run_coroutine = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_queues_each_conversation_once(self):
+        recording_prefetch.schedule_recording_prefetch('conv_1')
+        recording_prefetch.schedule_recording_prefetch('conv_1')
+
+        self.assertEqual(self.run_coroutine.call_count, 1)
+        self.assertIn('conv_1', recording_prefetch.pending_conversation_ids)
+
+    def test_skips_when_disabled(self):
+        with mock.patch.object(settings, 'RECORDING_PREFETCH_ENABLED', False):
+            recording_prefetch.schedule_recording_prefetch('conv_1')
+
+        self.run_coroutine.assert_not_called()
+
+    def test_skips_uncacheable_and_cached_recordings(self):
+        get_recording_path('conv_1').write_bytes(b'cached')
+
+        recording_prefetch.schedule_recording_prefetch('conv_1')
+        recording_prefetch.schedule_recording_prefetch('../escape')
+
+        self.run_coroutine.assert_not_called()
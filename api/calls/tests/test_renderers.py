@@ -0,0 +1,80 @@
+import datetime
+import decimal
+import io
+import json
+import uuid
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import ORJSONParser
+from api.renderers import EventStreamRenderer, ORJSONRenderer
+
+UTC = datetime.timezone.utc
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def render(self, data, accepted_media_type=None):
+        return ORJSONRenderer().render(data, accepted_media_type)
+
+    def test_datetimes_render_like_drf(self):
+        values = [
+            datetime.datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=UTC),
+            datetime.datetime(2026, 3, 1, 12, 30, 15, tzinfo=UTC),
+            datetime.datetime(2026, 3, 1, 12, 30, 15, 500),
+            datetime.datetime(2026, 3, 1, 12, 30, tzinfo=ZoneInfo('America/New_York')),
+            datetime.datetime(2026, 3, 1, tzinfo=datetime.timezone(datetime.timedelta(0))),
+            DatetimeWithNanoseconds(2026, 3, 1, 12, 30, 15, 123456, tzinfo=UTC),
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(self.render({'at': value}), JSONRenderer().render({'at': value}))
+
+    def test_other_types_match_drf(self):
+        data = {
+            'date': datetime.date(2026, 3, 1),
+            'time': datetime.time(12, 30, 15, 123456),
+            'duration': datetime.timedelta(minutes=2),
+            'cost': decimal.Decimal('0.05'),
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'label': gettext_lazy('Calls'),
+            'nested': [{'ok': True, 'n': None}],
+            1: 'non-string key',
+        }
+
+        self.assertEqual(json.loads(self.render(data)), json.loads(JSONRenderer().render(data)))
+
+    def test_escapes_line_separators(self):
+        rendered = self.render({'message': 'one\u2028two\u2029three'})
+
+        self.assertEqual(rendered, b'{"message":"one\\u2028two\\u2029three"}')
+        self.assertEqual(json.loads(rendered), {'message': 'one\u2028two\u2029three'})
+
+    def test_indent_from_accept_header(self):
+        self.assertEqual(self.render({'a': 1}, 'application/json; indent=2'), b'{\n  "a": 1\n}')
+        self.assertEqual(self.render({'a': 1}, 'application/json'), b'{"a":1}')
+
+    def test_no_content(self):
+        self.assertEqual(self.render(None), b'')
+
+
+class EventStreamRendererTests(SimpleTestCase):
+    def test_renders_error_event(self):
+        rendered = EventStreamRenderer().render({'error': 'Invalid cursor'})
+
+        self.assertEqual(rendered, b'event: error\ndata: {"error":"Invalid cursor"}\n\n')
+
+
+class ORJSONParserTests(SimpleTestCase):
+    def test_parses_json(self):
+        parsed = ORJSONParser().parse(io.BytesIO(b'{"call_ids": ["a"], "n": 1.5}'))
+
+        self.assertEqual(parsed, {'call_ids': ['a'], 'n': 1.5})
+
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"call_ids": '))
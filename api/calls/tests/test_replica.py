@@ -0,0 +1,222 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone as django_timezone
+from google.cloud.firestore_v1.watch import ChangeType
+
+from api.calls.models import CallRecord, CallsReplicaLease
+from api.calls.repositories.memory import InMemoryCallRepository
+from api.calls.repositories.replica import LEASE_NAME, CallsReplica, ReplicatedCallRepository
+from api.calls.repositories.sqlite import SQLiteCallRepository
+from api.calls.schemas import CallData
+
+START = datetime(2026, 3, 1, tzinfo=dt_timezone.utc)
+
+
+def make_call(minute, **fields):
+    return CallData(summary=f'Call {minute}', created_at=START + timedelta(minutes=minute), **fields)
+
+
+def snapshot(call_id, minute):
+    return SimpleNamespace(
+        id=call_id,
+        to_dict=lambda: {'summary': f'Call {minute}', 'created_at': START + timedelta(minutes=minute)}
+    )
+
+
+def change(change_type, call_id, minute=0):
+    return SimpleNamespace(type=change_type, document=snapshot(call_id, minute))
+
+
+class FakeWatch:
+    def __init__(self, callback):
+        self.callback = callback
+        self.is_active = True
+
+    def unsubscribe(self):
+        self.is_active = False
+
+
+class FakeClient:
+    """Records the listeners the replica starts on the calls collection"""
+
+    def __init__(self):
+        self.watches = []
+
+    def collection(self, name):
+        return self
+
+    def on_snapshot(self, callback):
+        self.watches.append(FakeWatch(callback))
+        return self.watches[-1]
+
+
+class CallsReplicaTests(SimpleTestCase):
+    def setUp(self):
+        self.client = FakeClient()
+        self.replica = CallsReplica(InMemoryCallRepository(), client=self.client, check_interval=1)
+
+    def deliver(self, docs=(), changes=()):
+        self.client.watches[-1].callback(list(docs), list(changes), datetime.now(dt_timezone.utc))
+
+    async def stored_summaries(self):
+        return {call['id']: call['summary'] for call in await self.replica.local.list(10, fields=['summary'])}
+
+    async def test_first_snapshot_resyncs(self):
+        await self.replica.local.add('stale', make_call(9))
+        self.replica._check()
+        self.assertFalse(self.replica.is_synced)
+
+        self.deliver(docs=[snapshot('conv_1', 1), snapshot('conv_2', 2)])
+
+        self.assertTrue(self.replica.is_synced)
+        self.assertEqual(await self.stored_summaries(), {'conv_1': 'Call 1', 'conv_2': 'Call 2'})
+
+    async def test_later_snapshots_apply_changes(self):
+        self.replica._check()
+        self.deliver(docs=[snapshot('conv_1', 1), snapshot('conv_2', 2)])
+
+        self.deliver(changes=[
+            change(ChangeType.MODIFIED, 'conv_1', 5),
+            change(ChangeType.REMOVED, 'conv_2'),
+            change(ChangeType.ADDED, 'conv_3', 3),
+        ])
+
+        self.assertEqual(await self.stored_summaries(), {'conv_1': 'Call 5', 'conv_3': 'Call 3'})
+
+    def test_failed_snapshot_restarts_listener_with_resync(self):
+        self.replica._check()
+        self.deliver(docs=[snapshot('conv_1', 1)])
+
+        with mock.patch.object(self.replica.local, 'put_many', side_effect=RuntimeError('disk full')), \
+                self.assertLogs('api.calls.repositories.replica', 'ERROR'):
+            self.deliver(changes=[change(ChangeType.ADDED, 'conv_2', 2)])
+        self.assertFalse(self.replica.is_synced)
+        self.assertFalse(self.replica.is_listening)
+
+        with self.assertLogs('api.calls.repositories.replica', 'WARNING'):
+            self.replica._check()
+
+        self.assertEqual(len(self.client.watches), 2)
+        self.assertFalse(self.client.watches[0].is_active)
+        self.deliver(docs=[snapshot('conv_1', 1), snapshot('conv_2', 2)])
+        self.assertTrue(self.replica.is_synced)
+
+    def test_check_keeps_a_healthy_listener(self):
+        self.replica._check()
+        self.replica._check()
+
+        self.assertEqual(len(self.client.watches), 1)
+
+
+class ReplicatedCallRepositoryTests(SimpleTestCase):
+    def setUp(self):
+        self.source = InMemoryCallRepository()
+        self.replica = CallsReplica(InMemoryCallRepository(), client=FakeClient())
+        self.repository = ReplicatedCallRepository(self.source, self.replica)
+
+    async def test_reads_source_until_synced(self):
+        await self.source.add('conv_1', make_call(1))
+
+        self.assertEqual([call['id'] for call in await self.repository.list(10, fields=[])], ['conv_1'])
+        self.assertIsNotNone(await self.repository.get('conv_1'))
+
+        self.replica._synced.set()
+        self.assertEqual(await self.repository.list(10, fields=[]), [])
+        self.assertIsNone(await self.repository.get('conv_1'))
+
+    async def test_writes_go_to_source_and_local_copy(self):
+        self.replica._synced.set()
+
+        await self.repository.add('conv_1', make_call(1))
+        await self.repository.update('conv_1', {'did_respond': True})
+
+        for repository in (self.source, self.replica.local):
+            self.assertTrue((await repository.get('conv_1', ['did_respond']))['did_respond'])
+
+    async def test_write_already_mirrored_or_not_yet_mirrored(self):
+        await self.replica.local.add('conv_1', make_call(1))
+        await self.source.add('conv_2', make_call(2))
+
+        await self.repository.add('conv_1', make_call(1))
+        await self.repository.update('conv_2', {'did_respond': True})
+
+        self.assertIsNotNone(await self.source.get('conv_1'))
+        self.assertIsNone(await self.replica.local.get('conv_2'))
+
+    async def test_bulk_update_skips_calls_missing_from_source(self):
+        await self.source.add('conv_1', make_call(1))
+        await self.replica.local.add('conv_1', make_call(1))
+        await self.replica.local.add('conv_2', make_call(2))
+
+        not_found = await self.repository.bulk_update(['conv_1', 'conv_2'], {'did_respond': True})
+
+        self.assertEqual(not_found, ['conv_2'])
+        self.assertTrue((await self.replica.local.get('conv_1', ['did_respond']))['did_respond'])
+        self.assertFalse((await self.replica.local.get('conv_2', ['did_respond']))['did_respond'])
+
+
+class CallsReplicaLeaseTests(TestCase):
+    def make_replica(self, owner):
+        replica = CallsReplica(SQLiteCallRepository(), client=FakeClient(), check_interval=10)
+        replica._owner = owner
+        return replica
+
+    def test_only_one_process_listens(self):
+        first, second = self.make_replica('host:1'), self.make_replica('host:2')
+
+        first._check()
+        second._check()
+
+        self.assertTrue(first.is_listening)
+        self.assertFalse(second.is_listening)
+        self.assertEqual(CallsReplicaLease.objects.get(name=LEASE_NAME).owner, 'host:1')
+
+    def test_follower_takes_sync_state_from_holder(self):
+        holder, follower = self.make_replica('host:1'), self.make_replica('host:2')
+        holder._check()
+        holder._client.watches[-1].callback([snapshot('conv_1', 1)], [], datetime.now(dt_timezone.utc))
+
+        follower._check()
+
+        self.assertTrue(follower.is_synced)
+        self.assertTrue(CallsReplicaLease.objects.get(name=LEASE_NAME).synced)
+
+    def test_expired_lease_is_taken_over(self):
+        holder, follower = self.make_replica('host:1'), self.make_replica('host:2')
+        holder._check()
+        CallsReplicaLease.objects.filter(name=LEASE_NAME).update(
+            lease_until=django_timezone.now() - timedelta(seconds=1), synced=True
+        )
+
+        follower._check()
+        with self.assertLogs('api.calls.repositories.replica', 'WARNING'):
+            holder._check()
+
+        self.assertTrue(follower.is_listening)
+        self.assertFalse(holder.is_listening)
+        self.assertFalse(holder.is_synced)
+        lease = CallsReplicaLease.objects.get(name=LEASE_NAME)
+        self.assertEqual(lease.owner, 'host:2')
+        self.assertFalse(lease.synced)
+
+    def test_stop_releases_lease(self):
+        holder, follower = self.make_replica('host:1'), self.make_replica('host:2')
+        holder._check()
+
+        holder.stop()
+        follower._check()
+
+        self.assertTrue(follower.is_listening)
+
+    def test_failed_resync_keeps_previous_calls(self):
+        local = SQLiteCallRepository()
+        local.put_many([('conv_1', make_call(1)), ('conv_2', make_call(2))])
+
+        with mock.patch.object(local, 'delete_many', side_effect=RuntimeError('locked')):
+            with self.assertRaises(RuntimeError):
+                local.replace_all([('conv_3', make_call(3))])
+
+        self.assertEqual(sorted(CallRecord.objects.values_list('id', flat=True)), ['conv_1', 'conv_2'])
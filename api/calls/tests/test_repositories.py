@@ -0,0 +1,184 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import SimpleTestCase, TransactionTestCase
+
+from api.calls.benchmarks.fake_firestore import FakeAsyncClient
+from api.calls.repositories import firestore
+from api.calls.repositories.base import CallAlreadyExists, CallNotFound
+from api.calls.repositories.firestore import FirestoreCallRepository
+from api.calls.repositories.memory import InMemoryCallRepository
+from api.calls.repositories.sqlite import SQLiteCallRepository
+from api.calls.schemas import CallData, TranscriptTurn
+from api.database import WriteCoalescer
+
+START = datetime(2026, 3, 1, tzinfo=dt_timezone.utc)
+
+
+def make_call(minute, **fields):
+    return CallData(summary=f'Call {minute}', created_at=START + timedelta(minutes=minute), **fields)
+
+
+class CallRepositoryContract:
+    """Behaviour every CallRepository must have; subclasses provide make_repository()"""
+
+    def make_repository(self):
+        raise NotImplementedError
+
+    async def add_calls(self, repository, count=5):
+        for minute in range(count):
+            await repository.add(f'conv_{minute}', make_call(minute, did_respond=minute % 2 == 1))
+
+    async def test_add_and_get(self):
+        repository = self.make_repository()
+        call = make_call(
+            0,
+            caller_name='Ann',
+            phone_number='+16195551234',
+            started_at=datetime(2026, 3, 1, 12, 30, 15, 123000, tzinfo=dt_timezone.utc),
+            transcript=[TranscriptTurn(role='agent', message='Hello'), TranscriptTurn(role='user', message='Hi')]
+        )
+
+        await repository.add('conv_1', call)
+        stored = await repository.get('conv_1')
+
+        self.assertEqual(stored['id'], 'conv_1')
+        self.assertEqual(stored['caller_name'], 'Ann')
+        self.assertEqual(stored['started_at'], call.started_at)
+        self.assertEqual(stored['created_at'], START)
+        self.assertEqual(stored['transcript'], 'agent: Hello\nuser: Hi\n')
+
+    async def test_add_existing_call(self):
+        repository = self.make_repository()
+        await repository.add('conv_1', make_call(0))
+
+        with self.assertRaises(CallAlreadyExists):
+            await repository.add('conv_1', make_call(1))
+        self.assertEqual((await repository.get('conv_1'))['summary'], 'Call 0')
+
+    async def test_get_projection_and_missing_call(self):
+        repository = self.make_repository()
+        await repository.add('conv_1', make_call(0, caller_name='Ann'))
+
+        self.assertEqual(await repository.get('conv_1', ['caller_name']), {'id': 'conv_1', 'caller_name': 'Ann'})
+        self.assertIsNone(await repository.get('missing'))
+
+    async def test_update(self):
+        repository = self.make_repository()
+        await repository.add('conv_1', make_call(0))
+
+        await repository.update('conv_1', {'did_respond': True})
+
+        self.assertTrue((await repository.get('conv_1', ['did_respond']))['did_respond'])
+        with self.assertRaises(CallNotFound):
+            await repository.update('missing', {'did_respond': True})
+
+    async def test_bulk_update(self):
+        repository = self.make_repository()
+        await self.add_calls(repository, 3)
+
+        not_found = await repository.bulk_update(['conv_0', 'missing', 'conv_2'], {'did_respond': True})
+
+        self.assertEqual(not_found, ['missing'])
+        calls = await repository.list(10, fields=['did_respond'])
+        self.assertEqual([call['did_respond'] for call in calls], [True, True, True])
+
+    async def test_list_pages_newest_first(self):
+        repository = self.make_repository()
+        await self.add_calls(repository)
+
+        first = await repository.list(2, fields=['summary', 'created_at'])
+        after = (first[-1]['created_at'], first[-1]['id'])
+        second = await repository.list(10, after, ['summary', 'created_at'])
+
+        self.assertEqual([call['id'] for call in first], ['conv_4', 'conv_3'])
+        self.assertEqual([call['id'] for call in second], ['conv_2', 'conv_1', 'conv_0'])
+        self.assertEqual(set(first[0]), {'id', 'summary', 'created_at'})
+
+    async def test_list_breaks_ties_on_id(self):
+        repository = self.make_repository()
+        for call_id in ('conv_b', 'conv_a', 'conv_c'):
+            await repository.add(call_id, make_call(0))
+
+        first = await repository.list(1, fields=['created_at'])
+        rest = await repository.list(10, (first[0]['created_at'], first[0]['id']), ['created_at'])
+
+        self.assertEqual([call['id'] for call in first + rest], ['conv_c', 'conv_b', 'conv_a'])
+
+    async def test_list_filters(self):
+        repository = self.make_repository()
+        await self.add_calls(repository)
+
+        calls = await repository.list(10, fields=['did_respond'], filters={'did_respond': False})
+
+        self.assertEqual([call['id'] for call in calls], ['conv_4', 'conv_2', 'conv_0'])
+        with self.assertRaises(ValueError):
+            await repository.list(10, filters={'transcript': ''})
+
+    async def test_iter_all_reads_in_pages(self):
+        repository = self.make_repository()
+        await self.add_calls(repository)
+
+        calls = [call async for call in repository.iter_all(['summary'], page_size=2)]
+
+        self.assertEqual([call['id'] for call in calls], ['conv_4', 'conv_3', 'conv_2', 'conv_1', 'conv_0'])
+
+
+class LocalCallRepositoryContract(CallRepositoryContract):
+    """Mirroring methods of the repositories the replica can keep in sync"""
+
+    async def test_put_many_inserts_and_replaces(self):
+        repository = self.make_repository()
+        await repository.add('conv_0', make_call(0))
+
+        await sync_to_async(repository.put_many)([('conv_0', make_call(5)), ('conv_1', make_call(1))])
+
+        calls = await repository.list(10, fields=['summary'])
+        self.assertEqual(
+            [(call['id'], call['summary']) for call in calls], [('conv_0', 'Call 5'), ('conv_1', 'Call 1')]
+        )
+
+    async def test_delete_many(self):
+        repository = self.make_repository()
+        await self.add_calls(repository, 3)
+
+        await sync_to_async(repository.delete_many)(['conv_1', 'missing'])
+
+        self.assertEqual([call['id'] for call in await repository.list(10, fields=[])], ['conv_2', 'conv_0'])
+
+    async def test_replace_all(self):
+        repository = self.make_repository()
+        await self.add_calls(repository, 3)
+
+        await sync_to_async(repository.replace_all)([('conv_1', make_call(7)), ('conv_9', make_call(9))])
+
+        calls = await repository.list(10, fields=['summary'])
+        self.assertEqual(
+            [(call['id'], call['summary']) for call in calls], [('conv_9', 'Call 9'), ('conv_1', 'Call 7')]
+        )
+
+
+class InMemoryCallRepositoryTests(LocalCallRepositoryContract, SimpleTestCase):
+    def make_repository(self):
+        return InMemoryCallRepository()
+
+
+# Adding an existing call fails with an IntegrityError, which would break a TestCase's transaction
+class SQLiteCallRepositoryTests(LocalCallRepositoryContract, TransactionTestCase):
+    def make_repository(self):
+        return SQLiteCallRepository()
+
+
+class FirestoreCallRepositoryTests(CallRepositoryContract, SimpleTestCase):
+    def make_repository(self):
+        client = FakeAsyncClient()
+        for name, value in (
+                ('get_async_firestore_client', lambda: client),
+                ('get_async_calls_collection', lambda: client.collection('calls')),
+                ('get_calls_write_coalescer', lambda: WriteCoalescer(client, 'calls', max_batch_size=500, window=0)),
+        ):
+            patcher = mock.patch.object(firestore, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return FirestoreCallRepository()
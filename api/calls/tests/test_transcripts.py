@@ -0,0 +1,86 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api import settings
+from api.calls.benchmarks.fake_firestore import FakeAsyncClient
+from api.calls.schemas import CallData, TranscriptTurn
+from api.calls.services.transcripts import (
+    TRANSCRIPT_DOC_ID, TRANSCRIPT_SUBCOLLECTION, build_call_document, compress_turns, decode_transcript,
+    decompress_turns, encode_transcript, load_transcript, pack_turns, render_transcript
+)
+
+TURNS = [
+    TranscriptTurn(role='agent', message='Hello, how can I help?', time_in_call_secs=0.5),
+    TranscriptTurn(role='user', message='Line one\nline two'),
+]
+
+
+def long_turns(count=200):
+    return [
+        TranscriptTurn(role='user', message=f'Turn number {i} of a long call', time_in_call_secs=i)
+        for i in range(count)
+    ]
+
+
+class TranscriptEncodingTests(SimpleTestCase):
+    def test_pack_uses_short_keys(self):
+        self.assertEqual(
+            pack_turns(TURNS),
+            [{'r': 'agent', 'm': 'Hello, how can I help?', 't': 0.5}, {'r': 'user', 'm': 'Line one\nline two'}]
+        )
+
+    def test_compress_round_trip(self):
+        self.assertEqual(decompress_turns(compress_turns(TURNS)), TURNS)
+        self.assertEqual(decompress_turns(b''), [])
+
+    def test_short_transcript_is_stored_plain(self):
+        stored, size = encode_transcript(TURNS)
+
+        self.assertEqual(stored, {'turns': pack_turns(TURNS)})
+        self.assertEqual(decode_transcript(stored), TURNS)
+
+    def test_long_transcript_is_compressed(self):
+        turns = long_turns()
+
+        stored, size = encode_transcript(turns)
+
+        self.assertEqual(list(stored), ['zlib'])
+        self.assertEqual(size, len(stored['zlib']))
+        self.assertLess(size, settings.TRANSCRIPT_COMPRESS_THRESHOLD)
+        self.assertEqual(decode_transcript(stored), turns)
+
+    def test_decode_legacy_and_empty_transcripts(self):
+        self.assertEqual(
+            decode_transcript('agent: Hello\nuser: Hi'),
+            [TranscriptTurn(role='agent', message='Hello'), TranscriptTurn(role='user', message='Hi')]
+        )
+        self.assertEqual(decode_transcript(None), [])
+        self.assertEqual(decode_transcript(''), [])
+
+    def test_render(self):
+        self.assertEqual(render_transcript(TURNS), 'agent: Hello, how can I help?\nuser: Line one\nline two\n')
+
+
+class CallDocumentTests(SimpleTestCase):
+    def test_transcript_stored_inline(self):
+        document, transcript_document = build_call_document(CallData(summary='Hi', transcript=TURNS))
+
+        self.assertIsNone(transcript_document)
+        self.assertEqual(document['summary'], 'Hi')
+        self.assertEqual(decode_transcript(document['transcript']), TURNS)
+
+    @mock.patch.object(settings, 'TRANSCRIPT_SUBCOLLECTION_ENABLED', True)
+    @mock.patch.object(settings, 'TRANSCRIPT_SUBCOLLECTION_MIN_BYTES', 100)
+    async def test_large_transcript_goes_in_subcollection(self):
+        turns = long_turns()
+        document, transcript_document = build_call_document(CallData(transcript=turns))
+
+        self.assertEqual(document['transcript'], {'subcollection': True, 'turn_count': len(turns)})
+
+        client = FakeAsyncClient()
+        doc_ref = client.collection('calls').document('conv_1')
+        await doc_ref.set(document)
+        await doc_ref.collection(TRANSCRIPT_SUBCOLLECTION).document(TRANSCRIPT_DOC_ID).set(transcript_document)
+
+        self.assertEqual(await load_transcript(doc_ref, document['transcript']), turns)
@@ -0,0 +1,149 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from api import settings
+from api.calls.models import CallIngest, WebhookJob
+from api.calls.repositories import CallAlreadyExists
+from api.calls.schemas import ElevenLabsWebhookPayload
+from api.calls.services import elevenlabs_webhook_service, webhook_dedup
+from api.calls.services.elevenlabs_webhook_service import IngestInProgress, claim_ingest, handle_elevenlabs_webhook
+from api.calls.services.webhook_dedup import RecentIdFilter
+from api.calls.views import elevenlabs_webhook
+
+
+def make_payload(conversation_id='conv_1', phone_number='+15551234567'):
+    return {
+        'type': 'post_call_transcription',
+        'event_timestamp': 1767225600,
+        'data': {
+            'conversation_id': conversation_id,
+            'transcript': [{'role': 'user', 'message': 'Hi', 'time_in_call_secs': 1}],
+            'metadata': {
+                'start_time_unix_secs': 1767225500,
+                'call_duration_secs': 90,
+                'phone_call': {'external_number': phone_number},
+            },
+            'analysis': {'transcript_summary': 'Asked about hours'},
+        },
+    }
+
+
+class IngestTestCase(TestCase):
+    def setUp(self):
+        self.repository = mock.Mock(add=mock.AsyncMock())
+        self.steps = {}
+        for name, patcher in (
+                ('get_call_repository', mock.patch.object(
+                    elevenlabs_webhook_service, 'get_call_repository', return_value=self.repository)),
+                ('invalidate_calls_cache', mock.patch.object(elevenlabs_webhook_service, 'invalidate_calls_cache')),
+                ('index_call', mock.patch.object(elevenlabs_webhook_service, 'index_call')),
+                ('publish_call_event', mock.patch.object(elevenlabs_webhook_service, 'publish_call_event')),
+                ('schedule_recording_prefetch', mock.patch.object(
+                    elevenlabs_webhook_service, 'schedule_recording_prefetch')),
+                ('send_call_notification', mock.patch.object(elevenlabs_webhook_service, 'send_call_notification')),
+                ('recent_conversation_ids', mock.patch.object(
+                    webhook_dedup, 'recent_conversation_ids', RecentIdFilter(10))),
+                ('debug_numbers', mock.patch.object(settings, 'DEBUG_NUMBERS', ['+15550000000'])),
+        ):
+            self.steps[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class HandleElevenLabsWebhookTests(IngestTestCase):
+    async def handle(self, **kwargs):
+        return await handle_elevenlabs_webhook(ElevenLabsWebhookPayload.model_validate(make_payload(**kwargs)))
+
+    async def test_runs_every_step_once(self):
+        self.assertEqual(await self.handle(), {'status': 'ok'})
+        self.assertEqual(await self.handle(), {'status': 'duplicate'})
+
+        self.repository.add.assert_awaited_once()
+        doc_id, call_data = self.repository.add.await_args.args
+        self.assertEqual(doc_id, 'conv_1')
+        self.assertEqual(call_data.phone_number, '+15551234567')
+        self.steps['publish_call_event'].assert_awaited_once()
+        self.steps['send_call_notification'].assert_called_once()
+
+        ingest = await CallIngest.objects.aget(conversation_id='conv_1')
+        self.assertIsNotNone(ingest.completed_at)
+        self.assertIsNone(ingest.leased_until)
+        self.assertIn('conv_1', webhook_dedup.recent_conversation_ids)
+
+    async def test_retry_resumes_after_completed_steps(self):
+        self.steps['send_call_notification'].side_effect = [RuntimeError('smtp down'), None]
+
+        with self.assertRaises(RuntimeError):
+            await self.handle()
+        self.assertNotIn('conv_1', webhook_dedup.recent_conversation_ids)
+
+        self.assertEqual(await self.handle(), {'status': 'ok'})
+        self.repository.add.assert_awaited_once()
+        self.steps['publish_call_event'].assert_awaited_once()
+        self.assertEqual(self.steps['send_call_notification'].call_count, 2)
+        self.assertEqual(self.steps['index_call'].await_count, 2)
+
+    async def test_retry_after_store_was_not_recorded(self):
+        await CallIngest.objects.acreate(conversation_id='conv_1')
+        self.repository.add.side_effect = CallAlreadyExists('conv_1')
+
+        self.assertEqual(await self.handle(), {'status': 'ok'})
+        self.steps['send_call_notification'].assert_called_once()
+
+    async def test_call_stored_before_ingest_tracking_is_duplicate(self):
+        self.repository.add.side_effect = CallAlreadyExists('conv_1')
+
+        self.assertEqual(await self.handle(), {'status': 'duplicate'})
+        self.steps['send_call_notification'].assert_not_called()
+
+    async def test_debug_number_is_ignored(self):
+        self.assertEqual(await self.handle(phone_number='+15550000000'), {'status': 'ignored'})
+        self.repository.add.assert_not_awaited()
+
+    async def test_concurrent_attempt_waits_for_lease(self):
+        ingest, created = await claim_ingest('conv_1')
+        self.assertTrue(created)
+
+        with self.assertRaises(IngestInProgress):
+            await claim_ingest('conv_1')
+
+
+class ElevenLabsWebhookViewTests(IngestTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(elevenlabs_webhook, 'start_webhook_worker')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.url = reverse('calls:elevenlabs-webhook')
+
+    async def post(self, body):
+        return await self.async_client.post(self.url, body, content_type='application/json')
+
+    async def test_queues_valid_payload(self):
+        response = await self.post(make_payload())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'queued')
+        self.assertEqual(await WebhookJob.objects.acount(), 1)
+
+    async def test_queues_retry_of_unfinished_delivery(self):
+        await self.post(make_payload())
+        response = await self.post(make_payload())
+
+        self.assertEqual(response.json()['status'], 'queued')
+        self.assertEqual(await WebhookJob.objects.acount(), 2)
+
+    async def test_drops_delivery_of_ingested_call(self):
+        webhook_dedup.remember_delivery('conv_1')
+
+        response = await self.post(make_payload())
+
+        self.assertEqual(response.json(), {'status': 'duplicate'})
+        self.assertEqual(await WebhookJob.objects.acount(), 0)
+
+    async def test_rejects_invalid_payload(self):
+        response = await self.post({'type': 'post_call_transcription', 'data': {'conversation_id': ''}})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(await WebhookJob.objects.acount(), 0)
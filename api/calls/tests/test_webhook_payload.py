@@ -0,0 +1,87 @@
+import json
+from datetime import datetime
+
+from django.test import SimpleTestCase
+from pydantic import ValidationError
+
+from api.calls.benchmarks.payloads import synthetic_payload
+from api.calls.schemas import ElevenLabsWebhookPayload, TranscriptTurn
+from api.calls.services.elevenlabs_webhook_service import build_call_data
+
+
+def load_payload(**changes):
+    """Synthetic payload as a dict, with `data` keys replaced by `changes`"""
+    payload = json.loads(synthetic_payload(2))
+    payload['data'].update(changes)
+    return payload
+
+
+class ElevenLabsWebhookPayloadTests(SimpleTestCase):
+    def test_validates_raw_body(self):
+        payload = ElevenLabsWebhookPayload.model_validate_json(synthetic_payload(3))
+
+        self.assertEqual(payload.type, 'post_call_transcription')
+        self.assertEqual(payload.data.conversation_id, 'conv_0123456789')
+        self.assertEqual(payload.data.transcript[1], TranscriptTurn(
+            role='user',
+            message="Turn 1: I'd like to book a hydrafacial sometime next Tuesday afternoon if possible.",
+            time_in_call_secs=4
+        ))
+        self.assertEqual(payload.data.analysis.data_collection_results['name'].value, 'Ann')
+
+    def test_invalid_payloads(self):
+        bodies = [
+            b'not json',
+            b'{"type": "post_call_transcription"}',
+            json.dumps(load_payload(conversation_id='')),
+            json.dumps(load_payload(metadata={'call_duration_secs': 10})),
+            json.dumps(load_payload(transcript='agent: Hello')),
+        ]
+        for body in bodies:
+            with self.subTest(body=body[:60]):
+                with self.assertRaises(ValidationError):
+                    ElevenLabsWebhookPayload.model_validate_json(body)
+
+
+class BuildCallDataTests(SimpleTestCase):
+    def build(self, **changes):
+        return build_call_data(ElevenLabsWebhookPayload.model_validate(load_payload(**changes)))
+
+    def test_maps_phone_call(self):
+        call_data = self.build()
+
+        self.assertEqual(call_data.summary, 'Caller wants to book a hydrafacial next Tuesday afternoon.')
+        self.assertEqual(call_data.recording_url, '/calls/elevenlabs_stream/conv_0123456789/')
+        self.assertEqual(call_data.started_at, datetime.fromtimestamp(1750000000))
+        self.assertEqual(call_data.ended_at, datetime.fromtimestamp(1750000008))
+        self.assertEqual(call_data.ended_reason, 'Client disconnected')
+        self.assertEqual(call_data.caller_name, 'Ann')
+        self.assertEqual(call_data.success_evaluation, 'success')
+        self.assertEqual(call_data.cost, 412)
+        self.assertEqual(call_data.phone_number, '+16195551234')
+        self.assertEqual(len(call_data.transcript), 2)
+        self.assertFalse(call_data.did_respond)
+
+    def test_web_call_without_name(self):
+        payload = load_payload()
+        del payload['data']['metadata']['phone_call']
+        payload['data']['analysis'] = {'data_collection_results': {'name': {'value': None}}}
+
+        call_data = build_call_data(ElevenLabsWebhookPayload.model_validate(payload))
+
+        self.assertEqual(call_data.phone_number, '')
+        self.assertEqual(call_data.caller_name, '')
+        self.assertEqual(call_data.summary, '')
+
+    def test_null_optional_fields(self):
+        payload = load_payload()
+        payload['data']['metadata'].update(cost=None, termination_reason=None)
+        payload['data']['analysis'].update(transcript_summary=None, call_successful=None)
+        payload['data']['transcript'][0]['message'] = None
+
+        call_data = build_call_data(ElevenLabsWebhookPayload.model_validate(payload))
+
+        self.assertEqual(call_data.cost, 0.0)
+        self.assertEqual(call_data.ended_reason, '')
+        self.assertEqual(call_data.summary, '')
+        self.assertEqual(call_data.transcript[0].message, '')
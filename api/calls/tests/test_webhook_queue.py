@@ -0,0 +1,186 @@
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from api import settings
+from api.calls.models import WebhookJob
+from api.calls.services import webhook_queue
+from api.calls.services.webhook_queue import (
+    claim_next_job, complete_job, enqueue_webhook, fail_job, process_job, requeue_dead_jobs
+)
+
+WEBHOOK_BODY = (
+    '{"type": "post_call_transcription", "event_timestamp": 1767225600, '
+    '"data": {"conversation_id": "conv_1", "metadata": {"start_time_unix_secs": 1767225500, '
+    '"call_duration_secs": 90}}}'
+)
+
+
+class WebhookJobClaimTests(TestCase):
+    def test_claims_due_job_once(self):
+        job = WebhookJob.objects.create(payload='{}')
+
+        claimed = claim_next_job()
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(claimed.status, WebhookJob.Status.PROCESSING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNotNone(claimed.locked_at)
+
+        self.assertIsNone(claim_next_job())
+
+    def test_claims_oldest_first(self):
+        first = WebhookJob.objects.create(payload='{}')
+        second = WebhookJob.objects.create(payload='{}')
+
+        self.assertEqual(claim_next_job().id, first.id)
+        self.assertEqual(claim_next_job().id, second.id)
+
+    def test_skips_jobs_not_yet_due(self):
+        WebhookJob.objects.create(payload='{}', available_at=timezone.now() + timedelta(minutes=5))
+
+        self.assertIsNone(claim_next_job())
+
+    def test_reclaims_job_of_crashed_worker(self):
+        stale = timezone.now() - timedelta(seconds=settings.WEBHOOK_QUEUE_VISIBILITY_TIMEOUT + 1)
+        job = WebhookJob.objects.create(
+            payload='{}', status=WebhookJob.Status.PROCESSING, attempts=1, locked_at=stale
+        )
+
+        claimed = claim_next_job()
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(claimed.attempts, 2)
+
+    def test_leaves_job_of_running_worker(self):
+        WebhookJob.objects.create(
+            payload='{}', status=WebhookJob.Status.PROCESSING, attempts=1, locked_at=timezone.now()
+        )
+
+        self.assertIsNone(claim_next_job())
+
+    def test_complete(self):
+        WebhookJob.objects.create(payload='{}')
+        job = claim_next_job()
+
+        complete_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, WebhookJob.Status.DONE)
+        self.assertIsNone(job.locked_at)
+        self.assertIsNone(claim_next_job())
+
+
+class WebhookJobRetryTests(TestCase):
+    def test_failure_is_retried_after_backoff(self):
+        WebhookJob.objects.create(payload='{}')
+        job = claim_next_job()
+
+        fail_job(job, RuntimeError('boom'))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, WebhookJob.Status.PENDING)
+        self.assertIsNone(job.locked_at)
+        self.assertIn('boom', job.last_error)
+        self.assertGreater(job.available_at, timezone.now())
+        self.assertIsNone(claim_next_job())
+
+        WebhookJob.objects.filter(id=job.id).update(available_at=timezone.now())
+        self.assertEqual(claim_next_job().attempts, 2)
+
+    def test_backoff_doubles(self):
+        WebhookJob.objects.create(payload='{}')
+        delays = []
+        with mock.patch.object(settings, 'WEBHOOK_QUEUE_MAX_ATTEMPTS', 10):
+            for _ in range(3):
+                job = claim_next_job()
+                before = timezone.now()
+                fail_job(job, RuntimeError('boom'))
+                job.refresh_from_db()
+                delays.append((job.available_at - before).total_seconds())
+                WebhookJob.objects.filter(id=job.id).update(available_at=timezone.now())
+
+        backoff = settings.WEBHOOK_QUEUE_RETRY_BACKOFF
+        for delay, expected in zip(delays, (backoff, backoff * 2, backoff * 4)):
+            self.assertAlmostEqual(delay, expected, delta=1)
+
+    def test_dead_letters_after_max_attempts(self):
+        WebhookJob.objects.create(payload='{}')
+        with mock.patch.object(settings, 'WEBHOOK_QUEUE_MAX_ATTEMPTS', 2):
+            for _ in range(2):
+                job = claim_next_job()
+                fail_job(job, RuntimeError('boom'))
+                WebhookJob.objects.filter(id=job.id).update(available_at=timezone.now())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, WebhookJob.Status.DEAD)
+        self.assertIsNone(claim_next_job())
+
+    def test_no_retry_dead_letters_at_once(self):
+        WebhookJob.objects.create(payload='{}')
+        job = claim_next_job()
+
+        fail_job(job, ValueError('bad payload'), retry=False)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, WebhookJob.Status.DEAD)
+        self.assertEqual(job.attempts, 1)
+
+    def test_requeue_dead_jobs(self):
+        job = WebhookJob.objects.create(payload='{}', status=WebhookJob.Status.DEAD, attempts=5)
+
+        self.assertEqual(requeue_dead_jobs(), 1)
+
+        claimed = claim_next_job()
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(claimed.attempts, 1)
+
+
+class ProcessJobTests(TestCase):
+    async def claim(self):
+        await enqueue_webhook(WEBHOOK_BODY)
+        return await sync_to_async(claim_next_job)()
+
+    async def test_handled_job_is_done(self):
+        job = await self.claim()
+        with mock.patch.object(webhook_queue, 'handle_elevenlabs_webhook') as handle:
+            await process_job(job)
+
+        self.assertEqual(handle.await_args.args[0].data.conversation_id, 'conv_1')
+        await job.arefresh_from_db()
+        self.assertEqual(job.status, WebhookJob.Status.DONE)
+
+    async def test_failed_job_is_retried(self):
+        job = await self.claim()
+        with mock.patch.object(webhook_queue, 'handle_elevenlabs_webhook', side_effect=RuntimeError('boom')):
+            await process_job(job)
+
+        await job.arefresh_from_db()
+        self.assertEqual(job.status, WebhookJob.Status.PENDING)
+        self.assertIn('boom', job.last_error)
+
+    async def test_malformed_payload_is_dead_lettered(self):
+        await WebhookJob.objects.acreate(payload='{"type": "post_call_transcription"}')
+        job = await sync_to_async(claim_next_job)()
+        with mock.patch.object(webhook_queue, 'handle_elevenlabs_webhook') as handle:
+            await process_job(job)
+
+        handle.assert_not_awaited()
+        await job.arefresh_from_db()
+        self.assertEqual(job.status, WebhookJob.Status.DEAD)
+
+
+class ProcessWebhookQueueCommandTests(TestCase):
+    def test_refuses_process_local_calls_cache(self):
+        with mock.patch.object(settings, 'CALLS_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'):
+            with self.assertRaises(CommandError):
+                call_command('process_webhook_queue', '--drain')
+
+    def test_drains_queue_with_shared_calls_cache(self):
+        with mock.patch.object(settings, 'CALLS_CACHE_BACKEND', 'django.core.cache.backends.redis.RedisCache'), \
+                mock.patch('api.calls.management.commands.process_webhook_queue.run_worker') as run_worker:
+            call_command('process_webhook_queue', '--drain')
+
+        run_worker.assert_called_once_with(drain=True)
@@ -0,0 +1,60 @@
+import asyncio
+
+from django.test import SimpleTestCase
+from google.api_core.exceptions import AlreadyExists
+
+from api.calls.benchmarks.fake_firestore import FakeAsyncClient
+from api.database import WriteCoalescer
+
+
+class WriteCoalescerTests(SimpleTestCase):
+    def setUp(self):
+        self.client = FakeAsyncClient()
+
+    def coalescer(self, max_batch_size=10, window=0.01):
+        return WriteCoalescer(self.client, 'calls', max_batch_size=max_batch_size, window=window)
+
+    async def stored(self, doc_id, collection='calls'):
+        snapshot = await self.client.collection(collection).document(doc_id).get()
+        return snapshot.to_dict()
+
+    async def test_concurrent_creates_share_one_commit(self):
+        coalescer = self.coalescer()
+
+        await asyncio.gather(*(coalescer.create(f'conv_{i}', {'n': i}) for i in range(5)))
+
+        self.assertEqual(self.client.commits, 1)
+        self.assertEqual(await self.stored('conv_3'), {'n': 3})
+
+    async def test_full_batch_commits_without_waiting(self):
+        coalescer = self.coalescer(max_batch_size=2, window=60)
+
+        await asyncio.wait_for(asyncio.gather(*(coalescer.create(f'conv_{i}', {}) for i in range(4))), 1)
+
+        self.assertEqual(self.client.commits, 2)
+
+    async def test_subdocuments_count_towards_batch_size(self):
+        coalescer = self.coalescer(max_batch_size=2, window=60)
+
+        await asyncio.wait_for(
+            coalescer.create('conv_1', {'n': 1}, {('transcript', 'turns'): {'turns': []}}), 1
+        )
+
+        self.assertEqual(await self.stored('turns', 'calls/conv_1/transcript'), {'turns': []})
+
+    async def test_existing_document_fails_only_its_caller(self):
+        await self.client.collection('calls').document('conv_1').create({'n': 'old'})
+        coalescer = self.coalescer()
+
+        results = await asyncio.gather(
+            coalescer.create('conv_0', {'n': 0}),
+            coalescer.create('conv_1', {'n': 1}),
+            coalescer.create('conv_2', {'n': 2}),
+            return_exceptions=True
+        )
+
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], AlreadyExists)
+        self.assertIsNone(results[2])
+        self.assertEqual(await self.stored('conv_1'), {'n': 'old'})
+        self.assertEqual(await self.stored('conv_2'), {'n': 2})
@@ -1,6 +1,9 @@
 from django.urls import path
 
-from api.calls.views import ElevenLabsWebhookView, ElevenLabsStreamView, CallsListView, CallEditView
+from api.calls.views import (
+    ElevenLabsWebhookView, ElevenLabsStreamView, CallsListView, CallEditView, CallBulkEditView,
+    CallDetailView, CallsExportView, CallEventsView, CallSearchView
+)
 
 app_name = 'calls'
 
@@ -8,5 +11,10 @@ urlpatterns = [
     path('elevenlabs-webhook/', ElevenLabsWebhookView.as_view(), name='elevenlabs-webhook'),
     path('elevenlabs_stream/<str:conversation_id>/', ElevenLabsStreamView.as_view(), name='elevenlabs-stream'),
     path('list/', CallsListView.as_view(), name='calls-list'),
+    path('export/', CallsExportView.as_view(), name='calls-export'),
+    path('events/', CallEventsView.as_view(), name='call-events'),
+    path('search/', CallSearchView.as_view(), name='call-search'),
+    path('edit/', CallBulkEditView.as_view(), name='call-bulk-edit'),
     path('edit/<str:call_id>/', CallEditView.as_view(), name='call-edit'),
+    path('detail/<str:call_id>/', CallDetailView.as_view(), name='call-detail'),
 ]
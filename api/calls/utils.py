@@ -1,5 +1,6 @@
-from typing import Type, Dict, Any
+from typing import Type, Dict, Any, Optional, Tuple
 
+from django.utils.http import parse_etags
 from pydantic import BaseModel
 
 
@@ -17,3 +18,63 @@ def pydantic_to_openapi_schema(pydantic_model: Type[BaseModel]) -> Dict[str, Any
         del schema['title']
 
     return schema
+
+
+def parse_byte_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range `Range: bytes=...` header for a resource of `size` bytes.
+
+    Returns an inclusive (start, end) tuple, or None when the full resource should
+    be served (no header, an unsupported unit, multiple ranges or bad syntax).
+    Raises ValueError if the range cannot be satisfied.
+    """
+    if not range_header:
+        return None
+
+    unit, _, ranges = range_header.strip().partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in ranges:
+        return None
+
+    first, sep, last = ranges.strip().partition('-')
+    if not sep:
+        return None
+
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError:
+        return None
+
+    if start is None and end is None:
+        return None
+
+    if start is None:
+        # Suffix range: the last N bytes
+        if not end:
+            raise ValueError(f"Unsatisfiable range: {range_header}")
+        start = max(size - end, 0)
+        end = size - 1
+    elif end is None:
+        end = size - 1
+    elif end < start:
+        return None
+
+    if start >= size:
+        raise ValueError(f"Unsatisfiable range: {range_header}")
+
+    return start, min(end, size - 1)
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Weak comparison of an ETag against an If-None-Match header, as RFC 9110
+    requires, so ETags weakened by compression still revalidate.
+    """
+    if not if_none_match:
+        return False
+
+    def opaque(tag):
+        return tag[2:] if tag.startswith('W/') else tag
+
+    tags = parse_etags(if_none_match)
+    return '*' in tags or opaque(etag) in {opaque(tag) for tag in tags}
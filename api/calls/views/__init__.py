@@ -1,4 +1,9 @@
+from .call_bulk_edit import CallBulkEditView
+from .call_detail import CallDetailView
 from .call_edit import CallEditView
+from .call_events import CallEventsView
+from .call_search import CallSearchView
+from .calls_export import CallsExportView
 from .calls_list import CallsListView
 from .elevenlabs_stream import ElevenLabsStreamView
 from .elevenlabs_webhook import ElevenLabsWebhookView
@@ -0,0 +1,68 @@
+import logging
+
+from adrf.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from pydantic import ValidationError
+from rest_framework import status
+from rest_framework.response import Response
+
+from api.calls.schemas import CallBulkEditRequest, ErrorResponse
+from api.calls.services.calls_service import bulk_update_call_response_status
+from api.calls.utils import pydantic_to_openapi_schema
+
+logger = logging.getLogger(__name__)
+
+
+class CallBulkEditView(APIView):
+    @extend_schema(
+        tags=['Calls'],
+        summary='Edit response status of many calls',
+        operation_id='calls_edit_bulk',
+        description='Update the did_respond field for up to 500 calls in one batched write',
+        request=CallBulkEditRequest,
+        responses={
+            200: {
+                'description': 'Calls updated; IDs that do not exist are listed in not_found',
+                'content': {
+                    'application/json': {
+                        'schema': {
+                            'type': 'object',
+                            'properties': {
+                                'updated': {'type': 'array', 'items': {'type': 'string'}},
+                                'not_found': {'type': 'array', 'items': {'type': 'string'}},
+                                'did_respond': {'type': 'boolean'}
+                            }
+                        }
+                    }
+                }
+            },
+            400: OpenApiResponse(
+                response=pydantic_to_openapi_schema(ErrorResponse),
+                description="Invalid request body"
+            )
+        }
+    )
+    async def post(self, request):
+        """
+        Update the did_respond field for a list of calls by ID
+        """
+        try:
+            data = CallBulkEditRequest.model_validate(request.data)
+        except ValidationError as e:
+            error_response = ErrorResponse(
+                error="Invalid request",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            result = await bulk_update_call_response_status(data.call_ids, data.did_respond)
+            return Response(result, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logger.error(f"Error bulk updating {len(data.call_ids)} calls: {str(e)}", exc_info=True)
+            error_response = ErrorResponse(
+                error="Internal server error",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,53 @@
+import logging
+
+from adrf.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from rest_framework import status
+from rest_framework.response import Response
+
+from api.calls.schemas import CallData, ErrorResponse
+from api.calls.services.calls_service import get_call
+from api.calls.utils import pydantic_to_openapi_schema
+
+logger = logging.getLogger(__name__)
+
+
+class CallDetailView(APIView):
+    @extend_schema(
+        tags=['Calls'],
+        summary='Get call',
+        description='Retrieve a single call with every field, including the transcript',
+        responses={
+            200: OpenApiResponse(
+                response=pydantic_to_openapi_schema(CallData),
+                description='Call object from Firebase'
+            ),
+            404: OpenApiResponse(
+                response=pydantic_to_openapi_schema(ErrorResponse),
+                description="Call not found"
+            )
+        }
+    )
+    async def get(self, request, call_id):
+        """
+        Get a specific call by ID from Firebase Firestore
+        """
+        try:
+            call = await get_call(call_id)
+            return Response(call, status=status.HTTP_200_OK)
+
+        except ValueError as e:
+            logger.error(f"Call not found: {str(e)}")
+            error_response = ErrorResponse(
+                error="Call not found",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_404_NOT_FOUND)
+
+        except Exception as e:
+            logger.error(f"Error getting call {call_id}: {str(e)}", exc_info=True)
+            error_response = ErrorResponse(
+                error="Internal server error",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1,9 +1,9 @@
 import logging
 
+from adrf.views import APIView
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from api.calls.schemas import CallEditRequest, ErrorResponse
 from api.calls.services.calls_service import update_call_response_status
@@ -34,7 +34,7 @@ class CallEditView(APIView):
             }
         }
     )
-    def post(self, request, call_id):
+    async def post(self, request, call_id):
         """
         Update the did_respond field for a specific call by ID
         """
@@ -42,7 +42,7 @@ class CallEditView(APIView):
             data = CallEditRequest(**request.data)
 
             if data.did_respond is not None:
-                result = update_call_response_status(call_id, data.did_respond)
+                result = await update_call_response_status(call_id, data.did_respond)
                 return Response(result, status=status.HTTP_200_OK)
 
             return Response({'message': 'No updates provided'}, status=status.HTTP_200_OK)
@@ -0,0 +1,74 @@
+import logging
+
+from adrf.views import APIView
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from pydantic import ValidationError
+from rest_framework import status
+from rest_framework.response import Response
+
+from api.calls.schemas import CallEventsQuery, ErrorResponse
+from api.calls.services.call_events import get_call_event_hub
+from api.calls.utils import pydantic_to_openapi_schema
+from api.renderers import EventStreamRenderer, ORJSONRenderer
+
+logger = logging.getLogger(__name__)
+
+
+class CallEventsView(APIView):
+    renderer_classes = [ORJSONRenderer, EventStreamRenderer]
+
+    @extend_schema(
+        tags=['Calls'],
+        summary='Call events',
+        description='Server-Sent Events stream of call changes, to keep a calls list current without polling. '
+                    '`call.created` carries the new call (every field except `transcript`); `call.updated` '
+                    'carries `id` and the changed fields. After a disconnect, EventSource resumes from the '
+                    'Last-Event-ID header; a `reset` event means missed events are gone and the list '
+                    'should be reloaded.',
+        parameters=[
+            OpenApiParameter(
+                name='last_event_id',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Resume after this event ID (the Last-Event-ID header takes precedence)',
+                required=False
+            ),
+        ],
+        responses={
+            (200, 'text/event-stream'): OpenApiResponse(
+                description='Event stream',
+                response={'type': 'string'}
+            ),
+            400: OpenApiResponse(
+                response=pydantic_to_openapi_schema(ErrorResponse),
+                description="Invalid event ID"
+            )
+        }
+    )
+    async def get(self, request):
+        """
+        Stream call events until the client disconnects.
+        """
+        query = request.query_params.dict()
+        if 'HTTP_LAST_EVENT_ID' in request.META:
+            query['last_event_id'] = request.META['HTTP_LAST_EVENT_ID']
+
+        try:
+            params = CallEventsQuery(**query)
+        except ValidationError as e:
+            error_response = ErrorResponse(
+                error="Invalid event ID",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(
+            get_call_event_hub().subscribe(params.last_event_id),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-store'
+        # Stop nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
@@ -0,0 +1,129 @@
+import logging
+
+from adrf.views import APIView
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from pydantic import ValidationError
+from rest_framework import status
+from rest_framework.response import Response
+
+from api.calls.schemas import CallSearchQuery, ErrorResponse
+from api.calls.services.call_search import search_calls
+from api.calls.utils import pydantic_to_openapi_schema
+
+logger = logging.getLogger(__name__)
+
+
+class CallSearchView(APIView):
+    @extend_schema(
+        tags=['Calls'],
+        summary='Search calls',
+        description='Full-text search over caller name, phone number, summary and transcript, best match first. '
+                    'Every word must match (in any form, e.g. `pricing` finds `prices`); the last word may be '
+                    'incomplete. A phone number matches with or without country and area code. '
+                    'Pass the returned `next_offset` as `offset` to fetch the following page.',
+        parameters=[
+            OpenApiParameter(
+                name='q',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Words or a phone number to search for',
+                required=True
+            ),
+            OpenApiParameter(
+                name='limit',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Maximum number of hits to return (1-100, default 20)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='offset',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Hits to skip (0-1000), from a previous response',
+                required=False
+            ),
+            OpenApiParameter(
+                name='created_after',
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description='Only calls created at or after this time',
+                required=False
+            ),
+            OpenApiParameter(
+                name='created_before',
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description='Only calls created before this time',
+                required=False
+            ),
+        ],
+        responses={
+            200: {
+                'description': 'Page of hits',
+                'content': {
+                    'application/json': {
+                        'schema': {
+                            'type': 'object',
+                            'properties': {
+                                'results': {
+                                    'type': 'array',
+                                    'items': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'id': {'type': 'string'},
+                                            'caller_name': {'type': 'string'},
+                                            'phone_number': {'type': 'string'},
+                                            'summary': {'type': 'string'},
+                                            'created_at': {'type': 'string', 'format': 'date-time'},
+                                            'snippet': {
+                                                'type': 'string',
+                                                'description': 'HTML-escaped excerpt with matches in <mark>'
+                                            },
+                                            'score': {'type': 'number', 'description': 'Higher is better'}
+                                        }
+                                    }
+                                },
+                                'next_offset': {
+                                    'type': 'integer',
+                                    'nullable': True,
+                                    'description': 'Offset of the next page, null on the last page'
+                                }
+                            }
+                        }
+                    }
+                }
+            },
+            400: OpenApiResponse(
+                response=pydantic_to_openapi_schema(ErrorResponse),
+                description="Missing or invalid query parameters"
+            )
+        }
+    )
+    async def get(self, request):
+        """
+        Search calls in the local full-text index and return ranked hits as JSON.
+        """
+        try:
+            params = CallSearchQuery(**request.query_params.dict())
+        except ValidationError as e:
+            error_response = ErrorResponse(
+                error="Invalid query parameters",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            hits, next_offset = await search_calls(
+                params.q, params.limit, params.offset, params.created_after, params.created_before
+            )
+        except Exception as e:
+            logger.error(f"Error searching calls: {str(e)}", exc_info=True)
+            error_response = ErrorResponse(
+                error="Failed to search calls",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response({'results': hits, 'next_offset': next_offset}, status=status.HTTP_200_OK)
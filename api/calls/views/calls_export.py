@@ -0,0 +1,117 @@
+import logging
+
+from adrf.views import APIView
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from pydantic import ValidationError
+from rest_framework import status
+from rest_framework.response import Response
+
+from api.calls.schemas import CallsExportQuery, ErrorResponse
+from api.calls.services.calls_service import iter_calls
+from api.calls.utils import pydantic_to_openapi_schema
+from api.renderers import dumps
+
+logger = logging.getLogger(__name__)
+
+# Encoded calls are buffered into chunks of about this size before sending
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+EXPORT_CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'json': 'application/json',
+}
+
+
+async def encode_calls(calls, mode):
+    """
+    Encode an async iterator of calls as NDJSON lines or as one JSON array,
+    yielding chunks of roughly EXPORT_CHUNK_SIZE bytes.
+    """
+    separator = b'\n' if mode == 'ndjson' else b','
+
+    buffer = bytearray() if mode == 'ndjson' else bytearray(b'[')
+    first = True
+    try:
+        async for call in calls:
+            encoded = dumps(call)
+            if mode == 'ndjson':
+                buffer += encoded + separator
+            else:
+                buffer += encoded if first else separator + encoded
+            first = False
+
+            if len(buffer) >= EXPORT_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+
+    except Exception as e:
+        # Headers are already sent; end the body early so clients see a truncated export
+        logger.error(f"Error streaming calls export: {str(e)}", exc_info=True)
+        return
+
+    if mode == 'json':
+        buffer += b']'
+    if buffer:
+        yield bytes(buffer)
+
+
+class CallsExportView(APIView):
+    @extend_schema(
+        tags=['Calls'],
+        summary='Export calls',
+        description='Stream every call, newest first, without loading the collection into memory. '
+                    'Use `mode=ndjson` (default) for one JSON object per line, or `mode=json` for a JSON array.',
+        parameters=[
+            OpenApiParameter(
+                name='mode',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='`ndjson` (default) or `json`',
+                enum=['ndjson', 'json'],
+                required=False
+            ),
+            OpenApiParameter(
+                name='fields',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Comma separated call fields to return. Defaults to every field except `transcript`',
+                required=False
+            ),
+        ],
+        responses={
+            (200, 'application/x-ndjson'): OpenApiResponse(
+                description='One call object per line',
+                response={'type': 'string'}
+            ),
+            (200, 'application/json'): OpenApiResponse(
+                description='Array of call objects',
+                response={'type': 'array', 'items': {'type': 'object'}}
+            ),
+            400: OpenApiResponse(
+                response=pydantic_to_openapi_schema(ErrorResponse),
+                description="Invalid mode or fields"
+            )
+        }
+    )
+    async def get(self, request):
+        """
+        Stream every call from Firebase Firestore as NDJSON or a JSON array.
+        Documents are encoded and sent as they are read, so memory stays flat.
+        """
+        try:
+            params = CallsExportQuery(**request.query_params.dict())
+        except ValidationError as e:
+            error_response = ErrorResponse(
+                error="Invalid query parameters",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(
+            encode_calls(iter_calls(params.fields), params.mode),
+            content_type=EXPORT_CONTENT_TYPES[params.mode]
+        )
+        response['Cache-Control'] = 'no-store'
+        return response
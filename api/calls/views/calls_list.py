@@ -1,36 +1,113 @@
-from drf_spectacular.utils import extend_schema
+import logging
+
+from adrf.views import APIView
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from pydantic import ValidationError
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
-from api.calls.services.calls_service import get_all_calls
+from api.calls.schemas import CallsListQuery, ErrorResponse
+from api.calls.services.calls_service import get_cached_calls_page_etag, get_calls_page_cached
+from api.calls.utils import etag_matches, pydantic_to_openapi_schema
+
+logger = logging.getLogger(__name__)
 
 
 class CallsListView(APIView):
     @extend_schema(
         tags=['Calls'],
-        summary='List all calls',
-        description='Retrieve list of calls',
+        summary='List calls',
+        description='Retrieve a page of calls, newest first. Pass the returned `next` cursor to fetch the following page.',
+        parameters=[
+            OpenApiParameter(
+                name='limit',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description='Maximum number of calls to return (1-100, default 20)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Opaque cursor from a previous response',
+                required=False
+            ),
+            OpenApiParameter(
+                name='fields',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description='Comma separated call fields to return, e.g. `caller_name,summary`. '
+                            'Defaults to every field except `transcript` (see `GET /calls/detail/{call_id}/`)',
+                required=False
+            ),
+        ],
         responses={
             200: {
-                'description': 'List of all calls',
+                'description': 'Page of calls',
                 'content': {
                     'application/json': {
                         'schema': {
-                            'type': 'array',
-                            'items': {
-                                'type': 'object',
-                                'description': 'Call object from Firebase'
+                            'type': 'object',
+                            'properties': {
+                                'results': {
+                                    'type': 'array',
+                                    'items': {
+                                        'type': 'object',
+                                        'description': 'Call object from Firebase'
+                                    }
+                                },
+                                'next': {
+                                    'type': 'string',
+                                    'nullable': True,
+                                    'description': 'Cursor for the next page, null on the last page'
+                                }
                             }
                         }
                     }
                 }
-            }
+            },
+            304: OpenApiResponse(description='Page unchanged since the ETag sent in If-None-Match'),
+            400: OpenApiResponse(
+                response=pydantic_to_openapi_schema(ErrorResponse),
+                description="Invalid limit, cursor or fields"
+            )
         }
     )
-    def get(self, request):
+    async def get(self, request):
         """
-        Get all calls from Firebase Firestore and return as JSON list
+        Get a page of calls from Firebase Firestore and return as JSON.
+        Pages are served from the calls cache and support If-None-Match revalidation.
         """
-        calls = get_all_calls()
-        return Response(calls, status=status.HTTP_200_OK)
+        try:
+            params = CallsListQuery(**request.query_params.dict())
+
+            # Answer unchanged polls straight from the cached ETag
+            if_none_match = request.headers.get('If-None-Match')
+            if if_none_match:
+                cached_etag = await get_cached_calls_page_etag(params.limit, params.cursor, params.fields)
+                if cached_etag and etag_matches(cached_etag, if_none_match):
+                    return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': cached_etag})
+
+            calls, next_cursor, etag = await get_calls_page_cached(params.limit, params.cursor, params.fields)
+
+            if etag_matches(etag, if_none_match):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        except ValidationError as e:
+            error_response = ErrorResponse(
+                error="Invalid query parameters",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST)
+
+        except ValueError as e:
+            logger.error(f"Invalid calls list cursor: {str(e)}")
+            error_response = ErrorResponse(
+                error="Invalid cursor",
+                details=str(e)
+            )
+            return Response(error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({'results': calls, 'next': next_cursor}, status=status.HTTP_200_OK, headers={'ETag': etag})
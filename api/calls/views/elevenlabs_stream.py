@@ -1,18 +1,145 @@
+import asyncio
 import logging
 
-from django.http import StreamingHttpResponse
+from adrf.views import APIView
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.http import parse_etags, quote_etag
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from api.calls.schemas import ErrorResponse
-from api.calls.services.elevenlabs_api import stream_conversation_audio
-from api.calls.utils import pydantic_to_openapi_schema
+from api.calls.services.elevenlabs_api import iter_audio, stream_conversation_audio
+from api.calls.services.recording_cache import get_cached_recording, is_cacheable, iter_file, tee_to_cache
+from api.calls.utils import parse_byte_range, pydantic_to_openapi_schema
 
 logger = logging.getLogger(__name__)
 
+# Recordings never change once a call has ended
+RECORDING_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def recording_etag(conversation_id):
+    """Strong ETag for a recording; the conversation ID identifies immutable content."""
+    return quote_etag(f"recording-{conversation_id}")
+
+
+def not_modified_response(etag):
+    response = HttpResponseNotModified()
+    response['ETag'] = etag
+    response['Cache-Control'] = RECORDING_CACHE_CONTROL
+    return response
+
+
+def range_not_satisfiable_response(content_range):
+    """416 response carrying the `bytes */<size>` Content-Range."""
+    response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+    if content_range:
+        response['Content-Range'] = content_range
+    return response
+
+
+async def cached_recording_response(request, path, range_header, include_body):
+    """
+    Serve a recording, or a single byte range of it, from the local cache.
+    WSGI servers send full FileResponse bodies with sendfile(); ASGI has no such
+    extension here, so stream the file with an async reader instead.
+    Returns None if the file was evicted since it was looked up.
+    """
+    try:
+        size = (await asyncio.to_thread(path.stat)).st_size
+    except FileNotFoundError:
+        return None
+
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except ValueError:
+        return range_not_satisfiable_response(f"bytes */{size}")
+
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, status.HTTP_200_OK
+    else:
+        (start, end), status_code = byte_range, status.HTTP_206_PARTIAL_CONTENT
+    length = end - start + 1
+
+    if not include_body:
+        response = HttpResponse(status=status_code, content_type='audio/mpeg')
+    elif byte_range is None and 'wsgi.file_wrapper' in request.META:
+        try:
+            response = FileResponse(await asyncio.to_thread(open, path, 'rb'), content_type='audio/mpeg')
+        except FileNotFoundError:
+            return None
+    else:
+        response = StreamingHttpResponse(iter_file(path, start, length), status=status_code, content_type='audio/mpeg')
+
+    response['Content-Length'] = length
+    if status_code == status.HTTP_206_PARTIAL_CONTENT:
+        response['Content-Range'] = f"bytes {start}-{end}/{size}"
+    return response
+
+
+async def upstream_recording_response(conversation_id, range_header, include_body):
+    """
+    Proxy a recording from ElevenLabs. Partial ranges are forwarded upstream;
+    full downloads (including the `bytes=0-` browsers open with) are fetched
+    whole so they can be saved to the recording cache.
+    """
+    is_full_range = range_header is not None and range_header.replace(' ', '') == 'bytes=0-'
+    forwarded_range = range_header if range_header and not is_full_range else None
+
+    # Get the streaming response from ElevenLabs
+    elevenlabs_response = await stream_conversation_audio(
+        conversation_id,
+        headers={'Range': forwarded_range} if forwarded_range else None
+    )
+    upstream_status = elevenlabs_response.status_code
+    upstream_headers = elevenlabs_response.headers
+
+    if upstream_status == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE:
+        await elevenlabs_response.aclose()
+        return range_not_satisfiable_response(upstream_headers.get('Content-Range'))
+
+    # Check if the ElevenLabs request was successful
+    if upstream_status not in (status.HTTP_200_OK, status.HTTP_206_PARTIAL_CONTENT):
+        logger.error(f"ElevenLabs API error for conversation {conversation_id}: {upstream_status}")
+        await elevenlabs_response.aclose()
+        error_response = ErrorResponse(
+            error=f"Audio not available for conversation {conversation_id}"
+        )
+        return Response(error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST)
+
+    content_type = upstream_headers.get('Content-Type', 'audio/mpeg')
+    content_length = upstream_headers.get('Content-Length')
+    content_range = upstream_headers.get('Content-Range')
+
+    # Answer `bytes=0-` with 206 for the whole file when the size is known
+    status_code = upstream_status
+    if upstream_status == status.HTTP_200_OK and is_full_range and content_length:
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        content_range = f"bytes 0-{int(content_length) - 1}/{content_length}"
+
+    if not include_body:
+        await elevenlabs_response.aclose()
+        response = HttpResponse(status=status_code, content_type=content_type)
+    else:
+        audio = iter_audio(elevenlabs_response)
+        if upstream_status == status.HTTP_200_OK and is_cacheable(conversation_id):
+            audio = tee_to_cache(
+                conversation_id,
+                audio,
+                expected_length=int(content_length) if content_length else None
+            )
+
+        # Create streaming response with proper content type
+        response = StreamingHttpResponse(audio, status=status_code, content_type=content_type)
+
+    if content_length:
+        response['Content-Length'] = content_length
+    if status_code == status.HTTP_206_PARTIAL_CONTENT and content_range:
+        response['Content-Range'] = content_range
+    return response
+
 
 class ElevenLabsStreamView(APIView):
     @extend_schema(
@@ -25,6 +152,13 @@ class ElevenLabsStreamView(APIView):
                 location=OpenApiParameter.PATH,
                 description='id for elevenlabs conversation to be streamed',
                 required=True
+            ),
+            OpenApiParameter(
+                name='Range',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.HEADER,
+                description='Single byte range, e.g. `bytes=1000-`',
+                required=False
             )
         ],
         responses={
@@ -32,48 +166,65 @@ class ElevenLabsStreamView(APIView):
                 description='Streaming audio in MP3 format',
                 response={'type': 'string', 'format': 'binary'}
             ),
+            (206, 'audio/mpeg'): OpenApiResponse(
+                description='Requested byte range of the audio',
+                response={'type': 'string', 'format': 'binary'}
+            ),
+            304: OpenApiResponse(description='Recording unchanged since the ETag sent in If-None-Match'),
             400: OpenApiResponse(
                 response=pydantic_to_openapi_schema(ErrorResponse),
                 description="Audio not available or invalid conversation ID"
-            )
+            ),
+            416: OpenApiResponse(description='Requested range not satisfiable')
         }
     )
-    def get(self, request, conversation_id):
+    async def get(self, request, conversation_id):
+        """
+        Streams audio recording of a conversation from the local recording cache,
+        or from ElevenLabs API while saving a copy to the cache
+        """
+        return await self.serve_recording(request, conversation_id, include_body=True)
+
+    async def head(self, request, conversation_id):
         """
-        Streams audio recording of a conversation from ElevenLabs API
+        Returns the headers of the audio recording without the body
         """
+        return await self.serve_recording(request, conversation_id, include_body=False)
+
+    async def serve_recording(self, request, conversation_id, include_body):
         try:
             logger.info(f"Streaming audio for conversation: {conversation_id}")
 
-            # Get the streaming response from ElevenLabs
-            elevenlabs_response = stream_conversation_audio(conversation_id)
-
-            # Check if the ElevenLabs request was successful
-            if elevenlabs_response.status_code != 200:
-                logger.error(
-                    f"ElevenLabs API error for conversation {conversation_id}: {elevenlabs_response.status_code}")
-                error_response = ErrorResponse(
-                    error=f"Audio not available for conversation {conversation_id}"
-                )
-                return Response(error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST)
-
-            # Create a generator to stream the content
-            def audio_stream():
-                for chunk in elevenlabs_response.iter_content(chunk_size=8192):
-                    if chunk:
-                        yield chunk
-
-            # Create streaming response with proper content type
-            response = StreamingHttpResponse(
-                audio_stream(),
-                content_type=elevenlabs_response.headers.get('Content-Type', 'audio/mpeg')
-            )
+            etag = recording_etag(conversation_id)
+            # The ETag only names the recording, so check it exists before confirming the client's copy
+            etag_matches = etag in parse_etags(request.headers.get('If-None-Match', ''))
+
+            # A stale If-Range means the client's partial copy is unusable, send it all
+            range_header = request.headers.get('Range')
+            if_range = request.headers.get('If-Range')
+            if if_range and if_range != etag:
+                range_header = None
+
+            response = None
+            cached_path = await asyncio.to_thread(get_cached_recording, conversation_id)
+            if cached_path is not None:
+                if etag_matches:
+                    return not_modified_response(etag)
+                # None if it was evicted since the lookup; fetch it from upstream instead
+                response = await cached_recording_response(request, cached_path, range_header, include_body)
 
-            # Copy relevant headers from ElevenLabs response
-            if 'Content-Length' in elevenlabs_response.headers:
-                response['Content-Length'] = elevenlabs_response.headers['Content-Length']
+            if response is None and etag_matches:
+                # Ask upstream without downloading the audio; errors pass through
+                response = await upstream_recording_response(conversation_id, None, include_body=False)
+                if response.status_code == status.HTTP_200_OK:
+                    return not_modified_response(etag)
+            elif response is None:
+                response = await upstream_recording_response(conversation_id, range_header, include_body)
 
-            response['Accept-Ranges'] = 'bytes'
+            if response.status_code in (status.HTTP_200_OK, status.HTTP_206_PARTIAL_CONTENT):
+                response['Accept-Ranges'] = 'bytes'
+                response['ETag'] = etag
+                response['Cache-Control'] = RECORDING_CACHE_CONTROL
 
             return response
 
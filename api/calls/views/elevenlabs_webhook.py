@@ -1,13 +1,14 @@
-import json
 import logging
 
+from adrf.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiResponse
+from pydantic import ValidationError
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
-from api.calls.schemas import ErrorResponse
-from api.calls.services.elevenlabs_webhook_service import handle_elevenlabs_webhook
+from api.calls.schemas import ElevenLabsWebhookPayload, ErrorResponse
+from api.calls.services.webhook_dedup import is_recent_delivery
+from api.calls.services.webhook_queue import enqueue_webhook, start_webhook_worker
 from api.calls.utils import pydantic_to_openapi_schema
 
 logger = logging.getLogger(__name__)
@@ -17,8 +18,10 @@ class ElevenLabsWebhookView(APIView):
     @extend_schema(
         tags=['ElevenLabs'],
         summary='Process ElevenLabs webhook event',
+        description='Stores the webhook payload in a durable queue and acknowledges it immediately; '
+                    'the call is saved and emailed by a background worker.',
         responses={
-            200: "Webhook processed successfully",
+            200: "Webhook queued for processing",
             400: OpenApiResponse(
                 response=pydantic_to_openapi_schema(ErrorResponse),
                 description="Invalid request data"
@@ -29,31 +32,35 @@ class ElevenLabsWebhookView(APIView):
             )
         }
     )
-    def post(self, request):
+    async def post(self, request):
         """
         receives webhook notification from ElevenLabs when conversation ends
         """
         try:
-            # Get JSON data directly without validation
-            json_data = request.data
             logger.info(f"Received ElevenLabs webhook")
 
-            # Delegate to service
-            service_response = handle_elevenlabs_webhook(json_data)
+            # Reject bodies the worker could never process, straight from the raw bytes
+            payload = ElevenLabsWebhookPayload.model_validate_json(request.body)
+            raw_body = request.body.decode('utf-8')
 
-            # Extract response data 
-            if hasattr(service_response, 'content'):
-                response_data = json.loads(service_response.content.decode('utf-8'))
-            else:
-                response_data = {"status": "success", "message": "Webhook processed"}
+            # Drop ElevenLabs retries of a delivery we already accepted
+            conversation_id = payload.data.conversation_id
+            if is_recent_delivery(conversation_id):
+                return Response({"status": "duplicate"}, status=status.HTTP_200_OK)
 
-            return Response(response_data, status=status.HTTP_200_OK)
+            # The worker remembers the delivery once the ingest completes
+            job = await enqueue_webhook(raw_body)
 
-        except json.JSONDecodeError:
-            logger.error("Could not parse webhook body as JSON")
+            # Make sure a worker is running to pick the job up
+            start_webhook_worker()
+
+            return Response({"status": "queued", "job_id": job.pk}, status=status.HTTP_200_OK)
+
+        except ValidationError as e:
+            logger.error(f"Invalid ElevenLabs webhook payload: {str(e)}")
             error_response = ErrorResponse(
-                error="Invalid JSON",
-                details="Request body could not be parsed as valid JSON"
+                error="Invalid webhook payload",
+                details=str(e)
             )
             return Response(error_response.model_dump(), status=status.HTTP_400_BAD_REQUEST)
 
@@ -0,0 +1,221 @@
+"""
+Response compression negotiated from Accept-Encoding.
+
+Supports zstd, brotli and gzip for JSON API responses and the OpenAPI schema.
+brotli and zstd are used only when their packages (`brotli`, `zstandard`) are
+installed. Compressed bodies can be cached by content hash, so repeated hits
+on the same response (e.g. a cached calls page) skip the compression work.
+"""
+
+import gzip
+import hashlib
+import logging
+import zlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from api import metrics
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    'application/json',
+    'application/x-ndjson',
+    'application/vnd.oai.openapi',
+    'application/vnd.oai.openapi+json',
+)
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+
+class GzipStreamCompressor:
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data):
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class BrotliStreamCompressor:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data):
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class ZstdStreamCompressor:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+def get_encodings():
+    """
+    Supported encodings in server preference order, mapped to
+    (compress function, streaming compressor class).
+    """
+    encodings = {}
+    if zstandard is not None:
+        encodings['zstd'] = (
+            lambda data: zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data),
+            ZstdStreamCompressor
+        )
+    if brotli is not None:
+        encodings['br'] = (lambda data: brotli.compress(data, quality=BROTLI_QUALITY), BrotliStreamCompressor)
+    encodings['gzip'] = (lambda data: gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0), GzipStreamCompressor)
+
+    return {encoding: encodings[encoding] for encoding in settings.COMPRESSION_ENCODINGS if encoding in encodings}
+
+
+ENCODINGS = get_encodings()
+
+
+def parse_accept_encoding(header):
+    """Parse an Accept-Encoding header into {coding: q}"""
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(header):
+    """
+    Pick the best supported encoding for an Accept-Encoding header, or None.
+    The client's q-values rank first, then server preference.
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+
+    best, best_q = None, 0.0
+    for encoding in ENCODINGS:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(response):
+    content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+    return content_type in COMPRESSIBLE_CONTENT_TYPES
+
+
+def compress_body(content, encoding):
+    """
+    Compress a response body, reusing a cached compressed copy when
+    COMPRESSION_CACHE_VARIANTS is enabled.
+    """
+    compress = ENCODINGS[encoding][0]
+    if not settings.COMPRESSION_CACHE_VARIANTS:
+        return compress(content)
+
+    cache = caches[settings.COMPRESSION_CACHE_ALIAS]
+    cache_key = f"compressed:{encoding}:{hashlib.sha1(content).hexdigest()}"
+    compressed = cache.get(cache_key)
+    if compressed is not None:
+        metrics.increment('compression.cache_hits')
+        return compressed
+
+    metrics.increment('compression.cache_misses')
+    compressed = compress(content)
+    cache.set(cache_key, compressed, timeout=settings.COMPRESSION_CACHE_TTL)
+    return compressed
+
+
+def compress_stream(chunks, compressor):
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def compress_stream_async(chunks, compressor):
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress JSON API and schema responses with the best encoding the client
+    accepts. Bodies smaller than COMPRESSION_MIN_SIZE are sent as is.
+    Like Django's GZipMiddleware, strong ETags are made weak since the bytes
+    on the wire differ per encoding.
+    """
+
+    def process_response(self, request, response):
+        if not settings.COMPRESSION_ENABLED or not is_compressible(response):
+            return response
+        if response.has_header('Content-Encoding'):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            compressor = ENCODINGS[encoding][1]()
+            if response.is_async:
+                response.streaming_content = compress_stream_async(response.streaming_content, compressor)
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, compressor)
+            del response['Content-Length']
+        else:
+            compressed = compress_body(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+
+        response['Content-Encoding'] = encoding
+        return response
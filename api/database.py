@@ -2,7 +2,9 @@
 Firebase Firestore database initialization and client setup for Django.
 """
 
+import asyncio
 import os
+import weakref
 
 import firebase_admin
 from django.conf import settings
@@ -11,6 +13,107 @@ from firebase_admin import credentials, firestore
 # Global Firestore client
 db = None
 
+# Async Firestore clients, one per event loop (gRPC aio channels are bound to
+# the loop that created them)
+async_clients = weakref.WeakKeyDictionary()
+
+# Call document write coalescers, one per event loop
+calls_write_coalescers = weakref.WeakKeyDictionary()
+
+
+class WriteCoalescer:
+    """
+    Buffers document creates for up to `window` seconds, or until
+    `max_batch_size` writes are waiting, and commits them as one WriteBatch.
+
+    Each caller awaits the outcome of its own document. Batches are atomic, so
+    if a commit fails (e.g. one document already exists) every document in it
+    is retried in its own batch to give each caller its own result.
+    Works with any client exposing `batch()` and `collection()`, such as the
+    in-memory stand-in in api/calls/benchmarks/fake_firestore.py.
+    """
+
+    def __init__(self, client, collection_name, max_batch_size, window):
+        self._client = client
+        self._collection = client.collection(collection_name)
+        self._max_batch_size = max_batch_size
+        self._window = window
+        self._pending = []
+        self._pending_writes = 0
+        self._timer = None
+        self._tasks = set()
+
+    async def create(self, doc_id, data, subdocuments=None):
+        """
+        Create a document in the next batch, together with any `subdocuments`
+        ({(subcollection, subdocument_id): data}) under it.
+        Raises AlreadyExists (or any other write error) for this document only.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((doc_id, data, subdocuments or {}, future))
+        self._pending_writes += 1 + len(subdocuments or {})
+
+        if self._pending_writes >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        writes, self._pending = self._pending, []
+        self._pending_writes = 0
+        if writes:
+            task = asyncio.create_task(self._commit(writes))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _add_creates(self, batch, doc_id, data, subdocuments):
+        doc_ref = self._collection.document(doc_id)
+        batch.create(doc_ref, data)
+        for (subcollection, subdocument_id), subdocument in subdocuments.items():
+            batch.create(doc_ref.collection(subcollection).document(subdocument_id), subdocument)
+
+    async def _commit(self, writes):
+        batch = self._client.batch()
+        for doc_id, data, subdocuments, _ in writes:
+            self._add_creates(batch, doc_id, data, subdocuments)
+
+        try:
+            await batch.commit()
+        except Exception as e:
+            if len(writes) == 1:
+                self._resolve(writes[0][3], error=e)
+            else:
+                await asyncio.gather(*(self._create_one(*write) for write in writes))
+        else:
+            for *_, future in writes:
+                self._resolve(future)
+
+    async def _create_one(self, doc_id, data, subdocuments, future):
+        batch = self._client.batch()
+        self._add_creates(batch, doc_id, data, subdocuments)
+        try:
+            await batch.commit()
+        except Exception as e:
+            self._resolve(future, error=e)
+        else:
+            self._resolve(future)
+
+    @staticmethod
+    def _resolve(future, error=None):
+        # The caller may have been cancelled while the batch was in flight
+        if future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
 
 def initialize_firebase():
     """
@@ -57,7 +160,47 @@ def get_firestore_client():
     return db
 
 
+def get_async_firestore_client():
+    """
+    Get the Firestore AsyncClient for the running event loop.
+    Shares the Firebase app (and credentials) of the sync client. A client
+    registered in async_clients for the loop (e.g. an emulator client or the
+    benchmarks' in-memory stand-in) is used as is.
+    """
+    loop = asyncio.get_running_loop()
+    client = async_clients.get(loop)
+    if client is None:
+        get_firestore_client()
+        app = firebase_admin.get_app()
+        client = firestore.AsyncClient(
+            credentials=app.credential.get_credential(),
+            project=app.project_id
+        )
+        async_clients[loop] = client
+    return client
+
+
 # Collection references
 def get_calls_collection():
     """Get reference to calls collection."""
     return get_firestore_client().collection('calls')
+
+
+def get_async_calls_collection():
+    """Get async reference to calls collection."""
+    return get_async_firestore_client().collection('calls')
+
+
+def get_calls_write_coalescer():
+    """Get the calls collection WriteCoalescer for the running event loop."""
+    loop = asyncio.get_running_loop()
+    coalescer = calls_write_coalescers.get(loop)
+    if coalescer is None:
+        coalescer = WriteCoalescer(
+            get_async_firestore_client(),
+            'calls',
+            max_batch_size=settings.FIRESTORE_BATCH_MAX_SIZE,
+            window=settings.FIRESTORE_BATCH_WINDOW_MS / 1000
+        )
+        calls_write_coalescers[loop] = coalescer
+    return coalescer
@@ -1,61 +1,160 @@
 """
 Email service for sending emails via Gmail SMTP.
+
+Connections come from a thread-safe pool that checks idle connections with
+NOOP and reconnects when Gmail has dropped them. Messages that still can't be
+sent are stored in a persistent outbox and retried with backoff.
 """
 
-import smtplib
 import logging
+import queue
+import smtplib
+import threading
+import time
+from datetime import timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from api import metrics
+from api.calls.models import EmailOutboxMessage
 
 logger = logging.getLogger(__name__)
 
-# Global SMTP client
-smtp_client = None
+# Outbox messages claimed but not sent within this time are claimed again
+OUTBOX_CLAIM_TIMEOUT = timedelta(minutes=10)
 
 
-def initialize_email():
+def is_transient_error(error):
     """
-    Initialize SMTP client for Gmail.
-    This should be called once during Django application startup.
+    Whether a failed send may succeed if tried again: a dropped connection,
+    a network error or a 4xx reply. 5xx replies (bad recipient, rejected
+    login) and other SMTP errors fail the same way every time.
+    """
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    # SMTPException subclasses OSError; the rest are socket errors
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of logged-in SMTP connections.
+    At most `size` connections exist at once; callers block until one is free.
     """
-    global smtp_client
 
-    if smtp_client is not None:
-        # Email client already initialized
-        return smtp_client
+    def __init__(self, size):
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self):
+        """Open, secure and authenticate a new SMTP connection."""
+        client = smtplib.SMTP(settings.EMAIL_HOST, settings.EMAIL_PORT, timeout=settings.EMAIL_TIMEOUT)
+        try:
+            if settings.EMAIL_USE_TLS:
+                client.starttls()
+            if settings.GOOGLE_APP_PASSWORD:
+                client.login(settings.EMAIL_HOST_USER, settings.GOOGLE_APP_PASSWORD)
+        except Exception:
+            client.close()
+            raise
+        metrics.increment('email.connections_opened')
+        return client
+
+    @staticmethod
+    def _close(client):
+        try:
+            client.quit()
+        except Exception:
+            client.close()
+
+    @staticmethod
+    def _is_alive(client):
+        try:
+            return client.noop()[0] == 250
+        except OSError:
+            return False
+
+    def acquire(self):
+        """
+        Get a live connection, reusing an idle one when possible.
+        Connections idle longer than EMAIL_NOOP_INTERVAL are checked with NOOP.
+        """
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    client, last_used = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+
+                if time.monotonic() - last_used < settings.EMAIL_NOOP_INTERVAL or self._is_alive(client):
+                    return client
+
+                logger.info("Discarding dead SMTP connection")
+                self._close(client)
+        except Exception:
+            self._slots.release()
+            raise
 
-    smtp_client = smtplib.SMTP('smtp.gmail.com', 587)
-    smtp_client.starttls()
-    smtp_client.login(settings.EMAIL_HOST_USER, settings.GOOGLE_APP_PASSWORD)
+    def release(self, client, broken=False):
+        """Return a connection to the pool, or close it if it is broken."""
+        if broken:
+            self._close(client)
+        else:
+            self._idle.put((client, time.monotonic()))
+        self._slots.release()
 
-    return smtp_client
+    def close_all(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                client, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(client)
 
 
-def get_smtp_client():
+# Global SMTP connection pool
+smtp_pool = None
+smtp_pool_lock = threading.Lock()
+
+# Outbox retry thread, started by start_outbox_worker()
+outbox_thread = None
+
+
+def initialize_email():
     """
-    Get the SMTP client instance.
-    Returns the global smtp_client, initializing if necessary.
+    Initialize the SMTP connection pool for Gmail and open a first connection.
+    This should be called once during Django application startup.
     """
-    global smtp_client
-    if smtp_client is None:
-        smtp_client = initialize_email()
-    return smtp_client
+    pool = get_smtp_pool()
+    pool.release(pool.acquire())
+    return pool
 
 
-def send_email(to, subject, body, html_body=None):
+def get_smtp_pool():
     """
-    Send an email using Gmail SMTP.
-    
-    Args:
-        to (str): Recipient email address
-        subject (str): Email subject
-        body (str): Email body content (plain text)
-        html_body (str, optional): HTML version of email body
+    Get the SMTP connection pool.
+    Returns the global smtp_pool, creating it if necessary.
     """
-    client = get_smtp_client()
+    global smtp_pool
+    with smtp_pool_lock:
+        if smtp_pool is None:
+            smtp_pool = SMTPConnectionPool(settings.EMAIL_POOL_SIZE)
+    return smtp_pool
 
+
+def build_message(to, subject, body, html_body=None):
+    """Build a plain text (and optional HTML) email message."""
     msg = MIMEMultipart('alternative')
     msg['From'] = settings.EMAIL_HOST_USER
     msg['To'] = to
@@ -68,10 +167,152 @@ def send_email(to, subject, body, html_body=None):
     if html_body:
         msg.attach(MIMEText(html_body, 'html'))
 
+    return msg
+
+
+def deliver_message(msg):
+    """
+    Send a message through the pool. A send that fails transiently on a pooled
+    connection (e.g. one Gmail dropped between the NOOP check and the send) is
+    retried once on a fresh connection. Raises if the message could not be sent.
+    """
+    pool = get_smtp_pool()
+
+    for attempt in range(2):
+        client = pool.acquire()
+        start = time.perf_counter()
+        try:
+            client.send_message(msg)
+        except Exception as e:
+            pool.release(client, broken=True)
+            metrics.increment('email.send_errors')
+            if attempt == 1 or not is_transient_error(e):
+                raise
+            logger.warning(f"SMTP send failed ({e!r}), retrying on a new connection")
+        else:
+            pool.release(client)
+            metrics.observe_latency('email.send', time.perf_counter() - start)
+            metrics.increment('email.sent')
+            return
+
+
+def send_email(to, subject, body, html_body=None):
+    """
+    Send an email using Gmail SMTP.
+    If it can't be sent now, it is stored in the outbox and retried later;
+    permanent rejections are stored as failed without retrying.
+
+    Args:
+        to (str): Recipient email address
+        subject (str): Email subject
+        body (str): Email body content (plain text)
+        html_body (str, optional): HTML version of email body
+    """
+    msg = build_message(to, subject, body, html_body)
+
     logger.info(f"Sending email from: {settings.EMAIL_HOST_USER}, to: {to}, subject: {subject}")
     logger.info(f"Email body: {body}")
 
     try:
-        client.send_message(msg)
+        deliver_message(msg)
     except Exception as e:
-        logger.error(f"Error sending email: {e}")
+        transient = is_transient_error(e)
+        if transient:
+            logger.error(f"Error sending email, saving to outbox: {e}")
+        else:
+            logger.error(f"Email to {to} rejected, not retrying: {e}")
+        EmailOutboxMessage.objects.create(
+            to=to,
+            subject=subject,
+            body=body,
+            html_body=html_body or "",
+            status=EmailOutboxMessage.Status.PENDING if transient else EmailOutboxMessage.Status.FAILED,
+            attempts=1,
+            available_at=timezone.now() + timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_BACKOFF),
+            last_error=repr(e)
+        )
+        if transient:
+            metrics.increment('email.outboxed')
+            start_outbox_worker()
+
+
+def claim_outbox_message():
+    """
+    Atomically claim the next outbox message that is due, or return None.
+    Every process runs an outbox thread, so a message is only sent by the
+    flush that claims it; claims older than OUTBOX_CLAIM_TIMEOUT (a process
+    that died mid-send) are taken over.
+    """
+    now = timezone.now()
+    claimable = (
+        Q(status=EmailOutboxMessage.Status.PENDING, available_at__lte=now) |
+        Q(status=EmailOutboxMessage.Status.SENDING, locked_at__lt=now - OUTBOX_CLAIM_TIMEOUT)
+    )
+
+    for message_id in EmailOutboxMessage.objects.filter(claimable).values_list('id', flat=True)[:10]:
+        # Conditional update so only one flush wins the claim
+        claimed = EmailOutboxMessage.objects.filter(claimable, id=message_id).update(
+            status=EmailOutboxMessage.Status.SENDING,
+            locked_at=now,
+            updated_at=now
+        )
+        if claimed:
+            return EmailOutboxMessage.objects.get(id=message_id)
+
+    return None
+
+
+def flush_outbox():
+    """
+    Retry every due outbox message. Sent messages are deleted; transient
+    failures back off exponentially and are marked failed after
+    EMAIL_OUTBOX_MAX_ATTEMPTS, permanent ones are marked failed right away.
+    Returns the number of messages sent.
+    """
+    sent = 0
+
+    while (message := claim_outbox_message()) is not None:
+        try:
+            deliver_message(build_message(message.to, message.subject, message.body, message.html_body or None))
+        except Exception as e:
+            message.attempts += 1
+            message.last_error = repr(e)
+            if not is_transient_error(e):
+                logger.error(f"Outbox email {message.pk} rejected, not retrying: {e}")
+                message.status = EmailOutboxMessage.Status.FAILED
+            elif message.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                logger.error(f"Giving up on outbox email {message.pk} after {message.attempts} attempts: {e}")
+                message.status = EmailOutboxMessage.Status.FAILED
+            else:
+                delay = settings.EMAIL_OUTBOX_RETRY_BACKOFF * (2 ** (message.attempts - 1))
+                message.status = EmailOutboxMessage.Status.PENDING
+                message.available_at = timezone.now() + timedelta(seconds=delay)
+            message.locked_at = None
+            message.save(update_fields=['attempts', 'last_error', 'status', 'available_at', 'locked_at', 'updated_at'])
+        else:
+            logger.info(f"Sent outbox email {message.pk} to {message.to}")
+            message.delete()
+            sent += 1
+
+    return sent
+
+
+def run_outbox_worker():
+    """Retry outbox messages every EMAIL_OUTBOX_POLL_INTERVAL seconds, forever."""
+    while True:
+        try:
+            flush_outbox()
+        except Exception as e:
+            logger.error(f"Error flushing email outbox: {e}", exc_info=True)
+        finally:
+            close_old_connections()
+        time.sleep(settings.EMAIL_OUTBOX_POLL_INTERVAL)
+
+
+def start_outbox_worker():
+    """Start the outbox retry thread if it is not already running."""
+    global outbox_thread
+    with smtp_pool_lock:
+        if outbox_thread is None or not outbox_thread.is_alive():
+            outbox_thread = threading.Thread(target=run_outbox_worker, name='email-outbox', daemon=True)
+            outbox_thread.start()
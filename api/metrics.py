@@ -0,0 +1,81 @@
+"""
+Lightweight in-process metrics (counters, gauges and latency summaries) for the API.
+Values are per process and reset on restart; they are exposed at /metrics/.
+"""
+
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+# Number of recent samples kept per latency metric for percentiles
+LATENCY_WINDOW = 1000
+
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_latencies = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+_latency_counts = defaultdict(int)
+_gauges = {}
+
+
+def increment(name, value=1):
+    """Increment a counter."""
+    with _lock:
+        _counters[name] += value
+
+
+def observe_latency(name, seconds):
+    """Record one latency sample, in seconds."""
+    with _lock:
+        _latencies[name].append(seconds)
+        _latency_counts[name] += 1
+
+
+def register_gauge(name, callback):
+    """Register a gauge whose value is read from `callback()` at snapshot time."""
+    with _lock:
+        _gauges[name] = callback
+
+
+@contextmanager
+def timed(name):
+    """Context manager recording the wall-clock time of its block."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_latency(name, time.perf_counter() - start)
+
+
+def _percentile(sorted_samples, fraction):
+    index = min(int(len(sorted_samples) * fraction), len(sorted_samples) - 1)
+    return sorted_samples[index]
+
+
+def snapshot():
+    """
+    Get the current metric values as a JSON-serializable dict.
+    Latency summaries are in milliseconds over the most recent samples.
+    """
+    with _lock:
+        counters = dict(_counters)
+        latencies = {name: (sorted(samples), _latency_counts[name]) for name, samples in _latencies.items()}
+        gauges = dict(_gauges)
+
+    summaries = {}
+    for name, (samples, count) in latencies.items():
+        if not samples:
+            continue
+        summaries[name] = {
+            'count': count,
+            'p50_ms': round(_percentile(samples, 0.50) * 1000, 3),
+            'p95_ms': round(_percentile(samples, 0.95) * 1000, 3),
+            'p99_ms': round(_percentile(samples, 0.99) * 1000, 3),
+            'max_ms': round(samples[-1] * 1000, 3),
+        }
+
+    return {
+        'counters': counters,
+        'gauges': {name: callback() for name, callback in gauges.items()},
+        'latencies': summaries,
+    }
@@ -57,6 +57,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'api.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -93,6 +94,11 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # WAL lets the webhook queue worker write while requests read
+            'init_command': 'PRAGMA journal_mode=WAL;',
+            'timeout': 20,
+        },
     }
 }
 
@@ -146,6 +152,96 @@ APPEND_SLASH = True
 DEBUG_NUMBERS_STR = os.getenv('DEBUG_NUMBERS')
 DEBUG_NUMBERS = [num.strip() for num in DEBUG_NUMBERS_STR.split(',') if num.strip()]
 
+###############################################################################
+# Webhook Queue Settings ---------------------------------------------------- #
+###############################################################################
+# ElevenLabs webhooks are stored in SQLite and acknowledged immediately, then
+# processed by a background worker with retries and dead-lettering.
+
+# Run the worker thread inside the web server process (disable to run
+# `manage.py process_webhook_queue` as a separate process instead, which
+# needs a shared CALLS_CACHE_BACKEND so new calls invalidate the web
+# server's calls list cache; the command refuses to run otherwise)
+WEBHOOK_QUEUE_INLINE_WORKER = os.getenv('WEBHOOK_QUEUE_INLINE_WORKER', 'True').lower() == 'true'
+WEBHOOK_QUEUE_POLL_INTERVAL = float(os.getenv('WEBHOOK_QUEUE_POLL_INTERVAL', '1'))
+# Jobs processed concurrently per worker, so bursts share Firestore write batches
+WEBHOOK_QUEUE_CONCURRENCY = int(os.getenv('WEBHOOK_QUEUE_CONCURRENCY', '10'))
+WEBHOOK_QUEUE_MAX_ATTEMPTS = int(os.getenv('WEBHOOK_QUEUE_MAX_ATTEMPTS', '5'))
+WEBHOOK_QUEUE_RETRY_BACKOFF = float(os.getenv('WEBHOOK_QUEUE_RETRY_BACKOFF', '30'))
+# Jobs claimed longer ago than this are assumed lost with a crashed worker
+WEBHOOK_QUEUE_VISIBILITY_TIMEOUT = float(os.getenv('WEBHOOK_QUEUE_VISIBILITY_TIMEOUT', '300'))
+WEBHOOK_QUEUE_RETENTION_DAYS = int(os.getenv('WEBHOOK_QUEUE_RETENTION_DAYS', '7'))
+# Recently accepted conversation IDs remembered per process to drop retries
+WEBHOOK_DEDUP_CACHE_SIZE = int(os.getenv('WEBHOOK_DEDUP_CACHE_SIZE', '10000'))
+
+# Call events (/calls/events/): new and updated calls are recorded in the
+# database and pushed to subscribers over Server-Sent Events. Each process
+# reads events written by other processes every CALL_EVENTS_POLL_INTERVAL
+# seconds and keeps the latest CALL_EVENTS_BUFFER_SIZE in memory; clients
+# resuming from further back are replayed from the database, for up to
+# CALL_EVENTS_RETENTION_HOURS
+CALL_EVENTS_POLL_INTERVAL = float(os.getenv('CALL_EVENTS_POLL_INTERVAL', '1'))
+CALL_EVENTS_HEARTBEAT_INTERVAL = float(os.getenv('CALL_EVENTS_HEARTBEAT_INTERVAL', '15'))
+CALL_EVENTS_BUFFER_SIZE = int(os.getenv('CALL_EVENTS_BUFFER_SIZE', '1000'))
+CALL_EVENTS_RETENTION_HOURS = int(os.getenv('CALL_EVENTS_RETENTION_HOURS', '24'))
+
+###############################################################################
+# Cache Settings ------------------------------------------------------------ #
+###############################################################################
+# In-process by default; point CALLS_CACHE_BACKEND/CALLS_CACHE_LOCATION at a
+# shared backend (e.g. django.core.cache.backends.redis.RedisCache) to share
+# the calls list cache between workers. A separate webhook queue worker
+# process requires a shared backend. MAX_ENTRIES bounds the in-process
+# cache; Redis relies on its own maxmemory eviction policy instead.
+
+CALLS_CACHE_BACKEND = os.getenv('CALLS_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+CALLS_CACHE_TTL = int(os.getenv('CALLS_CACHE_TTL', '60'))
+CALLS_CACHE_MAX_ENTRIES = int(os.getenv('CALLS_CACHE_MAX_ENTRIES', '500'))
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'calls': {
+        'BACKEND': CALLS_CACHE_BACKEND,
+        'LOCATION': os.getenv('CALLS_CACHE_LOCATION', 'calls'),
+        'TIMEOUT': CALLS_CACHE_TTL,
+        'OPTIONS': {} if 'redis' in CALLS_CACHE_BACKEND else {
+            'MAX_ENTRIES': CALLS_CACHE_MAX_ENTRIES,
+        },
+    },
+}
+
+###############################################################################
+# Response Compression ------------------------------------------------------ #
+###############################################################################
+# JSON and schema responses are compressed with the best of
+# COMPRESSION_ENCODINGS the client accepts (br and zstd need the `brotli` and
+# `zstandard` packages). Compressed bodies are cached by content hash in
+# COMPRESSION_CACHE_ALIAS so repeated responses aren't compressed again. That
+# is its own in-process cache by default, bounded by
+# COMPRESSION_CACHE_MAX_ENTRIES, so large compressed bodies (up to one per
+# encoding) can't evict calls list pages from the 'calls' cache.
+
+COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'True').lower() == 'true'
+COMPRESSION_ENCODINGS = [
+    e.strip() for e in os.getenv('COMPRESSION_ENCODINGS', 'zstd,br,gzip').split(',') if e.strip()
+]
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_CACHE_VARIANTS = os.getenv('COMPRESSION_CACHE_VARIANTS', 'True').lower() == 'true'
+COMPRESSION_CACHE_ALIAS = os.getenv('COMPRESSION_CACHE_ALIAS', 'compression')
+COMPRESSION_CACHE_TTL = int(os.getenv('COMPRESSION_CACHE_TTL', '300'))
+COMPRESSION_CACHE_MAX_ENTRIES = int(os.getenv('COMPRESSION_CACHE_MAX_ENTRIES', '300'))
+
+CACHES['compression'] = {
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    'LOCATION': 'compression',
+    'TIMEOUT': COMPRESSION_CACHE_TTL,
+    'OPTIONS': {
+        'MAX_ENTRIES': COMPRESSION_CACHE_MAX_ENTRIES,
+    },
+}
+
 ###############################################################################
 # DRF Settings -------------------------------------------------------------- #
 ###############################################################################
@@ -155,7 +251,12 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 20,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'api.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ),
 }
 
@@ -192,6 +293,32 @@ SPECTACULAR_SETTINGS = {
 FIREBASE_CRED_PATH = os.getenv('FIREBASE_CRED_PATH')
 FIREBASE_PROJECT_ID = os.getenv('FIREBASE_PROJECT_ID')
 
+# Where calls are stored: firestore, sqlite (the default database) or memory
+# (process-local, for benchmarks and local development)
+CALLS_REPOSITORY = os.getenv('CALLS_REPOSITORY', 'firestore')
+
+# Read replica of the Firestore calls collection: sqlite or memory mirrors it
+# with a snapshot listener and serves list/detail reads locally (empty: off).
+# The listener is checked every CALLS_REPLICA_CHECK_INTERVAL seconds and
+# restarted, with a full resync, if its stream has stopped. The sqlite mirror
+# is shared by every process: one holds its lease and keeps it current, the
+# rest read it while the holder reports it in sync
+CALLS_REPLICA = os.getenv('CALLS_REPLICA', '')
+CALLS_REPLICA_CHECK_INTERVAL = float(os.getenv('CALLS_REPLICA_CHECK_INTERVAL', '5'))
+
+# Write coalescing: call documents are committed in one batch per window,
+# of at most FIRESTORE_BATCH_MAX_SIZE writes (Firestore allows 500)
+FIRESTORE_BATCH_WINDOW_MS = float(os.getenv('FIRESTORE_BATCH_WINDOW_MS', '5'))
+FIRESTORE_BATCH_MAX_SIZE = min(int(os.getenv('FIRESTORE_BATCH_MAX_SIZE', '100')), 500)
+
+# Transcript storage: turns are zlib compressed once their JSON exceeds
+# TRANSCRIPT_COMPRESS_THRESHOLD bytes. With TRANSCRIPT_SUBCOLLECTION_ENABLED,
+# transcripts larger than TRANSCRIPT_SUBCOLLECTION_MIN_BYTES are stored in a
+# `transcript` subcollection so the call document itself stays small.
+TRANSCRIPT_COMPRESS_THRESHOLD = int(os.getenv('TRANSCRIPT_COMPRESS_THRESHOLD', '2048'))
+TRANSCRIPT_SUBCOLLECTION_ENABLED = os.getenv('TRANSCRIPT_SUBCOLLECTION_ENABLED', 'False').lower() == 'true'
+TRANSCRIPT_SUBCOLLECTION_MIN_BYTES = int(os.getenv('TRANSCRIPT_SUBCOLLECTION_MIN_BYTES', '16384'))
+
 ###############################################################################
 # Elevenlabs Configuration -------------------------------------------------- #
 ###############################################################################
@@ -199,6 +326,29 @@ FIREBASE_PROJECT_ID = os.getenv('FIREBASE_PROJECT_ID')
 ELEVENLABS_BASE_URL = os.getenv('ELEVENLABS_BASE_URL', 'https://api.elevenlabs.io')
 ELEVENLABS_API_KEY = os.getenv('ELEVENLABS_API_KEY')
 
+# Upstream connection pool (shared keep-alive connections per event loop)
+ELEVENLABS_CONNECT_TIMEOUT = float(os.getenv('ELEVENLABS_CONNECT_TIMEOUT', '5'))
+ELEVENLABS_READ_TIMEOUT = float(os.getenv('ELEVENLABS_READ_TIMEOUT', '30'))
+ELEVENLABS_MAX_CONNECTIONS = int(os.getenv('ELEVENLABS_MAX_CONNECTIONS', '50'))
+ELEVENLABS_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('ELEVENLABS_MAX_KEEPALIVE_CONNECTIONS', '10'))
+ELEVENLABS_KEEPALIVE_EXPIRY = float(os.getenv('ELEVENLABS_KEEPALIVE_EXPIRY', '60'))
+
+# Retries for idempotent GETs (connection errors, timeouts, 429 and 5xx)
+ELEVENLABS_MAX_RETRIES = int(os.getenv('ELEVENLABS_MAX_RETRIES', '2'))
+ELEVENLABS_RETRY_BACKOFF = float(os.getenv('ELEVENLABS_RETRY_BACKOFF', '0.5'))
+
+# On-disk cache of call recordings (they never change once a call has ended)
+RECORDING_CACHE_ENABLED = os.getenv('RECORDING_CACHE_ENABLED', 'True').lower() == 'true'
+RECORDING_CACHE_DIR = os.getenv('RECORDING_CACHE_DIR', os.path.join(BASE_DIR, 'recording_cache'))
+RECORDING_CACHE_MAX_BYTES = int(os.getenv('RECORDING_CACHE_MAX_BYTES', str(2 * 1024 ** 3)))
+
+# Opt-in background download of recordings as soon as the webhook saves a call
+RECORDING_PREFETCH_ENABLED = os.getenv('RECORDING_PREFETCH_ENABLED', 'False').lower() == 'true'
+RECORDING_PREFETCH_CONCURRENCY = int(os.getenv('RECORDING_PREFETCH_CONCURRENCY', '2'))
+RECORDING_PREFETCH_DELAY = float(os.getenv('RECORDING_PREFETCH_DELAY', '5'))
+RECORDING_PREFETCH_RETRIES = int(os.getenv('RECORDING_PREFETCH_RETRIES', '3'))
+RECORDING_PREFETCH_BACKOFF = float(os.getenv('RECORDING_PREFETCH_BACKOFF', '10'))
+
 ###############################################################################
 # Google Configuration ------------------------------------------------------ #
 ###############################################################################
@@ -207,6 +357,50 @@ GOOGLE_APP_PASSWORD = os.getenv('GOOGLE_APP_PASSWORD')
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')
 
 EMAIL_SUMMARY_RECIPIENT = os.getenv('EMAIL_SUMMARY_RECIPIENT')
+# Comma-separated list of recipients for call summary emails
+EMAIL_SUMMARY_RECIPIENTS = [r.strip() for r in (EMAIL_SUMMARY_RECIPIENT or '').split(',') if r.strip()]
+
+# Display time zone for call emails. Recipients can get their own as
+# comma-separated `address=Zone` pairs, e.g. "owner@x.com=America/Los_Angeles"
+EMAIL_DEFAULT_TIMEZONE = os.getenv('EMAIL_DEFAULT_TIMEZONE', 'America/New_York')
+EMAIL_RECIPIENT_TIMEZONES = {
+    address.strip().lower(): zone.strip()
+    for address, _, zone in (pair.partition('=') for pair in os.getenv('EMAIL_RECIPIENT_TIMEZONES', '').split(','))
+    if address.strip() and zone.strip()
+}
+
+# Transcripts longer than this are cut short in emails, with a link to the
+# full call (0 to never cut). CALL_LINK_BASE_URL is the public URL of this API.
+EMAIL_TRANSCRIPT_MAX_CHARS = int(os.getenv('EMAIL_TRANSCRIPT_MAX_CHARS', '20000'))
+CALL_LINK_BASE_URL = os.getenv('CALL_LINK_BASE_URL', '')
+
+# SMTP server (override to point at a local stand-in such as aiosmtpd)
+EMAIL_HOST = os.getenv('EMAIL_HOST', 'smtp.gmail.com')
+EMAIL_PORT = int(os.getenv('EMAIL_PORT', '587'))
+EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'True').lower() == 'true'
+EMAIL_TIMEOUT = float(os.getenv('EMAIL_TIMEOUT', '30'))
+
+# SMTP connection pool
+EMAIL_POOL_SIZE = int(os.getenv('EMAIL_POOL_SIZE', '2'))
+# Idle connections older than this are checked with NOOP before reuse
+EMAIL_NOOP_INTERVAL = float(os.getenv('EMAIL_NOOP_INTERVAL', '30'))
+
+# Outbox for messages that failed to send
+EMAIL_OUTBOX_POLL_INTERVAL = float(os.getenv('EMAIL_OUTBOX_POLL_INTERVAL', '30'))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', '8'))
+EMAIL_OUTBOX_RETRY_BACKOFF = float(os.getenv('EMAIL_OUTBOX_RETRY_BACKOFF', '60'))
+
+# Digest mode: batch call summaries into one email per recipient, sent when
+# the oldest pending call is EMAIL_DIGEST_WINDOW_SECONDS old or
+# EMAIL_DIGEST_MAX_CALLS calls are pending. Calls whose summary or transcript
+# mention an urgent keyword are still emailed right away.
+EMAIL_DIGEST_ENABLED = os.getenv('EMAIL_DIGEST_ENABLED', 'False').lower() == 'true'
+EMAIL_DIGEST_WINDOW_SECONDS = int(os.getenv('EMAIL_DIGEST_WINDOW_SECONDS', '3600'))
+EMAIL_DIGEST_MAX_CALLS = int(os.getenv('EMAIL_DIGEST_MAX_CALLS', '20'))
+EMAIL_DIGEST_URGENT_KEYWORDS = [
+    k.strip().lower() for k in os.getenv('EMAIL_DIGEST_URGENT_KEYWORDS', 'urgent,emergency,complication').split(',')
+    if k.strip()
+]
 
 ###############################################################################
 # CORS ---------------------------------------------------------------------- #
@@ -22,6 +22,8 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from api import metrics
+
 
 class HealthCheckView(APIView):
     """API health check endpoint"""
@@ -54,8 +56,39 @@ class HealthCheckView(APIView):
         return Response({"status": "healthy"}, status=status.HTTP_200_OK)
 
 
+class MetricsView(APIView):
+    """In-process API metrics endpoint"""
+
+    @extend_schema(
+        tags=['Test'],
+        summary='Metrics',
+        description='Counters, gauges and latency percentiles (milliseconds) collected by this worker process',
+        responses={
+            200: {
+                'description': 'Current metric values',
+                'content': {
+                    'application/json': {
+                        'schema': {
+                            'type': 'object',
+                            'properties': {
+                                'counters': {'type': 'object'},
+                                'gauges': {'type': 'object'},
+                                'latencies': {'type': 'object'}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    )
+    def get(self, request):
+        """Get current metric values"""
+        return Response(metrics.snapshot(), status=status.HTTP_200_OK)
+
+
 urlpatterns = [
     path('', HealthCheckView.as_view(), name='health-check'),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
     path('admin/', admin.site.urls),
     path('calls/', include('api.calls.urls')),
 